@@ -53,7 +53,7 @@ from .element import (
     VectorField,
     WindBarbs,
 )
-from .util import from_xarray
+from .util import from_parquet, from_xarray
 
 __all__ = (
     "RGB",
@@ -101,6 +101,7 @@ __all__ = (
     "dim",
     "extension",
     "feature",
+    "from_parquet",
     "from_xarray",
     "help",
     "operation", # Lazy modules
@@ -1,5 +1,11 @@
 from .geom_dict import GeomDictInterface
 from .geopandas import GeoPandasInterface
+from .geopandas_dask import DaskGeoPandasInterface
 from .iris import CubeInterface
 
-__all__ = ("CubeInterface", "GeoPandasInterface", "GeomDictInterface")
+__all__ = (
+    "CubeInterface",
+    "DaskGeoPandasInterface",
+    "GeoPandasInterface",
+    "GeomDictInterface",
+)
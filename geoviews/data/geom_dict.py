@@ -2,13 +2,40 @@ import sys
 from collections import OrderedDict
 
 import numpy as np
-from holoviews.core.data import DictInterface, Interface, MultiInterface
+import shapely
+from holoviews.core.data import Dataset, DictInterface, Interface, MultiInterface
 from holoviews.core.data.interface import DataError
 from holoviews.core.data.spatialpandas import to_geom_dict
 from holoviews.core.dimension import dimension_name
-from holoviews.core.util import isscalar
-
-from ..util import asarray, geom_length, geom_to_array, geom_types
+from holoviews.core.util import isscalar, unique_array
+
+from ..util import (
+    SHAPELY_GE_2_0_0,
+    asarray,
+    geom_types,
+    geoms_length,
+    geoms_to_array,
+    geoms_to_holes,
+    sample_geoms,
+)
+
+
+def _nearest_vertices(coords, points):
+    """Returns the index of the vertex closest to each of the points,
+    ignoring NaN separators.
+    """
+    valid = np.flatnonzero(np.isfinite(coords).all(axis=1))
+    if not len(valid):
+        return np.zeros(0, dtype=int)
+    coords = coords[valid]
+    if SHAPELY_GE_2_0_0:
+        tree = shapely.STRtree(shapely.points(coords))
+        sample_idx, tree_idx = tree.query_nearest(shapely.points(points), all_matches=False)
+        nearest = np.empty(len(points), dtype=int)
+        nearest[sample_idx] = tree_idx
+    else:
+        nearest = np.array([((coords - p)**2).sum(axis=1).argmin() for p in points], dtype=int)
+    return valid[nearest]
 
 
 class GeomDictInterface(DictInterface):
@@ -153,10 +180,8 @@ class GeomDictInterface(DictInterface):
     def holes(cls, dataset):
         from shapely.geometry import MultiPolygon, Polygon
         geom = dataset.data['geometry']
-        if isinstance(geom, Polygon):
-            return [[[geom_to_array(h) for h in geom.interiors]]]
-        elif isinstance(geom, MultiPolygon):
-            return [[[geom_to_array(h) for h in g.interiors] for g in geom.geoms]]
+        if isinstance(geom, (Polygon, MultiPolygon)):
+            return geoms_to_holes([geom])
         return []
 
     @classmethod
@@ -191,7 +216,7 @@ class GeomDictInterface(DictInterface):
 
     @classmethod
     def length(cls, dataset):
-        return geom_length(dataset.data['geometry'])
+        return int(geoms_length([dataset.data['geometry']])[0])
 
     @classmethod
     def geom_dims(cls, dataset):
@@ -206,7 +231,7 @@ class GeomDictInterface(DictInterface):
             g = dataset.data['geometry']
             if not g:
                 return np.array([])
-            array = geom_to_array(g)
+            array, _ = geoms_to_array([g])
             idx = geom_dims.index(d)
             return array[:, idx]
         return DictInterface.values(dataset, dim, expanded, flat)
@@ -294,32 +319,89 @@ class GeomDictInterface(DictInterface):
 
     @classmethod
     def sample(cls, dataset, samples=None):
+        """Samples the geometry at the supplied coordinates returning
+        the samples which intersect the geometry along with the values
+        of the remaining dimensions at the closest vertex.
+        """
         if samples is None:
             samples = []
-        raise NotImplementedError('sampling operation not implemented for geometries.')
+        xdim, ydim = cls.geom_dims(dataset)
+        points = np.array([s[:2] for s in samples], dtype=float).reshape(-1, 2)
+        sample_idx, _ = sample_geoms([dataset.data['geometry']], points[:, 0], points[:, 1])
+        points = points[sample_idx]
+        sampled = {xdim.name: points[:, 0], ydim.name: points[:, 1]}
+        vertex_idx = None
+        for d in dataset.dimensions():
+            if d in (xdim, ydim):
+                continue
+            vals = dataset.data[d.name]
+            if isscalar(vals):
+                sampled[d.name] = np.full(len(points), vals)
+                continue
+            if vertex_idx is None:
+                coords = np.column_stack([cls.values(dataset, xdim), cls.values(dataset, ydim)])
+                vertex_idx = _nearest_vertices(coords.astype(float), points)
+            sampled[d.name] = cls.values(dataset, d)[vertex_idx]
+        return sampled
 
     @classmethod
     def aggregate(cls, dataset, kdims, function, **kwargs):
-        raise NotImplementedError('aggregate operation not implemented for geometries.')
+        geom_dims = cls.geom_dims(dataset)
+        kdims = [dataset.get_dimension(d, strict=True) for d in kdims]
+        if any(d in geom_dims for d in kdims):
+            raise DataError("GeomDictInterface does not allow aggregating "
+                            "by geometry dimension.", cls)
+        columns = {d.name: cls.values(dataset, d) for d in kdims + dataset.vdims}
+        tabular = Dataset(columns, kdims=kdims, vdims=dataset.vdims, datatype=['dictionary'])
+        return DictInterface.aggregate(tabular, kdims, function, **kwargs)
 
     @classmethod
     def concat(cls, datasets, dimensions, vdims):
-        raise NotImplementedError('concat operation not implemented for geometries.')
+        """Concatenates the geometries into a single multi-part
+        geometry. Concatenation is only supported if the key and
+        non-geometry values are constant across the datasets.
+        """
+        from shapely.geometry import MultiLineString, MultiPoint, MultiPolygon
+
+        template = datasets[0][1]
+        geom_dims = cls.geom_dims(template)
+        columns = {}
+        for i, d in enumerate(dimensions):
+            keys = unique_array([key[i] for key, _ in datasets])
+            if len(keys) > 1:
+                raise DataError("GeomDictInterface can only concatenate geometries "
+                                f"with a constant {d.name!r} value.", cls)
+            columns[d.name] = keys[0]
+        for d in template.dimensions():
+            if d in geom_dims:
+                continue
+            vals = [ds.data[d.name] for _, ds in datasets]
+            if not all(isscalar(v) for v in vals) or len(unique_array(vals)) > 1:
+                raise DataError("GeomDictInterface can only concatenate geometries "
+                                f"with a constant {d.name!r} value.", cls)
+            columns[d.name] = vals[0]
+
+        geoms = [ds.data['geometry'] for _, ds in datasets]
+        parts = [p for g in geoms for p in (g.geoms if hasattr(g, 'geoms') else [g])]
+        geom_type = cls.geom_type(template)
+        if len(parts) == 1:
+            geom = parts[0]
+        elif geom_type == 'Polygon':
+            geom = MultiPolygon(parts)
+        elif geom_type in ('Line', 'Ring'):
+            geom = MultiLineString(parts)
+        else:
+            geom = MultiPoint(parts)
+        return dict(columns, geometry=geom)
 
 
-def geom_from_dict(geom, xdim, ydim, single_type, multi_type):
-    from shapely.geometry import (
-        LineString,
-        MultiLineString,
-        MultiPoint,
-        MultiPolygon,
-        Point,
-        Polygon,
-    )
+def _geom_dict_array(geom, xdim, ydim):
+    """Returns the coordinates in a geometry dictionary as an Nx2 array.
+    """
     if (xdim, ydim) in geom:
-        xs, ys = asarray(geom.pop((xdim, ydim))).T
+        xs, ys = asarray(geom[(xdim, ydim)]).T
     elif xdim in geom and ydim in geom:
-        xs, ys = geom.pop(xdim), geom.pop(ydim)
+        xs, ys = geom[xdim], geom[ydim]
     else:
         raise ValueError('Could not find geometry dimensions')
 
@@ -330,7 +412,25 @@ def geom_from_dict(geom, xdim, ydim, single_type, multi_type):
         xs = np.full_like(ys, xs)
     elif yscalar:
         ys = np.full_like(xs, ys)
-    geom_array = np.column_stack([xs, ys])
+    return np.column_stack([xs, ys])
+
+
+def geom_from_dict(geom, xdim, ydim, single_type, multi_type):
+    from shapely.geometry import (
+        LineString,
+        MultiLineString,
+        MultiPoint,
+        MultiPolygon,
+        Point,
+        Polygon,
+    )
+    geom_array = _geom_dict_array(geom, xdim, ydim)
+    if (xdim, ydim) in geom:
+        geom.pop((xdim, ydim))
+    else:
+        geom.pop(xdim)
+        geom.pop(ydim)
+
     splits = np.where(np.isnan(geom_array[:, :2].astype('float')).sum(axis=1))[0]
     if len(splits):
         split_geoms = [g[:-1] if i == (len(splits)-1) else g
@@ -363,5 +463,70 @@ def geom_from_dict(geom, xdim, ydim, single_type, multi_type):
     return geom
 
 
+def geoms_from_dicts(geom_dicts, xdim, ydim, single_type, multi_type):
+    """Converts a list of geometry dictionaries to an array of shapely
+    geometries, equivalent to calling ``geom_from_dict`` on each.
+
+    The coordinates of all dictionaries are concatenated and the
+    geometries built with the vectorized shapely constructors. Only
+    dictionaries declaring holes or without coordinates are converted
+    one at a time. Unlike ``geom_from_dict`` the dictionaries are not
+    modified.
+    """
+    from shapely.geometry import LineString, Point, Polygon
+
+    geoms = np.empty(len(geom_dicts), dtype=object)
+    arrays, bulk = [], []
+    vectorized = SHAPELY_GE_2_0_0 and single_type in (Point, LineString, Polygon)
+    for i, geom_dict in enumerate(geom_dicts):
+        holes = geom_dict.get('holes')
+        if vectorized and (holes is None or not any(len(hs) for hs in holes)):
+            array = _geom_dict_array(geom_dict, xdim, ydim).astype('float64')
+            nan = np.isnan(array).any(axis=1)
+            if not nan.all():
+                arrays.append(array)
+                bulk.append(i)
+                continue
+        geoms[i] = geom_from_dict(dict(geom_dict), xdim, ydim, single_type, multi_type)
+    if not bulk:
+        return geoms
+
+    coords = np.concatenate(arrays)
+    index = np.repeat(np.arange(len(bulk)), [len(a) for a in arrays])
+    nan = np.isnan(coords).any(axis=1)
+    multi = np.bincount(index, weights=nan, minlength=len(bulk)) > 0
+
+    # Assign each coordinate to a part, starting a new part at the
+    # start of each geometry and after each NaN separator
+    start = np.ones(len(coords), dtype=bool)
+    start[1:] = nan[:-1] | (index[1:] != index[:-1])
+    part = np.cumsum(start)
+    coords, part, index = coords[~nan], part[~nan], index[~nan]
+    first = np.ones(len(part), dtype=bool)
+    first[1:] = part[1:] != part[:-1]
+    part = np.cumsum(first) - 1
+    part_index = index[first]
+
+    if single_type is Point:
+        parts, part_index = shapely.points(coords), index
+        multi |= np.bincount(index, minlength=len(bulk)) > 1
+        multi_parts = shapely.multipoints
+    elif single_type is LineString:
+        parts = shapely.linestrings(coords, indices=part)
+        multi_parts = shapely.multilinestrings
+    else:
+        parts = shapely.polygons(shapely.linearrings(coords, indices=part))
+        multi_parts = shapely.multipolygons
+
+    bulk = np.asarray(bulk)
+    single = ~multi[part_index]
+    geoms[bulk[part_index[single]]] = parts[single]
+    if multi.any():
+        multi_index = part_index[~single]
+        unique, indices = np.unique(multi_index, return_inverse=True)
+        geoms[bulk[unique]] = multi_parts(parts[~single], indices=indices)
+    return geoms
+
+
 MultiInterface.subtypes.insert(0, 'geom_dictionary')
 Interface.register(GeomDictInterface)
@@ -1,9 +1,10 @@
 import sys
 import warnings
-from collections import defaultdict
+from itertools import pairwise
 
 import numpy as np
 import pandas as pd
+import shapely
 from holoviews.core.data import (
     Dataset,
     Interface,
@@ -17,8 +18,16 @@ from holoviews.core.dimension import dimension_name
 from holoviews.core.util import isscalar, unique_array, unique_iterator
 from holoviews.element import Path
 
-from ..util import asarray, geom_length, geom_to_array, geom_types
-from .geom_dict import geom_from_dict
+from ..util import (
+    SHAPELY_GE_2_0_0,
+    asarray,
+    geom_types,
+    geoms_length,
+    geoms_to_array,
+    geoms_to_holes,
+    sample_geoms,
+)
+from .geom_dict import geoms_from_dicts
 
 
 class GeoPandasInterface(PandasAPI, MultiInterface):
@@ -130,6 +139,9 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
     def has_holes(cls, dataset):
         from shapely.geometry import MultiPolygon, Polygon
         col = cls.geo_column(dataset.data)
+        if SHAPELY_GE_2_0_0:
+            parts = shapely.get_parts(dataset.data[col].values)
+            return bool(shapely.get_num_interior_rings(parts).max(initial=0) > 0)
         for geom in dataset.data[col]:
             if isinstance(geom, Polygon) and geom.interiors:
                 return True
@@ -141,17 +153,8 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
 
     @classmethod
     def holes(cls, dataset):
-        from shapely.geometry import MultiPolygon, Polygon
-        holes = []
         col = cls.geo_column(dataset.data)
-        for geom in dataset.data[col]:
-            if isinstance(geom, Polygon) and geom.interiors:
-                holes.append([[geom_to_array(h) for h in geom.interiors]])
-            elif isinstance(geom, MultiPolygon):
-                holes += [[[geom_to_array(h) for h in g.interiors] for g in geom.geoms]]
-            else:
-                holes.append([[]])
-        return holes
+        return geoms_to_holes(dataset.data[col].values)
 
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
@@ -159,7 +162,7 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
             df = cls.shape_mask(dataset, selection)
         else:
             df = dataset.data
-        if not selection:
+        if not selection and selection_mask is None:
             return df
         elif selection_mask is None:
             selection_mask = cls.select_mask(dataset, selection)
@@ -292,8 +295,36 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
                 return np.nan, np.nan
 
     @classmethod
-    def aggregate(cls, columns, dimensions, function, **kwargs):
-        raise NotImplementedError
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        """Aggregates the non-geometry columns grouped by the supplied
+        dimensions. If the geometry dimensions are among the grouping
+        dimensions the geometries of each group are dissolved into one.
+        """
+        geom_dims = cls.geom_dims(dataset)
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        by = [d.name for d in dimensions if d not in geom_dims]
+        if len(by) == len(dimensions):
+            geom_col = cls.geo_column(dataset.data)
+            frame = pd.DataFrame(dataset.data.drop(columns=geom_col))
+            tabular = Dataset(frame, kdims=by, vdims=dataset.vdims, datatype=['dataframe'])
+            return PandasInterface.aggregate(tabular, by, function, **kwargs)
+        elif len(dimensions) - len(by) != len(geom_dims):
+            raise DataError("GeoPandasInterface can only aggregate by both "
+                            "geometry dimensions at once.", cls)
+        if function in (np.std, np.var):
+            fn = lambda x: function(x, ddof=0)
+        else:
+            fn = function
+        vdims = [vd.name for vd in dataset.vdims if vd.name in dataset.data]
+        frame = dataset.data[[cls.geo_column(dataset.data)] + by + vdims]
+        dissolved = frame.dissolve(by=by or None, aggfunc=fn, **kwargs)
+        dissolved = dissolved.reset_index(drop=not by)
+        dropped = [vd for vd in dataset.vdims if vd.name not in dissolved]
+        return dissolved, dropped
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        return PandasInterface.unpack_scalar(dataset, data)
 
     @classmethod
     def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
@@ -319,10 +350,24 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
         return dataset.data
 
     @classmethod
-    def sample(cls, columns, samples=None):
+    def sample(cls, dataset, samples=None):
+        """Samples the geometries at the supplied coordinates returning
+        a row for each geometry intersecting a sample, containing the
+        sample coordinates and the values of the other columns.
+        """
         if samples is None:
             samples = []
-        raise NotImplementedError
+        xdim, ydim = cls.geom_dims(dataset)
+        geom_col = cls.geo_column(dataset.data)
+        points = np.array([s[:2] for s in samples], dtype=float).reshape(-1, 2)
+        sample_idx, geom_idx = sample_geoms(
+            dataset.data[geom_col].values, points[:, 0], points[:, 1]
+        )
+        sampled = {xdim.name: points[sample_idx, 0], ydim.name: points[sample_idx, 1]}
+        for d in dataset.dimensions():
+            if d.name in dataset.data and d.name != geom_col:
+                sampled[d.name] = dataset.data[d.name].values[geom_idx]
+        return sampled
 
 
     @classmethod
@@ -344,7 +389,7 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
         geom_type = cls.geom_type(dataset)
         if geom_type != 'Point':
             return len(dataset.data)
-        return sum([geom_length(g) for g in dataset.data.geometry])
+        return int(geoms_length(dataset.data.geometry.values).sum())
 
     @classmethod
     def nonzero(cls, dataset):
@@ -370,67 +415,28 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
         if isgeom and keep_index:
             return data[col]
         elif not isgeom:
-            return get_value_array(data, dimension, expanded, keep_index,
-                                   geom_col, is_points, geom_length)
             column = data[dimension.name]
-            if not expanded or keep_index or not len(data):
-                return column if keep_index else column.values
-            else:
-                arrays = []
-                for i, geom in enumerate(data[col]):
-                    length = geom_length(geom)
-                    arrays.append(np.full(length, column.iloc[i]))
-                return np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
-
-        # There's special handling of the geometry column in the event
-        # that it's not name `geometry` in the geodataframe. Since we
-        # serialize each row to a geom_dictionary that requires a
-        # `geometry` key.
-        dict_data = data.iloc[0].to_dict()
-        default_geo_name = new_geo_col_name= 'geometry'
-        geom_col = data.geometry.name
-        if geom_col != default_geo_name:
-            if default_geo_name in dict_data:
-                # When there's a 'geometry' column that is not THE geometry column,
-                # we create a temporary name that will be used to 1) create a new
-                # dimension in the dataset and 2) add the data of this dimension
-                # in the dict used to serialize each row of the geodataframe.
-                while new_geo_col_name in dict_data:
-                    new_geo_col_name += '_'
-
-        if new_geo_col_name != default_geo_name:
-            dict_data[new_geo_col_name] = dict_data.pop(default_geo_name)
-            dataset = dataset.redim(**{default_geo_name: new_geo_col_name})
-
-        dict_data['geometry'] = dict_data.pop(data.geometry.name)
-
-        ds = dataset.clone(dict_data, datatype=['geom_dictionary'])
-        values = []
-        geom_type = data.geom_type.iloc[0]
-        for _i, row in data.iterrows():
-            ds.data = row.to_dict()
-            if new_geo_col_name != default_geo_name:
-                ds.data[new_geo_col_name] = ds.data.pop(default_geo_name)
-            ds.data['geometry'] = ds.data.pop(data.geometry.name)
-            values.append(ds.interface.values(ds, dimension))
-            if 'Point' not in geom_type and expanded:
-                values.append([np.nan])
-        values = values if 'Point' in geom_type or not expanded else values[:-1]
-        if not values:
-            return np.array([])
-        elif not expanded:
-            array = np.empty(len(values), dtype=object)
-            array[:] = values
+            if (expanded and not keep_index and not is_points and
+                column.dtype.kind in 'biuf'):
+                lengths = geoms_length(data[col].values)
+                values = np.repeat(column.values.astype('float64'), lengths)
+                return np.insert(values, np.cumsum(lengths)[:-1], np.nan)
+            return get_value_array(data, dimension, expanded, keep_index,
+                                   geom_col, is_points, _geom_length)
+
+        coords, offsets = geoms_to_array(data[col].values)
+        values = coords[:, geom_dims.index(dimension)]
+        if not expanded:
+            array = np.empty(len(data), dtype=object)
+            array[:] = [values[s:e] for s, e in pairwise(offsets)]
             return array
-        elif len(values) == 1:
-            return values[0]
-        else:
-            return np.concatenate(values)
+        elif 'Point' in data.geom_type.iloc[0]:
+            return values
+        return np.insert(values, offsets[1:-1], np.nan)
 
     @classmethod
     def iloc(cls, dataset, index):
         from geopandas import GeoSeries
-        from shapely.geometry import MultiPoint
         rows, cols = index
         geom_dims = cls.geom_dims(dataset)
         geom_col = cls.geo_column(dataset.data)
@@ -459,37 +465,20 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
             return dataset.data.iloc[rows, cols]
 
         geoms = dataset.data[geom_col]
-        count = 0
-        new_geoms, indexes = [], []
-        for i, geom in enumerate(geoms):
-            length = len(geom.geoms)
-            if np.isscalar(rows):
-                if count <= rows < (count+length):
-                    new_geoms.append(geom.geoms[rows-count])
-                    indexes.append(i)
-                    break
-            elif isinstance(rows, slice):
-                if rows.start is not None and rows.start > (count+length):
-                    continue
-                elif rows.stop is not None and rows.stop < count:
-                    break
-                start = None if rows.start is None else max(rows.start - count, 0)
-                stop = None if rows.stop is None else min(rows.stop - count, length)
-                if rows.step is not None:
-                    dataset.param.warning(".iloc step slicing currently not supported for"
-                                          "the multi-tabular data format.")
-                indexes.append(i)
-                new_geoms.append(geom.geoms[start:stop])
-            elif isinstance(rows, (list, set)):
-                sub_rows = [(r-count) for r in rows if count <= r < (count+length)]
-                if not sub_rows:
-                    continue
-                indexes.append(i)
-                new_geoms.append(MultiPoint([geom.geoms[r] for r in sub_rows]))
-            count += length
+        if not SHAPELY_GE_2_0_0:
+            new_geoms, indexes = _iloc_multi_points(dataset, geoms, rows)
+        elif np.isscalar(rows):
+            new_geoms, indexes = _select_multi_points(geoms.values, [rows])
+        elif isinstance(rows, slice):
+            if rows.step is not None:
+                dataset.param.warning(".iloc step slicing currently not supported for"
+                                      "the multi-tabular data format.")
+            new_geoms, indexes = _slice_multi_points(geoms.values, rows)
+        else:
+            new_geoms, indexes = _select_multi_points(geoms.values, list(rows), multi=True)
 
         new = dataset.data.iloc[indexes].copy()
-        new[geom_col] = GeoSeries(new_geoms)
+        new[geom_col] = GeoSeries(new_geoms, index=new.index)
         return new
 
     @classmethod
@@ -500,19 +489,20 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
             return []
         row = dataset.data.iloc[0]
         col = cls.geo_column(dataset.data)
-        arr = geom_to_array(row[col])
+        coords, offsets = geoms_to_array(dataset.data[col].values)
+        arr = coords[offsets[0]:offsets[1]]
         d = {(xdim.name, ydim.name): arr}
         d.update({vd.name: row[vd.name] for vd in dataset.vdims})
         geom_type = cls.geom_type(dataset)
         ds = dataset.clone([d], datatype=['multitabular'])
-        for _i, row in dataset.data.iterrows():
+        for i, (_, row) in enumerate(dataset.data.iterrows()):
             if datatype == 'geom':
                 objs.append(row[col])
                 continue
             geom = row[col]
             gt = geom_type or get_geom_type(geom)
 
-            arr = geom_to_array(geom)
+            arr = coords[offsets[i]:offsets[i+1]]
             d = {xdim.name: arr[:, 0], ydim.name: arr[:, 1]}
             d.update({vd.name: row[vd.name] for vd in dataset.vdims})
             ds.data = [d]
@@ -531,6 +521,88 @@ class GeoPandasInterface(PandasAPI, MultiInterface):
         return objs
 
 
+def _multi_point_offsets(geoms):
+    """Returns the flat row offset at which each MultiPoint starts
+    along with the total number of points.
+    """
+    offsets = np.zeros(len(geoms)+1, dtype=int)
+    np.cumsum(shapely.get_num_geometries(geoms), out=offsets[1:])
+    return offsets
+
+
+def _select_multi_points(geoms, rows, multi=False):
+    """Selects flat point rows out of an array of MultiPoints, grouping
+    the selected points by the geometry they belong to.
+    """
+    offsets = _multi_point_offsets(geoms)
+    rows = np.asarray(rows, dtype=int)
+    rows = rows[(rows >= 0) & (rows < offsets[-1])]
+    index = np.searchsorted(offsets, rows, side='right') - 1
+    points = shapely.get_geometry(geoms[index], rows - offsets[index])
+    if not multi:
+        return points, index
+    order = np.argsort(index, kind='stable')
+    indexes, inverse = np.unique(index[order], return_inverse=True)
+    return shapely.multipoints(points[order], indices=inverse), indexes
+
+
+def _slice_multi_points(geoms, rows):
+    """Slices flat point rows out of an array of MultiPoints only
+    visiting the geometries which overlap with the slice.
+    """
+    offsets = _multi_point_offsets(geoms)
+    start, stop, _ = slice(rows.start, rows.stop).indices(offsets[-1])
+    first = np.searchsorted(offsets, start, side='right') - 1
+    last = np.searchsorted(offsets, stop, side='left')
+    new_geoms, indexes = [], []
+    for i in range(max(first, 0), last):
+        sub_start = max(start - offsets[i], 0)
+        sub_stop = min(stop - offsets[i], offsets[i+1] - offsets[i])
+        if sub_stop <= sub_start:
+            continue
+        indexes.append(i)
+        new_geoms.append(geoms[i].geoms[sub_start:sub_stop])
+    return new_geoms, indexes
+
+
+def _iloc_multi_points(dataset, geoms, rows):
+    """Fallback for MultiPoint iloc on shapely < 2."""
+    from shapely.geometry import MultiPoint
+    count = 0
+    new_geoms, indexes = [], []
+    for i, geom in enumerate(geoms):
+        length = len(geom.geoms)
+        if np.isscalar(rows):
+            if count <= rows < (count+length):
+                new_geoms.append(geom.geoms[rows-count])
+                indexes.append(i)
+                break
+        elif isinstance(rows, slice):
+            if rows.start is not None and rows.start > (count+length):
+                continue
+            elif rows.stop is not None and rows.stop < count:
+                break
+            start = None if rows.start is None else max(rows.start - count, 0)
+            stop = None if rows.stop is None else min(rows.stop - count, length)
+            if rows.step is not None:
+                dataset.param.warning(".iloc step slicing currently not supported for"
+                                      "the multi-tabular data format.")
+            indexes.append(i)
+            new_geoms.append(geom.geoms[start:stop])
+        elif isinstance(rows, (list, set)):
+            sub_rows = [(r-count) for r in rows if count <= r < (count+length)]
+            if not sub_rows:
+                continue
+            indexes.append(i)
+            new_geoms.append(MultiPoint([geom.geoms[r] for r in sub_rows]))
+        count += length
+    return new_geoms, indexes
+
+
+def _geom_length(geom):
+    return geoms_length([geom])[0]
+
+
 def get_geom_type(geom):
     """Returns the HoloViews geometry type.
 
@@ -608,17 +680,37 @@ def to_geopandas(data, xdim, ydim, columns=None, geom='point'):
     else:
         single_type, multi_type = Point, MultiPoint
 
-    converted = defaultdict(list)
-    for geom_dict in data:
-        geom_dict = dict(geom_dict)
-        geom = geom_from_dict(geom_dict, xdim, ydim, single_type, multi_type)
-        for c, v in geom_dict.items():
-            converted[c].append(v)
-        converted['geometry'].append(geom)
-
+    converted = {'geometry': geoms_from_dicts(data, xdim, ydim, single_type, multi_type)}
+    for c in columns:
+        converted[c] = [geom_dict.get(c, np.nan) for geom_dict in data]
     return GeoDataFrame(converted, columns=['geometry']+columns)
 
 
+def _columns_to_dict(data, kdims, vdims):
+    """Converts an array or DataFrame in a list based format directly
+    to a dictionary of columns, collapsing constant value columns to
+    scalars. Returns None if the data cannot be mapped onto the
+    dimensions without constructing an element.
+    """
+    from geopandas import GeoDataFrame
+
+    dims = [dimension_name(d) for d in kdims+vdims]
+    if isinstance(data, np.ndarray) and data.ndim == 2 and data.shape[1] == len(dims):
+        columns = {d: data[:, i] for i, d in enumerate(dims)}
+    elif (isinstance(data, pd.DataFrame) and not isinstance(data, GeoDataFrame)
+          and all(d in data.columns for d in dims)):
+        columns = {d: data[d].values for d in dims}
+    else:
+        return None
+    if not len(data):
+        return None
+    new_dict = {}
+    for d, vals in columns.items():
+        scalar = d not in dims[:2] and len(unique_array(vals)) == 1
+        new_dict[d] = vals[0] if scalar else vals
+    return new_dict
+
+
 def from_multi(eltype, data, kdims, vdims):
     """Converts list formats into geopandas.GeoDataFrame.
 
@@ -648,6 +740,10 @@ def from_multi(eltype, data, kdims, vdims):
             d = {k: v if isscalar(v) else asarray(v) for k, v in d.items()}
             new_data.append(d)
             continue
+        new_dict = _columns_to_dict(d, kdims, vdims)
+        if new_dict is not None:
+            new_data.append(new_dict)
+            continue
         new_el = eltype(d, kdims, vdims)
         if new_el.interface is GeoPandasInterface:
             types[-1] = GeoDataFrame
@@ -0,0 +1,275 @@
+import sys
+
+import numpy as np
+from holoviews.core.data import Dataset, Interface
+from holoviews.core.util import max_range
+from holoviews.element import Path
+
+from .geopandas import GeoPandasInterface
+
+
+class DaskGeoPandasInterface(GeoPandasInterface):
+    """Interface for dask-geopandas GeoDataFrames which keeps the data
+    out-of-core, reducing ranges and lengths column by column, applying
+    selections and projections partition by partition and using the
+    spatial partitions to skip partitions which do not intersect a
+    spatial selection. Operations such as groupby, aggregate and sort
+    compute the full frame.
+    """
+
+    base_interface = GeoPandasInterface
+
+    datatype = 'dask_geodataframe'
+
+    @classmethod
+    def loaded(cls):
+        return 'dask_geopandas' in sys.modules
+
+    @classmethod
+    def frame_type(cls):
+        from dask_geopandas import GeoDataFrame
+        return GeoDataFrame
+
+    @classmethod
+    def series_type(cls):
+        from dask_geopandas import GeoSeries
+        return GeoSeries
+
+    @classmethod
+    def applies(cls, obj):
+        if not cls.loaded():
+            return False
+        return isinstance(obj, (cls.frame_type(), cls.series_type()))
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        import dask_geopandas
+
+        if isinstance(data, cls.series_type()):
+            data = data.to_frame()
+        if not isinstance(data, cls.frame_type()):
+            data, dims, extra = super().init(eltype, data, kdims, vdims)
+            return dask_geopandas.from_geopandas(data, npartitions=1), dims, extra
+
+        if kdims is None:
+            kdims = eltype.kdims
+        if vdims is None:
+            geom_col = cls.geo_column(data)
+            vdims = [col for col in data.columns if col != geom_col]
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+    @classmethod
+    def partition_dataset(cls, dataset, data):
+        """Wraps a single in-memory partition using the base interface."""
+        return dataset.clone(data, datatype=[cls.base_interface.datatype])
+
+    @classmethod
+    def map_partitions(cls, dataset, function, *args):
+        """Applies a function to the dataset of each partition in
+        parallel returning the list of results.
+        """
+        import dask
+
+        def apply(data):
+            return function(cls.partition_dataset(dataset, data), *args)
+
+        tasks = [dask.delayed(apply)(part) for part in dataset.data.to_delayed()]
+        return list(dask.compute(*tasks))
+
+    @classmethod
+    def compute(cls, dataset):
+        return cls.partition_dataset(dataset, dataset.data.compute())
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dataset = dataset.clone(dataset.data._meta, datatype=[cls.base_interface.datatype])
+        cls.base_interface.validate(dataset, vdims)
+
+    @classmethod
+    def has_holes(cls, dataset):
+        return any(cls.map_partitions(dataset, lambda ds: ds.interface.has_holes(ds)))
+
+    @classmethod
+    def holes(cls, dataset):
+        holes = cls.map_partitions(dataset, lambda ds: ds.interface.holes(ds))
+        return [h for part in holes for h in part]
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        if selection_mask is not None:
+            return cls._select_mask(dataset, selection_mask)
+        elif not selection:
+            return dataset.data
+
+        import dask
+        import dask.dataframe as dd
+
+        data = dataset.data
+        geom_dims = cls.geom_dims(dataset)
+        geom_sel = [selection.get(d.name) for d in geom_dims]
+        if data.spatial_partitions is not None and any(s is not None for s in geom_sel):
+            data = cls._prune_partitions(dataset, *geom_sel)
+
+        def select_partition(df):
+            ds = cls.partition_dataset(dataset, df)
+            selected = cls.base_interface.select(ds, **dict(selection))
+            return selected if isinstance(selected, type(df)) else df.iloc[:0]
+
+        parts = [dask.delayed(select_partition)(part) for part in data.to_delayed()]
+        return dd.from_delayed(parts, meta=data._meta, verify_meta=False)
+
+    @classmethod
+    def _select_mask(cls, dataset, selection_mask):
+        """Applies a mask over all rows by splitting it along the
+        partition boundaries and masking each partition separately.
+        """
+        import dask
+        import dask.dataframe as dd
+
+        data = dataset.data
+        mask = np.asarray(selection_mask)
+        if mask.dtype.kind != 'b':
+            indexes, mask = mask, np.zeros(len(data), dtype=bool)
+            mask[indexes] = True
+        lengths = data.map_partitions(len).compute()
+        masks = np.split(mask, np.cumsum(lengths)[:-1])
+        parts = [dask.delayed(lambda df, m: df.iloc[m])(part, m)
+                 for part, m in zip(data.to_delayed(), masks)]
+        return dd.from_delayed(parts, meta=data._meta, verify_meta=False)
+
+    @classmethod
+    def _prune_partitions(cls, dataset, xsel, ysel):
+        """Drops the partitions whose spatial extent does not intersect
+        the selected x- and y-ranges.
+        """
+        import dask_geopandas
+        from shapely.geometry import box
+
+        data = dataset.data
+        x0, y0, x1, y1 = data.spatial_partitions.total_bounds
+        if isinstance(xsel, (slice, tuple)):
+            xs, xe = (xsel.start, xsel.stop) if isinstance(xsel, slice) else xsel
+            x0, x1 = x0 if xs is None else xs, x1 if xe is None else xe
+        if isinstance(ysel, (slice, tuple)):
+            ys, ye = (ysel.start, ysel.stop) if isinstance(ysel, slice) else ysel
+            y0, y1 = y0 if ys is None else ys, y1 if ye is None else ye
+        mask = np.asarray(data.spatial_partitions.intersects(box(x0, y0, x1, y1)))
+        if not mask.any():
+            return dask_geopandas.from_geopandas(data._meta, npartitions=1)
+        return data.partitions[np.flatnonzero(mask).tolist()]
+
+    @classmethod
+    def isscalar(cls, dataset, dim, per_geom=False):
+        dim = dataset.get_dimension(dim)
+        if dim in cls.geom_dims(dataset):
+            return False
+        elif per_geom:
+            return all(cls.map_partitions(
+                dataset, lambda ds: ds.interface.isscalar(ds, dim, per_geom=True)
+            ))
+        return dataset.data[dim.name].nunique().compute() == 1
+
+    @classmethod
+    def range(cls, dataset, dim):
+        dim = dataset.get_dimension(dim)
+        geom_dims = cls.geom_dims(dataset)
+        if dim in geom_dims and dataset.data.spatial_partitions is not None:
+            # The bounds of the partition hulls match the data bounds
+            bounds = dataset.data.spatial_partitions.total_bounds
+            idx = geom_dims.index(dim)
+            return bounds[idx], bounds[idx+2]
+        elif dim in geom_dims:
+            ranges = cls.map_partitions(dataset, lambda ds: ds.interface.range(ds, dim))
+            return max_range([r for r in ranges if r is not None])
+
+        import dask
+
+        column = dataset.data[dim.name]
+        try:
+            return dask.compute(column.min(), column.max())
+        except TypeError:
+            return np.nan, np.nan
+
+    @classmethod
+    def length(cls, dataset):
+        if cls.geom_type(dataset) != 'Point':
+            return len(dataset.data)
+        return sum(cls.map_partitions(dataset, lambda ds: ds.interface.length(ds)))
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True, compute=True, keep_index=False):
+        dimension = dataset.get_dimension(dimension)
+        if keep_index:
+            isgeom = dimension in cls.geom_dims(dataset)
+            column = cls.geo_column(dataset.data) if isgeom else dimension.name
+            column = dataset.data[column]
+            return column.compute() if compute else column
+        elif dimension not in cls.geom_dims(dataset) and (
+                not expanded or cls.geom_type(dataset) == 'Point'):
+            # Non-geometry columns hold one value per row
+            column = dataset.data[dimension.name]
+            return column.compute().values if compute else column.values
+
+        def partition_values(ds):
+            if not len(ds.data):
+                return None
+            return ds.interface.values(ds, dimension, expanded, flat)
+
+        arrays = [arr for arr in cls.map_partitions(dataset, partition_values)
+                  if arr is not None]
+        if not arrays:
+            return cls.base_interface.values(
+                cls.partition_dataset(dataset, dataset.data._meta), dimension,
+                expanded, flat
+            )
+        elif expanded and cls.geom_type(dataset) != 'Point':
+            # Separate the paths of consecutive partitions
+            separator = np.array([np.nan])
+            arrays = [a for arr in arrays for a in (arr, separator)][:-1]
+        if all(arr.dtype.kind == 'O' for arr in arrays) and not expanded:
+            values = np.empty(sum(len(arr) for arr in arrays), dtype=object)
+            values[:] = [v for arr in arrays for v in arr]
+            return values
+        return np.concatenate(arrays)
+
+    @classmethod
+    def dframe(cls, dataset, dimensions):
+        if dimensions:
+            return dataset.data[dimensions].compute()
+        return dataset.data.compute()
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        return cls.base_interface.aggregate(cls.compute(dataset), dimensions, function, **kwargs)
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        return cls.base_interface.add_dimension(cls.compute(dataset), dimension, dim_pos, values, vdim)
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        return cls.base_interface.groupby(cls.compute(dataset), dimensions, container_type, group_type, **kwargs)
+
+    @classmethod
+    def sample(cls, dataset, samples=None):
+        return cls.base_interface.sample(cls.compute(dataset), samples)
+
+    @classmethod
+    def sort(cls, dataset, by=None, reverse=False):
+        return cls.base_interface.sort(cls.compute(dataset), by, reverse)
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        return cls.base_interface.iloc(cls.compute(dataset), index)
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        return cls.base_interface.split(cls.compute(dataset), start, end, datatype, **kwargs)
+
+
+Interface.register(DaskGeoPandasInterface)
+# Must take precedence over the plain dask interface
+_datatypes = Dataset.datatype
+_index = _datatypes.index('dask') if 'dask' in _datatypes else len(_datatypes)
+Dataset.datatype = _datatypes[:_index]+['dask_geodataframe']+_datatypes[_index:]
+Path.datatype = Path.datatype+['dask_geodataframe']
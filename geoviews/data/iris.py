@@ -1,5 +1,8 @@
 import datetime
+import inspect
 import sys
+import warnings
+import weakref
 from itertools import product
 
 import numpy as np
@@ -7,10 +10,14 @@ from holoviews.core import util
 from holoviews.core.data import Dataset
 from holoviews.core.data.grid import GridInterface
 from holoviews.core.data.interface import DataError, Interface
+from holoviews.core.data.util import dask_array_module
 from holoviews.core.dimension import Dimension, asdim
 from holoviews.core.element import Element
 from holoviews.core.ndmapping import NdMapping, item_check, sorted_context
-from holoviews.core.spaces import HoloMap
+from holoviews.core.spaces import DynamicMap, HoloMap
+
+# Value ranges of lazily loaded cubes, held weakly by cube
+_range_cache = weakref.WeakKeyDictionary()
 
 
 def get_date_format(coord):
@@ -48,6 +55,52 @@ def sort_coords(coord):
 
 
 
+def get_aggregator(function):
+    """Returns an iris Aggregator and keyword arguments corresponding
+    to the supplied aggregation function, preferring the builtin lazy
+    iris aggregators for the standard numpy reductions.
+    """
+    import iris.analysis as ia
+    lookup = {
+        np.mean: (ia.MEAN, {}),
+        np.sum: (ia.SUM, {}),
+        np.min: (ia.MIN, {}),
+        np.max: (ia.MAX, {}),
+        np.amin: (ia.MIN, {}),
+        np.amax: (ia.MAX, {}),
+        np.median: (ia.MEDIAN, {}),
+        np.std: (ia.STD_DEV, {'ddof': 0}),
+        np.var: (ia.VARIANCE, {'ddof': 0}),
+    }
+    if function in lookup:
+        aggregator, kwargs = lookup[function]
+        return aggregator, dict(kwargs)
+    name = getattr(function, '__name__', 'aggregate')
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        parameters = []
+    if not any(p.name == 'axis' or p.kind is p.VAR_KEYWORD for p in parameters):
+        # Apply reductions without an axis argument along each 1D slice
+        def reduce(data, axis, **kwargs):
+            return np.apply_along_axis(function, axis, data, **kwargs)
+        return ia.Aggregator(name, reduce), {}
+    return ia.Aggregator(name, function), {}
+
+
+def nearest_index(points, values):
+    """Returns the indexes of the points closest to each of the values."""
+    points, values = np.asarray(points), np.asarray(values)
+    if len(points) == 1:
+        return np.zeros(len(values), dtype=int)
+    order = np.argsort(points, kind='stable')
+    ordered = points[order]
+    idx = np.clip(np.searchsorted(ordered, values), 1, len(points)-1)
+    idx -= (values - ordered[idx-1]) < (ordered[idx] - values)
+    return order[idx]
+
+
+
 class CubeInterface(GridInterface):
     """The CubeInterface provides allows HoloViews to interact with iris
     Cube data. When passing an iris Cube to a HoloViews Element the
@@ -60,6 +113,17 @@ class CubeInterface(GridInterface):
 
     datatype = 'cube'
 
+    # Scheme used to sample the cube, either 'nearest' or 'linear'
+    sample_scheme = 'nearest'
+
+    # Whether to cache the value ranges computed for lazily loaded cubes
+    cache_ranges = True
+
+    # Maximum number of values of a lazily loaded cube to compute the
+    # value range from, larger cubes are subsampled with a fixed stride
+    # along each axis. If None the range is computed from all values.
+    range_sample = None
+
     @classmethod
     def loaded(cls):
         return 'iris' in sys.modules
@@ -258,12 +322,11 @@ class CubeInterface(GridInterface):
         indexed by the grouped dimensions containing slices of the
         cube wrapped in the group_type. This makes it very easy to
         break up a high-dimensional dataset into smaller viewable chunks.
+        If the container_type is a DynamicMap the slices are only
+        extracted when a key is requested.
         """
-        import iris
-
         if not isinstance(dims, list): dims = [dims]
         dims = [dataset.get_dimension(d, strict=True) for d in dims]
-        constraints = [d.name for d in dims]
         slice_dims = [d for d in dataset.kdims if d not in dims]
 
         # Update the kwargs appropriately for Element group types
@@ -276,23 +339,59 @@ class CubeInterface(GridInterface):
 
         drop_dim = any(d not in group_kwargs['kdims'] for d in slice_dims)
 
-        unique_coords = product(*[cls.values(dataset, d, expanded=False)
-                                  for d in dims])
-        data = []
-        for key in unique_coords:
-            constraint = iris.Constraint(**dict(zip(constraints, key)))
-            extracted = dataset.data.extract(constraint)
+        keys = [cls.values(dataset, d, expanded=False) for d in dims]
+        extract = cls._group_extractor(dataset, dims, keys)
+
+        def load_group(*key):
+            extracted = extract(key)
             if drop_dim:
                 extracted = group_type(extracted, kdims=slice_dims,
                                        vdims=dataset.vdims).columns()
-            cube = group_type(extracted, **group_kwargs)
-            data.append((key, cube))
+            return group_type(extracted, **group_kwargs)
+
+        if isinstance(container_type, type) and issubclass(container_type, DynamicMap):
+            dynamic_dims = [d.clone(values=list(vals)) for d, vals in zip(dims, keys)]
+            return container_type(load_group, kdims=dynamic_dims)
+
+        data = [(key, load_group(*key)) for key in product(*keys)]
         if issubclass(container_type, NdMapping):
             with item_check(False), sorted_context(False):
                 return container_type(data, kdims=dims)
         else:
             return container_type(data)
 
+    @classmethod
+    def _group_extractor(cls, dataset, dims, keys):
+        """Returns a function which extracts the sub-cube for a groupby
+        key. Keys along dimension coordinates are resolved to integer
+        indexes up front so each group is a cheap, lazy slice of the
+        cube, other coordinates fall back to iris Constraints.
+        """
+        import iris
+
+        cube = dataset.data
+        coords = [cube.coords(d.name, dim_coords=True) for d in dims]
+        if not all(coords):
+            names = [d.name for d in dims]
+            def extract(key):
+                return cube.extract(iris.Constraint(**dict(zip(names, key))))
+            return extract
+
+        axes, lookups = [], []
+        for (coord,), vals in zip(coords, keys):
+            order = np.arange(len(vals))
+            if len(coord.points) > 1 and coord.points[0] > coord.points[-1]:
+                order = order[::-1]
+            axes.append(cube.coord_dims(coord)[0])
+            lookups.append(dict(zip(vals, order)))
+
+        def extract(key):
+            index = [slice(None)] * cube.ndim
+            for axis, lookup, k in zip(axes, lookups, key):
+                index[axis] = lookup[k]
+            return cube[tuple(index)]
+        return extract
+
     @classmethod
     def concat_dim(cls, datasets, dim, vdims):
         """Concatenates datasets along one dimension."""
@@ -314,10 +413,52 @@ class CubeInterface(GridInterface):
 
     @classmethod
     def range(cls, dataset, dimension):
-        """Computes the range along a particular dimension."""
+        """Computes the range along a particular dimension.
+
+        Coordinate ranges are computed from the coordinate points
+        without expanding them, value ranges of lazily loaded cubes are
+        computed with dask reductions, optionally on a strided sample
+        of the data (see range_sample) and cached (see cache_ranges).
+        """
         dim = dataset.get_dimension(dimension, strict=True)
-        values = dataset.dimension_values(dim.name, False)
-        return (np.nanmin(values), np.nanmax(values))
+        cube = dataset.data
+        if dim not in dataset.vdims:
+            from iris.coords import DimCoord
+            coord = cube.coord(dim.name)
+            points = coord.core_points()
+            if isinstance(coord, DimCoord) and points.ndim == 1 and len(points):
+                points = points[[0, -1]]
+            return cls._nanrange(points, dim.nodata)
+        elif not cube.has_lazy_data():
+            return cls._nanrange(cube.data, dim.nodata)
+
+        data = cube.core_data()
+        if cls.range_sample and data.size > cls.range_sample:
+            step = int(np.ceil((data.size / cls.range_sample) ** (1. / data.ndim)))
+            data = data[(slice(None, None, step),) * data.ndim]
+        if not cls.cache_ranges:
+            return cls._nanrange(data, dim.nodata)
+        cache = _range_cache.setdefault(cube, {})
+        key = (cls.range_sample, dim.nodata)
+        # Ranges are invalidated when the data of the cube is replaced
+        core_data = cube.core_data()
+        if key not in cache or cache[key][0] is not core_data:
+            cache[key] = (core_data, cls._nanrange(data, dim.nodata))
+        return cache[key][1]
+
+    @classmethod
+    def _nanrange(cls, array, nodata=None):
+        """Computes the NaN-aware minimum and maximum of an array,
+        evaluating both reductions in one pass for dask arrays.
+        """
+        if not array.size:
+            return np.nan, np.nan
+        if nodata is not None:
+            array = cls.replace_value(array, nodata)
+        da = dask_array_module()
+        if da and isinstance(array, da.Array):
+            return tuple(da.compute(da.nanmin(array), da.nanmax(array)))
+        return (np.nanmin(array), np.nanmax(array))
 
 
     @classmethod
@@ -336,7 +477,7 @@ class CubeInterface(GridInterface):
     @classmethod
     def length(cls, dataset):
         """Returns the total number of samples in the dataset."""
-        return np.prod([len(d.points) for d in dataset.data.coords(dim_coords=True)], dtype=np.intp)
+        return np.prod([d.shape[0] for d in dataset.data.coords(dim_coords=True)], dtype=np.intp)
 
 
     @classmethod
@@ -348,17 +489,103 @@ class CubeInterface(GridInterface):
 
 
     @classmethod
-    def aggregate(cls, columns, kdims, function, **kwargs):
-        """Aggregation currently not implemented."""
-        raise NotImplementedError
+    def aggregate(cls, dataset, kdims, function, **kwargs):
+        """Aggregates the cube by collapsing all key dimensions which
+        are not retained, using the lazy iris aggregator matching the
+        function where available.
+        """
+        kdims = [dataset.get_dimension(kd, strict=True) for kd in kdims]
+        collapse = [kd.name for kd in dataset.kdims if kd not in kdims]
+        if not collapse:
+            return dataset.data, []
+        aggregator, agg_kwargs = get_aggregator(function)
+        agg_kwargs.update(kwargs)
+        with warnings.catch_warnings():
+            # Collapsing coordinates without bounds warns about the
+            # contiguity of the collapsed coordinate
+            warnings.simplefilter('ignore', UserWarning)
+            collapsed = dataset.data.collapsed(collapse, aggregator, **agg_kwargs)
+        return collapsed, []
+
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        """Given a dataset object and data in the appropriate format for
+        the interface, return a simple scalar.
+        """
+        import iris
+        if not isinstance(data, iris.cube.Cube) or data.ndim:
+            return data
+        return np.asarray(data.data).item()
 
 
     @classmethod
     def sample(cls, dataset, samples=None):
-        """Sampling currently not implemented."""
+        """Samples the cube at the supplied coordinates. Samples are
+        snapped to the nearest coordinate unless sample_scheme is set to
+        'linear', in which case fully specified samples are linearly
+        interpolated. Samples with unspecified (None) coordinates return
+        all values along those dimensions.
+        """
         if samples is None:
             samples = []
-        raise NotImplementedError
+        cube = dataset.data
+        kdims = dataset.kdims
+        samples = [util.wrap_tuple(s) for s in samples]
+        samples = [tuple(s)+(None,)*(len(kdims)-len(s)) for s in samples]
+        coords = [cube.coord(kd.name) for kd in kdims]
+        axes = [cube.coord_dims(coord) for coord in coords]
+        if sorted(ax for axis in axes for ax in axis) != list(range(cube.ndim)):
+            raise NotImplementedError("Sampling is only supported if the key "
+                                      "dimensions map onto the cube axes.")
+        complete = all(v is not None for s in samples for v in s)
+        if complete:
+            values = [[cls.coord_value(coord, s[i]) for s in samples]
+                      for i, coord in enumerate(coords)]
+            complete = not any(v is None for vals in values for v in vals)
+
+        vdim = dataset.vdims[0].name
+        if not samples:
+            return {d.name: np.array([]) for d in dataset.dimensions()}
+        elif complete and cls.sample_scheme == 'linear':
+            from iris.analysis.trajectory import interpolate
+            sample_points = [(kd.name, np.asarray(vals, dtype=float))
+                             for kd, vals in zip(kdims, values)]
+            sampled = interpolate(cube, sample_points, method='linear')
+            columns = dict(sample_points)
+            columns[vdim] = np.asarray(sampled.data)
+            return columns
+        elif complete:
+            indexes = [nearest_index(coord.points, vals)
+                       for coord, vals in zip(coords, values)]
+        else:
+            indexes = [[] for _ in kdims]
+            for sample in samples:
+                sample_idx = []
+                for coord, v in zip(coords, sample):
+                    value = None if v is None else cls.coord_value(coord, v)
+                    if v is None:
+                        sample_idx.append(np.arange(len(coord.points)))
+                    elif value is None:
+                        raise ValueError(f'Could not sample {coord.name()} at {v!r}.')
+                    else:
+                        sample_idx.append(nearest_index(coord.points, [value]))
+                for idx, grid in zip(indexes, np.meshgrid(*sample_idx, indexing='ij')):
+                    idx.append(grid.flatten())
+            indexes = [np.concatenate(idx) for idx in indexes]
+
+        index = [None] * cube.ndim
+        for (axis,), idx in zip(axes, indexes):
+            index[axis] = idx
+        data = cube.core_data()
+        da = dask_array_module()
+        if da and isinstance(data, da.Array):
+            data = data.vindex[tuple(index)].compute()
+        else:
+            data = data[tuple(index)]
+        columns = {kd.name: coord.points[idx] for kd, coord, idx in zip(kdims, coords, indexes)}
+        columns[vdim] = np.asarray(data)
+        return columns
 
 
     @classmethod
@@ -394,14 +621,91 @@ class CubeInterface(GridInterface):
         return iris.Constraint(**constraint_kwargs)
 
 
+    @classmethod
+    def coord_value(cls, coord, value):
+        """Converts a selection value to the numeric representation of
+        the coordinate points, returning None if it cannot be converted.
+        """
+        if coord.units.is_time_reference():
+            if hasattr(value, 'timetuple'):
+                return coord.units.date2num(value)
+        elif isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+            return value
+        return None
+
+
+    @classmethod
+    def select_to_index(cls, coord, constraint):
+        """Resolves a selection on a dimension coordinate to an integer
+        index or slice using the monotonic ordering of the coordinate
+        points. Returns None if the selection cannot be resolved to an
+        index and has to be expressed as an iris Constraint instead.
+        """
+        points = coord.points
+        descending = len(points) > 1 and points[0] > points[-1]
+        if descending:
+            points = points[::-1]
+        npoints = len(points)
+        if isinstance(constraint, slice):
+            if constraint.step is not None:
+                return None
+            constraint = (constraint.start, constraint.stop)
+        if isinstance(constraint, tuple):
+            if len(constraint) != 2:
+                return None
+            bounds = []
+            for value, default in zip(constraint, (0, npoints)):
+                if value is None:
+                    bounds.append(default)
+                    continue
+                value = cls.coord_value(coord, value)
+                if value is None:
+                    return None
+                bounds.append(np.searchsorted(points, value, side='left'))
+            start, stop = bounds
+            if stop <= start:
+                return None
+            if descending:
+                start, stop = npoints-stop, npoints-start
+            return slice(int(start), int(stop))
+        elif util.isscalar(constraint) and not coord.has_bounds():
+            value = cls.coord_value(coord, constraint)
+            if value is None:
+                return None
+            idx = np.searchsorted(points, value, side='left')
+            if idx == npoints or points[idx] != value:
+                return None
+            return int(npoints-idx-1 if descending else idx)
+        return None
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
-        """Apply a selection to the data."""
+        """Apply a selection to the data.
+
+        Selections on dimension coordinates are resolved to integer
+        indexes and applied by slicing the cube, which keeps lazy data
+        lazy, while any remaining selections are applied as an iris
+        Constraint.
+        """
         import iris
-        constraint = cls.select_to_constraint(dataset, selection)
-        pre_dim_coords = [c.name() for c in dataset.data.dim_coords]
+        cube = dataset.data
+        pre_dim_coords = [c.name() for c in cube.dim_coords]
         indexed = cls.indexed(dataset, selection)
-        extracted = dataset.data.extract(constraint)
+        index = [slice(None)] * cube.ndim
+        remaining = {}
+        for dim, constraint in selection.items():
+            name = dataset.get_dimension(dim, strict=True).name
+            coords = cube.coords(name, dim_coords=True)
+            idx = cls.select_to_index(coords[0], constraint) if coords else None
+            if idx is None:
+                remaining[dim] = constraint
+            else:
+                index[cube.coord_dims(coords[0])[0]] = idx
+        extracted = cube[tuple(index)] if len(remaining) < len(selection) else cube
+        if remaining:
+            constraint = cls.select_to_constraint(dataset, remaining)
+            extracted = extracted.extract(constraint)
         if indexed and not extracted.dim_coords:
             return extracted.data.item()
         post_dim_coords = [c.name() for c in extracted.dim_coords]
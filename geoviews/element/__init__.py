@@ -1,9 +1,15 @@
+import operator
+from collections import OrderedDict
+from functools import reduce
+
+from holoviews.core.spaces import DynamicMap
 from holoviews.element import (
     ElementConversion,
     Path as HvPath,
     Points as HvPoints,
     Polygons as HvPolygons,
 )
+from holoviews.util.transform import dim
 
 from .geo import (
     RGB,
@@ -33,6 +39,7 @@ from .geo import (
     VectorField,
     WindBarbs,
     _Element,
+    geo_metadata,
     is_geographic,
 )
 
@@ -64,6 +71,7 @@ __all__ = (
     "TriMesh",
     "VectorField",
     "WindBarbs",
+    "geo_metadata",
     "is_geographic",
 )
 
@@ -76,12 +84,18 @@ class GeoConversion(ElementConversion):
     conversion interface will automatically use a geographical
     Element type while all other plot will use regular HoloViews
     Elements.
+
+    Passing dynamic=True returns a DynamicMap over the remaining
+    dimensions which only converts a group when it is requested,
+    instead of building every group up front.
     """
 
     def __init__(self, cube):
         self._element = cube
 
     def __call__(self, *args, **kwargs):
+        if kwargs.pop('dynamic', False):
+            return self._dynamic(*args, **kwargs)
         group_type = args[0]
         if 'crs' not in kwargs and issubclass(group_type, _Element):
             kwargs['crs'] = self._element.crs
@@ -99,6 +113,62 @@ class GeoConversion(ElementConversion):
             converted = converted.map(lambda x: x.clone(kdims=kdims, new_type=group_type), Dataset)
         return converted
 
+    def _dynamic(self, new_type, kdims=None, vdims=None, groupby=None,
+                 cache_size=10, **kwargs):
+        """Returns a DynamicMap over the groupby dimensions which only
+        converts the group of the requested key, keeping the cache_size
+        most recently requested frames.
+        """
+        element = self._element
+        if element.interface.datatype == 'geodataframe':
+            # Geometry dimensions are resolved when converting each group
+            group_kdims = []
+        elif kdims is None:
+            kdim_param = new_type.param.objects()['kdims']
+            ndim = kdim_param.bounds[1] if isinstance(kdim_param.bounds[1], int) else None
+            if isinstance(ndim, int):
+                ndim = min([ndim, len(kdim_param.default)])
+            kd_filter = groupby or []
+            if not isinstance(kd_filter, list):
+                kd_filter = [kd_filter]
+            group_kdims = kdims = [kd for kd in element.kdims if kd not in kd_filter][:ndim]
+        else:
+            group_kdims = kdims if isinstance(kdims, list) else [kdims]
+        group_kdims = [element.get_dimension(kd) or kd for kd in group_kdims]
+        if vdims is not None and not isinstance(vdims, list):
+            vdims = [vdims]
+        if groupby is None:
+            groupby = [d for d in element.kdims if d not in group_kdims + (vdims or [])]
+        elif not isinstance(groupby, list):
+            groupby = [groupby]
+        if not groupby:
+            return self(new_type, kdims, vdims, groupby, **kwargs)
+
+        groupby = [element.get_dimension(d, strict=True) for d in groupby]
+        names = [d.name for d in groupby]
+        groups = OrderedDict()
+
+        def load_group(*key):
+            if key in groups:
+                groups.move_to_end(key)
+                return groups[key]
+            if element.interface.gridded:
+                group = element.select(**dict(zip(names, key)))
+            else:
+                # Expression based selection never collapses to a scalar
+                expr = reduce(operator.and_, [dim(n) == k for n, k in zip(names, key)])
+                group = element.select(selection_expr=expr)
+            groups[key] = type(self)(group)(new_type, kdims, vdims, [], **kwargs)
+            if len(groups) > cache_size:
+                groups.popitem(last=False)
+            return groups[key]
+
+        dims = [d.clone(values=list(element.dimension_values(d, expanded=False)))
+                for d in groupby]
+        # The DynamicMap cache evicts the oldest frames first, so the
+        # least recently used groups are tracked by load_group instead
+        return DynamicMap(load_group, kdims=dims, cache_size=1)
+
     def linecontours(self, kdims=None, vdims=None, mdims=None, **kwargs):
         return self(LineContours, kdims, vdims, mdims, **kwargs)
 
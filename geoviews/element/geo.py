@@ -1,11 +1,15 @@
 import sys
+import weakref
+from itertools import islice
 
 import numpy as np
+import pandas as pd
 import param
+import shapely
 from cartopy import crs as ccrs
 from cartopy.feature import Feature as cFeature
 from cartopy.io.img_tiles import GoogleTiles
-from cartopy.io.shapereader import Reader
+from cartopy.io.shapereader import Record
 from holoviews.core import (
     Dataset as HvDataset,
     Dimension,
@@ -50,13 +54,11 @@ from ..util import CARTOPY_VERSION
 
 
 def _get_iris_cube():
-    try:
-        from iris.cube import Cube
-    except (ImportError, OSError):
-        # OSError because environment variable $UDUNITS2_XML_PATH
-        # is sometimes not set. Should be done automatically
-        # when installing the package.
-        Cube = None
+    if 'iris.cube' not in sys.modules:
+        # Data can only be an iris Cube once iris has been imported,
+        # avoids repeatedly attempting a failing import
+        return None
+    from iris.cube import Cube
     return Cube
 
 
@@ -73,30 +75,54 @@ except ImportError:
     _IMAGESTACK_AVAILABLE = False
 
 from ..util import (
-    expand_geoms,
+    SHAPELY_GE_2_0_0,
+    element_to_geoms,
+    feature_index,
+    from_parquet,
     from_xarray,
-    path_to_geom_dicts,
     poly_types,
-    polygons_to_geom_dicts,
     transform_shapely,
 )
 
 geographic_types = (GoogleTiles, cFeature, BaseGeometry)
 
+# Data types which cannot define their own crs
+_plain_types = (np.ndarray, list, tuple, dict, pd.DataFrame)
+
 def _check_bokeh_mercator(data) -> bool:
     if "bokeh.models" in sys.modules:
         from bokeh.models import MercatorTileSource
         return isinstance(data, MercatorTileSource)
     return False
 
+def _collect_geoms(geoms, multi_type):
+    """Combines an array of single-part geometries into a single
+    geometry of the supplied multi-part type.
+    """
+    if not len(geoms):
+        return GeometryCollection()
+    elif len(geoms) == 1:
+        return geoms[0]
+    elif SHAPELY_GE_2_0_0:
+        constructor = {MultiPoint: shapely.multipoints, MultiLineString: shapely.multilinestrings,
+                       MultiPolygon: shapely.multipolygons}[multi_type]
+        return constructor(geoms)
+    return multi_type(list(geoms))
+
+
 def is_geographic(element, kdims=None):
     """Utility to determine whether the supplied element optionally
     a subset of its key dimensions represent a geographic coordinate
     system.
     """
     if isinstance(element, (Overlay, NdOverlay)):
-        return any(element.traverse(is_geographic, [_Element]))
+        return geo_metadata(element)[0]
+    elif kdims:
+        return _is_geographic(element, kdims)
+    return _element_geo_metadata(element)[0]
 
+
+def _is_geographic(element, kdims=None):
     if kdims:
         kdims = [element.get_dimension(d) for d in kdims]
     else:
@@ -107,11 +133,51 @@ def is_geographic(element, kdims=None):
     if isinstance(element.data, geographic_types) or isinstance(element, (WMTS, Feature)):
         return True
     elif isinstance(element, _Element):
-        return kdims == element.kdims and element.crs
+        return bool(kdims == element.kdims and element.crs)
     else:
         return False
 
 
+_geo_metadata_cache = weakref.WeakKeyDictionary()
+
+
+def _element_geo_metadata(element):
+    """Returns whether the element is geographic along with its crs,
+    cached per element so plots and operations only compute it once.
+    """
+    crs = element.crs if isinstance(element, _Element) else None
+    cached = _geo_metadata_cache.get(element)
+    if cached is not None and cached[1] is crs:
+        return cached
+    metadata = (_is_geographic(element), crs)
+    _geo_metadata_cache[element] = metadata
+    return metadata
+
+
+def geo_metadata(obj):
+    """Summarizes the geographic metadata of an element or container.
+
+    Parameters
+    ----------
+    obj : Element or container
+      Object to traverse for geographic elements
+
+    Returns
+    -------
+    geographic : boolean
+      Whether any of the elements is geographic
+    crss : list
+      The unique coordinate reference systems of the elements
+    """
+    geographic, crss = False, []
+    for element in obj.traverse(lambda x: x, [_Element]):
+        el_geographic, crs = _element_geo_metadata(element)
+        geographic = geographic or el_geographic
+        if crs is not None and not any(crs is c or crs == c for c in crss):
+            crss.append(crs)
+    return geographic, crss
+
+
 class _Element(Element2D):
     """Baseclass for Element2D types with associated cartopy
     coordinate reference system.
@@ -119,7 +185,8 @@ class _Element(Element2D):
 
     _abstract = True
 
-    crs = param.ClassSelector(default=ccrs.PlateCarree(), class_=ccrs.CRS, doc="""
+    crs = param.ClassSelector(default=ccrs.PlateCarree(), class_=ccrs.CRS,
+                              instantiate=False, doc="""
         Cartopy coordinate-reference-system specifying the
         coordinate system of the data. Inferred automatically
         when _Element wraps cartopy Feature object.""")
@@ -128,12 +195,18 @@ class _Element(Element2D):
                        bounds=(2, 2), constant=True)
 
     def __init__(self, data, kdims=None, vdims=None, **kwargs):
+        if kwargs.get('crs') is not None and isinstance(data, _plain_types):
+            # Plain data carries no crs, skip inferring it
+            super().__init__(data, kdims=kdims, vdims=vdims, **kwargs)
+            return
+
         crs = None
         if isinstance(data, HvDataset):
             crs_data = data.data
         else:
             crs_data = data
-        if hasattr(crs_data, 'coord_system') and _get_iris_cube() and isinstance(crs_data, _get_iris_cube()):
+        Cube = _get_iris_cube() if hasattr(crs_data, 'coord_system') else None
+        if Cube is not None and isinstance(crs_data, Cube):
             coord_sys = crs_data.coord_system()
             if hasattr(coord_sys, 'as_cartopy_projection'):
                 crs = coord_sys.as_cartopy_projection()
@@ -228,7 +301,17 @@ class Feature(_GeoFeature):
             extent = (bounds[0], bounds[2], bounds[1], bounds[3])
         else:
             extent = None
-        geoms = [g for g in feature.intersecting_geometries(extent) if g is not None]
+        index = None
+        if extent is not None and not np.isnan(extent[0]):
+            if hasattr(feature, 'scaler'):
+                feature.scaler.scale_from_extent(extent)
+            index = feature_index(feature)
+        if index is None:
+            geoms = [g for g in feature.intersecting_geometries(extent) if g is not None]
+        else:
+            tree = index[0]
+            idx = np.sort(tree.query(box(*bounds), predicate='intersects'))
+            geoms = list(tree.geometries.take(idx))
         if not as_element:
             return geoms
         elif not geoms or 'Polygon' in geoms[0].geom_type:
@@ -242,7 +325,11 @@ class Feature(_GeoFeature):
         didx = self.get_dimension_index(dim)
         if didx in [0, 1] and data_range:
             dim = self.get_dimension(dim)
-            l, b, r, t = util.max_extents([geom.bounds for geom in self.data.geometries()])
+            index = feature_index(self.data)
+            if index is None:
+                l, b, r, t = util.max_extents([geom.bounds for geom in self.data.geometries()])
+            else:
+                l, b, r, t = index[1]
             lower, upper = (b, t) if didx else (l, r)
             if dimension_range:
                 return util.dimension_range(lower, upper, dim.range, dim.soft_range)
@@ -319,6 +406,13 @@ class Points(_Element, HvPoints):
 
     group = param.String(default='Points')
 
+    @classmethod
+    def from_parquet(cls, path, bbox=None, columns=None, filters=None, crs=None, **kwargs):
+        """Loads the points from a GeoParquet file, pushing the bounding
+        box and column selections down to the parquet reader.
+        """
+        return from_parquet(path, cls, bbox, columns, filters, crs, **kwargs)
+
     def geom(self, union=False, projection=None):
         """Converts the Points to a shapely geometry.
 
@@ -333,14 +427,15 @@ class Points(_Element, HvPoints):
         -------
         A shapely geometry
         """
-        points = [Point(x, y) for (x, y) in self.array([0, 1])]
-        npoints = len(points)
-        if not npoints:
+        coords = self.array([0, 1]).astype('float64')
+        if not len(coords):
             geom = GeometryCollection()
-        elif len(points) == 1:
-            geom = points[0]
+        elif len(coords) == 1:
+            geom = Point(coords[0])
+        elif SHAPELY_GE_2_0_0:
+            geom = shapely.multipoints(coords)
         else:
-            geom = MultiPoint(points)
+            geom = MultiPoint(coords)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
         return unary_union(geom) if union else geom
@@ -632,6 +727,13 @@ class Path(_Element, HvPath):
 
     group = param.String(default='Path', constant=True)
 
+    @classmethod
+    def from_parquet(cls, path, bbox=None, columns=None, filters=None, crs=None, **kwargs):
+        """Loads the paths from a GeoParquet file, pushing the bounding
+        box and column selections down to the parquet reader.
+        """
+        return from_parquet(path, cls, bbox, columns, filters, crs, **kwargs)
+
     def geom(self, union=False, projection=None):
         """Converts the Path to a shapely geometry.
 
@@ -646,14 +748,7 @@ class Path(_Element, HvPath):
         -------
         A shapely geometry
         """
-        geoms = expand_geoms([g['geometry'] for g in path_to_geom_dicts(self)])
-        ngeoms = len(geoms)
-        if not ngeoms:
-            geom = GeometryCollection()
-        elif ngeoms == 1:
-            geom = geoms[0]
-        else:
-            geom = MultiLineString(geoms)
+        geom = _collect_geoms(element_to_geoms(self), MultiLineString)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
         return unary_union(geom) if union else geom
@@ -668,6 +763,39 @@ class EdgePaths(Path):
 
 
 
+_graph_edgepaths_cache = weakref.WeakKeyDictionary()
+
+# EdgePaths derived from the node positions, rather than supplied
+_derived_edgepaths = weakref.WeakSet()
+
+
+def _connect_nodes(graph, closed=False):
+    """Computes the EdgePaths connecting the nodes referenced by each
+    row of the graph's key dimensions as a single NaN-separated path,
+    gathering the node positions by index instead of merging tables.
+    Edges referencing missing nodes are dropped.
+    """
+    nodes = graph.nodes
+    xs, ys, index = (nodes.dimension_values(i) for i in range(3))
+    simplices = np.column_stack([graph.dimension_values(d) for d in graph.kdims])
+    positions = pd.Index(index).get_indexer(simplices.ravel()).reshape(simplices.shape)
+    positions = positions[(positions >= 0).all(axis=1)]
+    if closed:
+        positions = np.column_stack([positions, positions[:, :1]])
+    if not len(positions):
+        edgepaths = graph.edge_type([], kdims=nodes.kdims[:2], crs=graph.crs)
+    else:
+        coords = np.full((len(positions), positions.shape[1]+1, 2), np.nan)
+        coords[:, :-1, 0] = np.asarray(xs, dtype=np.float64)[positions]
+        coords[:, :-1, 1] = np.asarray(ys, dtype=np.float64)[positions]
+        edgepaths = graph.edge_type(
+            [coords.reshape(-1, 2)[:-1]], kdims=nodes.kdims[:2],
+            datatype=['multitabular'], crs=graph.crs
+        )
+    _derived_edgepaths.add(edgepaths)
+    return edgepaths
+
+
 class Graph(_Element, HvGraph):
 
     group = param.String(default='Graph', constant=True)
@@ -712,10 +840,23 @@ class Graph(_Element, HvGraph):
         """Returns the fixed EdgePaths or computes direct connections
         between supplied nodes.
         """
-        edgepaths = super().edgepaths
+        if self._edgepaths:
+            edgepaths = self._edgepaths
+        else:
+            edgepaths = _graph_edgepaths_cache.get(self)
+            if edgepaths is None:
+                edgepaths = _connect_nodes(self)
+                _graph_edgepaths_cache[self] = edgepaths
         edgepaths.crs = self.crs
         return edgepaths
 
+    @property
+    def _has_edgepaths(self):
+        """Whether the EdgePaths were supplied explicitly rather than
+        derived from the node positions.
+        """
+        return bool(self._edgepaths) and self._edgepaths not in _derived_edgepaths
+
 
 
 class TriMesh(HvTriMesh, Graph):
@@ -758,6 +899,13 @@ class TriMesh(HvTriMesh, Graph):
         super().__init__(data, kdims, vdims, **params)
         self.nodes.crs = crs
 
+    def _initialize_edgepaths(self):
+        """Returns the EdgePaths by generating a triangle for each simplex."""
+        if self._edgepaths:
+            return self._edgepaths
+        self._edgepaths = _connect_nodes(self, closed=True)
+        return self._edgepaths
+
     @property
     def edgepaths(self):
         """Returns the fixed EdgePaths or computes direct connections
@@ -790,14 +938,7 @@ class Contours(_Element, HvContours):
         -------
         A shapely geometry
         """
-        geoms = expand_geoms([g['geometry'] for g in path_to_geom_dicts(self)])
-        ngeoms = len(geoms)
-        if not ngeoms:
-            geom = GeometryCollection()
-        elif ngeoms == 1:
-            geom = geoms[0]
-        else:
-            geom = MultiLineString(geoms)
+        geom = _collect_geoms(element_to_geoms(self), MultiLineString)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
         return unary_union(geom) if union else geom
@@ -811,8 +952,15 @@ class Polygons(_Element, HvPolygons):
 
     group = param.String(default='Polygons', constant=True)
 
-    def geom(self, union=False, projection=None):
-        """Converts the Path to a shapely geometry.
+    @classmethod
+    def from_parquet(cls, path, bbox=None, columns=None, filters=None, crs=None, **kwargs):
+        """Loads the polygons from a GeoParquet file, pushing the bounding
+        box and column selections down to the parquet reader.
+        """
+        return from_parquet(path, cls, bbox, columns, filters, crs, **kwargs)
+
+    def geom(self, union=False, projection=None, coverage=False):
+        """Converts the Polygons to a shapely geometry.
 
         Parameters
         ----------
@@ -820,22 +968,23 @@ class Polygons(_Element, HvPolygons):
             Whether to compute a union between the geometries
         projection : EPSG string | Cartopy CRS | None
             Whether to project the geometry to other coordinate system
+        coverage : boolean, default=False
+            Whether the polygons form a coverage, i.e. do not overlap,
+            allowing a faster union to be computed
 
         Returns
         -------
         A shapely geometry
         """
-        geoms = expand_geoms([g['geometry'] for g in polygons_to_geom_dicts(self)])
-        ngeoms = len(geoms)
-        if not ngeoms:
-            geom = GeometryCollection()
-        elif ngeoms == 1:
-            geom = geoms[0]
+        geoms = element_to_geoms(self, polygons=True)
+        coverage_union = union and coverage and SHAPELY_GE_2_0_0
+        if coverage_union:
+            geom = shapely.coverage_union_all(geoms)
         else:
-            geom = MultiPolygon(geoms)
+            geom = _collect_geoms(geoms, MultiPolygon)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
-        return unary_union(geom) if union else geom
+        return unary_union(geom) if union and not coverage_union else geom
 
 
 class Rectangles(_Element, HvRectangles):
@@ -865,14 +1014,12 @@ class Rectangles(_Element, HvRectangles):
         -------
         A shapely geometry
         """
-        boxes = [box(*g) for g in self.array([0, 1, 2, 3])]
-        nboxes = len(boxes)
-        if not nboxes:
-            geom = GeometryCollection()
-        elif nboxes == 1:
-            geom = boxes[0]
+        coords = self.array([0, 1, 2, 3]).astype('float64')
+        if SHAPELY_GE_2_0_0:
+            boxes = shapely.box(*coords.T)
         else:
-            geom = MultiPolygon(boxes)
+            boxes = [box(*g) for g in coords]
+        geom = _collect_geoms(boxes, MultiPolygon)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
         return unary_union(geom) if union else geom
@@ -894,20 +1041,69 @@ class Segments(_Element, HvSegments):
     def geom(self, union=False, projection=None):
         """Converts the Segments to a shapely geometry.
         """
-        lines = [LineString([(x0, y0), (x1, y1)]) for (x0, y0, x1, y1)
-                 in self.array([0, 1, 2, 3])]
-        nlines = len(lines)
-        if not nlines:
-            geom = GeometryCollection()
-        elif nlines == 1:
-            geom = lines[0]
+        coords = self.array([0, 1, 2, 3]).astype('float64')
+        if SHAPELY_GE_2_0_0:
+            lines = shapely.linestrings(coords.reshape(-1, 2, 2))
         else:
-            geom = MultiLineString(lines)
+            lines = [LineString([(x0, y0), (x1, y1)]) for (x0, y0, x1, y1) in coords]
+        geom = _collect_geoms(lines, MultiLineString)
         if projection:
             geom = transform_shapely(geom, self.crs, projection)
         return unary_union(geom) if union else geom
 
 
+def _match_attributes(attributes, where):
+    """Whether the record attributes match the supplied where clause."""
+    if callable(where):
+        return where(attributes)
+    for attr, value in where.items():
+        if isinstance(value, (list, set)):
+            if attributes.get(attr) not in value:
+                return False
+        elif attributes.get(attr) != value:
+            return False
+    return True
+
+
+def _shapefile_records(shapefile, bbox=None, columns=None, where=None, limit=None):
+    """Lazily yields the `cartopy.io.shapereader.Record` objects in a
+    shapefile, filtering by bounding box and attributes.
+
+    Records are skipped using the bounding box stored in the shapefile
+    and attribute filters are evaluated on the dbf table alone, so the
+    geometry is only read for the records which are returned.
+    """
+    import shapefile as pyshp
+
+    with pyshp.Reader(shapefile) as reader:
+        fields = reader.fields[1:]
+        if columns is not None:
+            fields = [f for f in fields if f[0] in columns]
+        names = [f[0] for f in fields]
+        if where is None:
+            records = ((sr.shape, sr.record)
+                       for sr in reader.iterShapeRecords(fields=names, bbox=bbox))
+        else:
+            read_fields = None if callable(where) or columns is None else names+[
+                w for w in where if w not in names]
+            records = (
+                (reader.shape(rec.oid, bbox=bbox), rec)
+                for rec in reader.iterRecords(fields=read_fields)
+                if rec is not None and _match_attributes(rec.as_dict(), where)
+            )
+        count = 0
+        for shape, record in records:
+            if shape is None:
+                continue
+            attributes = record.as_dict()
+            if columns is not None:
+                attributes = {k: attributes[k] for k in names}
+            yield Record(shape, attributes, fields)
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+
 class Shape(Dataset):
     """Shape wraps any shapely geometry type.
     """
@@ -937,13 +1133,34 @@ class Shape(Dataset):
 
 
     @classmethod
-    def from_shapefile(cls, shapefile, *args, **kwargs):
+    def from_shapefile(cls, shapefile, *args, bbox=None, columns=None, where=None,
+                       limit=None, chunksize=None, **kwargs):
         """Loads a shapefile from disk and optionally merges
         it with a dataset. See ``from_records`` for full
         signature.
 
+        Records outside the ``bbox`` or not matching the ``where``
+        clause are skipped before their geometry is read, so subsets
+        of large shapefiles can be loaded without parsing the whole
+        file.
+
         Parameters
         ----------
+        shapefile : str
+           Path to the shapefile.
+        bbox : tuple, optional
+           Bounding box (x0, y0, x1, y1) the shapes must intersect.
+        columns : list, optional
+           Subset of the record attributes to load.
+        where : dict or callable, optional
+           Mapping from attribute names to a value or list of values
+           to match, or a function which given the record attributes
+           returns whether to load the record.
+        limit : int, optional
+           Maximum number of records to load.
+        chunksize : int, optional
+           If supplied returns a generator yielding elements of at
+           most chunksize records each.
         records : list of cartopy.io.shapereader.Record
            Iterator containing Records.
         dataset : holoviews.Dataset
@@ -963,11 +1180,23 @@ class Shape(Dataset):
 
         Returns
         -------
-        shapes : Polygons or Path object
-          A Polygons or Path object containing the geometries
+        shapes : Polygons or Path object or generator
+          A Polygons or Path object containing the geometries or
+          a generator of such objects if a chunksize is supplied
         """
-        reader = Reader(shapefile)
-        return cls.from_records(reader.records(), *args, **kwargs)
+        records = _shapefile_records(shapefile, bbox, columns, where, limit)
+        if chunksize is None:
+            return cls.from_records(records, *args, **kwargs)
+        return cls._chunked_records(records, chunksize, *args, **kwargs)
+
+    @classmethod
+    def _chunked_records(cls, records, chunksize, *args, **kwargs):
+        """Yields elements built from consecutive chunks of records."""
+        while True:
+            chunk = list(islice(records, chunksize))
+            if not chunk:
+                return
+            yield cls.from_records(chunk, *args, **kwargs)
 
 
     @classmethod
@@ -1046,15 +1275,23 @@ class Shape(Dataset):
         else:
             vdims = []
 
+        if dataset:
+            # Hash index mapping each key to its first matching row,
+            # built in reverse so earlier rows take precedence
+            columns = dataset.columns()
+            keys = [columns[dataset.get_dimension(dim).name][::-1]
+                    for dim in on.values()]
+            lookup = dict(zip(zip(*keys), range(len(dataset)-1, -1, -1)))
+
         data = []
         for rec in records:
             geom = {}
+            row = None
             if dataset:
-                selection = {dim: rec.attributes.get(attr, None)
-                             for attr, dim in on.items()}
-                row = dataset.select(**selection)
-                if len(row):
-                    values = {k: v[0] for k, v in row.iloc[0].columns().items()}
+                key = tuple(rec.attributes.get(attr, None) for attr in on)
+                row = lookup.get(key)
+                if row is not None:
+                    values = {k: v[row] for k, v in columns.items()}
                 elif drop_missing:
                     continue
                 else:
@@ -1063,8 +1300,8 @@ class Shape(Dataset):
 
             if index:
                 for kdim in kdims:
-                    if kdim in ddims and len(row):
-                        k = row[kdim.name][0]
+                    if kdim in ddims and row is not None:
+                        k = columns[kdim.name][row]
                     elif kdim.name in rec.attributes:
                         k = rec.attributes[kdim.name]
                     else:
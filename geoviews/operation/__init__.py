@@ -3,7 +3,7 @@ from holoviews.operation.element import contours
 from holoviews.operation.stats import bivariate_kde
 
 from .. import element as gv_element
-from ..element import _Element
+from ..element import _Element, geo_metadata
 from .projection import (  # noqa: F401
     project,
     project_geom,
@@ -41,15 +41,13 @@ def find_crs(op, element):
     systems (crs). If multiple clashing reference systems are found
     it will throw an error.
     """
-    crss = [crs for crs in element.traverse(lambda x: x.crs, [_Element])
-            if crs is not None]
+    _, crss = geo_metadata(element)
     if not crss:
         return {}
-    crs = crss[0]
-    if any(crs != ocrs for ocrs in crss[1:]):
+    elif len(crss) > 1:
         raise ValueError(f'Cannot {type(op).__name__} Elements in different '
                          'coordinate reference systems.')
-    return {'crs': crs}
+    return {'crs': crss[0]}
 
 
 def add_crs(op, element, **kwargs):
@@ -5,6 +5,7 @@ from contextlib import suppress
 import numpy as np
 import pandas as pd
 import param
+import shapely
 from cartopy import crs as ccrs
 from holoviews.core.data import MultiInterface
 from holoviews.core.util import cartesian_product, get_param_values
@@ -12,7 +13,7 @@ from holoviews.operation import Operation
 from shapely.geometry import MultiPolygon, Polygon
 from shapely.geometry.collection import GeometryCollection
 
-from ..data import GeoPandasInterface
+from ..data import DaskGeoPandasInterface, GeoPandasInterface
 from ..element import (
     RGB,
     Contours,
@@ -29,11 +30,15 @@ from ..element import (
     Rectangles,
     Segments,
     Shape,
+    TriMesh,
     VectorField,
     WindBarbs,
 )
+from ..element.geo import _connect_nodes
 from ..util import (
-    geom_dict_to_array_dict,
+    SHAPELY_GE_2_0_0,
+    geodesic_densify,
+    geom_dicts_to_array_dicts,
     path_to_geom_dicts,
     polygons_to_geom_dicts,
     project_extents,
@@ -71,8 +76,62 @@ class _project_operation(Operation):
     def _process(self, element, key=None):
         return element.map(self._process_element, self.supported_types)
 
+    def _project_partitions(self, element, project_frame):
+        """Lazily projects each partition of an element backed by a
+        dask-geopandas GeoDataFrame using the supplied function, which
+        projects a single in-memory partition.
+        """
+        import dask
+        import dask.dataframe as dd
+
+        parts = [dask.delayed(project_frame)(part) for part in element.data.to_delayed()]
+        meta = element.data._meta.set_crs(None, allow_override=True)
+        projected = dd.from_delayed(parts, meta=meta, verify_meta=False)
+        return element.clone(projected, crs=self.p.projection)
+
+
+class _geodesic_operation(_project_operation):
+    """Baseclass for projection operations which can draw lines along
+    geodesics (great-circle arcs) instead of straight lines in the
+    source coordinate reference system.
+    """
+
+    geodesic = param.Boolean(default=False, doc="""
+        Whether to draw lines along geodesics (great-circle arcs) by
+        densifying them before they are projected.""")
+
+    geodesic_spacing = param.Number(default=100e3, bounds=(0, None),
+                                    inclusive_bounds=(False, True), doc="""
+        Maximum distance (in meters) between the points interpolated
+        along geodesics.""")
 
-class project_path(_project_operation):
+    def _project_geodesic(self, crs, xs, ys, index):
+        """Densifies the paths along geodesics and projects them.
+
+        Returns the projected coordinates, the path index of each
+        point, a mask of the points within the projection bounds and
+        a mask of the consecutive points which remain connected.
+        """
+        proj = self.p.projection
+        geodetic = crs.as_geodetic()
+        lonlat = geodetic.transform_points(crs, np.asarray(xs, dtype=np.float64),
+                                           np.asarray(ys, dtype=np.float64))
+        lons, lats, index = geodesic_densify(
+            lonlat[:, 0], lonlat[:, 1], self.p.geodesic_spacing,
+            geodetic.get_geod(), index
+        )
+        coords = proj.transform_points(geodetic, lons, lats)
+        xs, ys = coords[:, 0], coords[:, 1]
+        (x0, x1), (y0, y1) = proj.x_limits, proj.y_limits
+        with np.errstate(invalid='ignore'):
+            valid = (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+            # Lines wrapping around the projection are split
+            wrapped = np.abs(np.diff(xs)) > (x1 - x0) / 2
+        connected = (index[1:] == index[:-1]) & valid[1:] & valid[:-1] & ~wrapped
+        return xs, ys, index, valid, connected
+
+
+class project_path(_geodesic_operation):
     """Projects Polygons and Path Elements from their source coordinate
     reference system to the supplied projection.
     """
@@ -80,13 +139,17 @@ class project_path(_project_operation):
     supported_types = [Polygons, Path, Contours, EdgePaths]
 
     def _process_element(self, element):
-        if not bool(element):
+        if element.interface is DaskGeoPandasInterface:
+            return self._project_partitions(element, lambda data: self._process_element(
+                element.interface.partition_dataset(element, data)).data)
+        elif not bool(element):
             return element.clone(crs=self.p.projection)
 
         crs = element.crs
         proj = self.p.projection
+        geodesic = self.p.geodesic and not isinstance(element, Polygons)
         if (isinstance(crs, ccrs.PlateCarree) and not isinstance(proj, ccrs.PlateCarree)
-            and crs.proj4_params['lon_0'] != 0):
+            and crs.proj4_params['lon_0'] != 0 and not geodesic):
             element = self.instance(projection=ccrs.PlateCarree())(element)
 
         if isinstance(proj, ccrs.CRS) and not isinstance(proj, ccrs.Projection):
@@ -99,8 +162,12 @@ class project_path(_project_operation):
         else:
             geoms = path_to_geom_dicts(element, skip_invalid=False)
 
-        projected = []
-        for path in geoms:
+        if geodesic:
+            projected, indices = self._project_geodesic_paths(geoms, crs)
+            return self._cast_projected(element, geoms, projected, indices, crs)
+
+        projected, indices = [], []
+        for i, path in enumerate(geoms):
             geom = path['geometry']
 
             # Ensure minimum area for polygons (precision issues cause errors)
@@ -135,11 +202,18 @@ class project_path(_project_operation):
             if 'holes' in data:
                 data.pop('holes')
             projected.append(data)
+            indices.append(i)
+
+        return self._cast_projected(element, geoms, projected, indices, crs)
 
+    def _cast_projected(self, element, geoms, projected, indices, crs):
+        """Casts the projected geometry dictionaries back to the type
+        of the original data, warning if none of them were projected.
+        """
         if len(geoms) and len(projected) == 0:
             element_name = type(element).__name__
             crs_name = type(crs).__name__
-            proj_name = type(proj).__name__
+            proj_name = type(self.p.projection).__name__
             self.param.warning(
                 f'While projecting a {element_name} element from a {crs_name} coordinate '
                 f'reference system (crs) to a {proj_name} projection none of '
@@ -151,13 +225,16 @@ class project_path(_project_operation):
         # Try casting back to original types
         if element.interface is GeoPandasInterface:
             import geopandas as gpd
-            projected = gpd.GeoDataFrame(projected, columns=element.data.columns)
+            geom_col = element.interface.geo_column(element.data)
+            frame = pd.DataFrame(element.data.iloc[indices])
+            frame[geom_col] = [p['geometry'] for p in projected]
+            projected = gpd.GeoDataFrame(frame, geometry=geom_col)
         elif element.interface is MultiInterface:
             x, y = element.kdims
             item = element.data[0] if element.data else None
             if item is None or (isinstance(item, dict) and 'geometry' in item):
                 return element.clone(projected, crs=self.p.projection)
-            projected = [geom_dict_to_array_dict(p, [x.name, y.name]) for p in projected]
+            projected = geom_dicts_to_array_dicts(projected, [x.name, y.name])
             if any('holes' in p for p in projected):
                 pass
             elif pd and isinstance(item, pd.DataFrame):
@@ -167,6 +244,40 @@ class project_path(_project_operation):
                              for p in projected]
         return element.clone(projected, crs=self.p.projection)
 
+    def _project_geodesic_paths(self, geoms, crs):
+        """Projects all path geometries at once along geodesics,
+        splitting them where they leave or wrap around the projection.
+        """
+        if not SHAPELY_GE_2_0_0:
+            raise ImportError('Projecting paths along geodesics requires shapely>=2.0.')
+        elif not geoms:
+            return [], []
+        parts, part_geoms = shapely.get_parts(
+            np.array([g['geometry'] for g in geoms], dtype=object), return_index=True
+        )
+        coords, part_index = shapely.get_coordinates(parts, return_index=True)
+        xs, ys, index, valid, connected = self._project_geodesic(
+            crs, coords[:, 0], coords[:, 1], part_index
+        )
+        breaks = np.ones(len(xs), dtype=bool)
+        breaks[1:] = ~connected
+        line_index = np.cumsum(breaks) - 1
+        keep = valid & (np.bincount(line_index)[line_index] > 1)
+        if not keep.any():
+            return [], []
+        line_index, index = line_index[keep], index[keep]
+        starts = np.flatnonzero(np.diff(line_index, prepend=-1))
+        lines = shapely.linestrings(
+            np.column_stack([xs[keep], ys[keep]]),
+            indices=np.repeat(np.arange(len(starts)), np.diff(starts, append=len(line_index)))
+        )
+        indices, line_geoms = np.unique(part_geoms[index[starts]], return_inverse=True)
+        paths = shapely.multilinestrings(lines, indices=line_geoms)
+        single = shapely.get_num_geometries(paths) == 1
+        paths[single] = shapely.get_geometry(paths[single], 0)
+        projected = [dict(geoms[i], geometry=path) for i, path in zip(indices, paths)]
+        return projected, list(indices)
+
 
 class project_shape(_project_operation):
     """Projects Shape Element from the source coordinate reference system
@@ -191,8 +302,23 @@ class project_points(_project_operation):
 
     supported_types = [Points, Nodes, HexTiles, Labels]
 
+    def _project_frame(self, element, data):
+        """Projects the point geometries of a GeoDataFrame, dropping
+        the points which fall outside the projection bounds.
+        """
+        crs, proj = element.crs, self.p.projection
+        geoms = shapely.transform(
+            np.asarray(data.geometry.values),
+            lambda coords: proj.transform_points(crs, coords[:, 0], coords[:, 1])[:, :2]
+        )
+        data = data.set_geometry(geoms).set_crs(None, allow_override=True)
+        return data[np.isfinite(shapely.bounds(geoms)).all(axis=1)]
+
     def _process_element(self, element):
-        if not len(element):
+        if element.interface is DaskGeoPandasInterface:
+            return self._project_partitions(
+                element, lambda data: self._project_frame(element, data))
+        elif not len(element):
             return element.clone(crs=self.p.projection)
         xdim, ydim = element.dimensions()[:2]
         xs, ys = (element.dimension_values(i) for i in range(2))
@@ -221,21 +347,33 @@ class project_points(_project_operation):
                              crs=self.p.projection)
 
 
-class project_geom(_project_operation):
+class project_geom(_geodesic_operation):
 
     supported_types = [Rectangles, Segments]
 
     def _process_element(self, element):
         x0d, y0d, x1d, y1d = element.kdims
         x0, y0, x1, y1 = (element.dimension_values(i) for i in range(4))
-        p1 = self.p.projection.transform_points(element.crs, x0, y0)
-        p2 = self.p.projection.transform_points(element.crs, x1, y1)
-        mask = np.isfinite(p1[:, 0]) & np.isfinite(p2[:, 0])
-        new_data = {k: v[mask] for k, v in element.columns(element.vdims).items()}
-        new_data[x0d.name] = p1[mask, 0]
-        new_data[y0d.name] = p1[mask, 1]
-        new_data[x1d.name] = p2[mask, 0]
-        new_data[y1d.name] = p2[mask, 1]
+        if self.p.geodesic and isinstance(element, Segments):
+            # Split each segment into the pieces of its geodesic
+            xs, ys, index, _, connected = self._project_geodesic(
+                element.crs, np.column_stack([x0, x1]).ravel(),
+                np.column_stack([y0, y1]).ravel(), np.repeat(np.arange(len(x0)), 2)
+            )
+            starts = np.flatnonzero(connected)
+            rows = index[starts]
+            p1 = np.column_stack([xs[starts], ys[starts]])
+            p2 = np.column_stack([xs[starts+1], ys[starts+1]])
+        else:
+            p1 = self.p.projection.transform_points(element.crs, x0, y0)
+            p2 = self.p.projection.transform_points(element.crs, x1, y1)
+            rows = np.isfinite(p1[:, 0]) & np.isfinite(p2[:, 0])
+            p1, p2 = p1[rows], p2[rows]
+        new_data = {k: v[rows] for k, v in element.columns(element.vdims).items()}
+        new_data[x0d.name] = p1[:, 0]
+        new_data[y0d.name] = p1[:, 1]
+        new_data[x1d.name] = p2[:, 0]
+        new_data[y1d.name] = p2[:, 1]
 
         if len(new_data[x0d.name]) == 0:
             element_name = type(element).__name__
@@ -300,7 +438,7 @@ class project_windbarbs(project_vectorfield):
     supported_types = [WindBarbs]
 
 
-class project_graph(_project_operation):
+class project_graph(_geodesic_operation):
 
     supported_types = [Graph]
 
@@ -308,9 +446,18 @@ class project_graph(_project_operation):
         proj = self.p.projection
         nodes = project_points(element.nodes, projection=proj)
         data = (element.data, nodes)
+        if element._has_edgepaths or self.p.geodesic:
+            edgepaths = project_path(element.edgepaths, projection=proj,
+                                     geodesic=self.p.geodesic,
+                                     geodesic_spacing=self.p.geodesic_spacing)
+            return element.clone(data + (edgepaths,), crs=proj)
+        projected = element.clone(data, crs=proj)
         if element._edgepaths:
-            data = data + (project_path(element.edgepaths, projection=proj),)
-        return element.clone(data, crs=proj)
+            # Derived edge paths are rebuilt from the projected nodes
+            projected._edgepaths = _connect_nodes(
+                projected, closed=isinstance(element, TriMesh)
+            )
+        return projected
 
 
 class project_quadmesh(_project_operation):
@@ -533,12 +680,24 @@ class project(Operation):
                                      instantiate=False, doc="""
         Projection the image type is projected to.""")
 
+    geodesic = param.Boolean(default=False, doc="""
+        Whether to draw paths, segments and graph edges along geodesics
+        (great-circle arcs) by densifying them before they are projected.""")
+
+    geodesic_spacing = param.Number(default=100e3, bounds=(0, None),
+                                    inclusive_bounds=(False, True), doc="""
+        Maximum distance (in meters) between the points interpolated
+        along geodesics.""")
+
     _operations = [project_path, project_image, project_shape,
                    project_graph, project_quadmesh, project_points,
                    project_vectorfield, project_windbarbs, project_geom]
 
     def _process(self, element, key=None):
         for op in self._operations:
-            element = element.map(op.instance(projection=self.p.projection),
-                                  op.supported_types)
+            kwargs = {'projection': self.p.projection}
+            if issubclass(op, _geodesic_operation):
+                kwargs.update(geodesic=self.p.geodesic,
+                              geodesic_spacing=self.p.geodesic_spacing)
+            element = element.map(op.instance(**kwargs), op.supported_types)
         return element
@@ -5,7 +5,12 @@ from holoviews.streams import RangeXY
 from shapely.geometry import Polygon
 from shapely.strtree import STRtree
 
-from ..util import SHAPELY_GE_2_0_0, path_to_geom_dicts, polygons_to_geom_dicts
+from ..util import (
+    SHAPELY_GE_2_0_0,
+    path_to_geom_dicts,
+    polygons_to_geom_dicts,
+    unpack_geom_columns,
+)
 
 
 def find_geom(geom, geoms):
@@ -140,11 +145,15 @@ class resample_geometry(Operation):
             cache = self._cache[element._plot_id]
             domain, tree, geom_dicts, geom_cache, area_cache = cache
         else:
-            if isinstance(element, Polygons):
-                geom_dicts = polygons_to_geom_dicts(element)
-            elif isinstance(element, Path):
-                geom_dicts = path_to_geom_dicts(element)
-            geoms = [g['geometry'] for g in geom_dicts]
+            geoms, columns = unpack_geom_columns(element)
+            if geoms is not None:
+                geom_dicts = columns
+            else:
+                if isinstance(element, Polygons):
+                    geom_dicts = polygons_to_geom_dicts(element)
+                elif isinstance(element, Path):
+                    geom_dicts = path_to_geom_dicts(element)
+                geoms = [g['geometry'] for g in geom_dicts]
             tree = STRtree(geoms)
             domain = bounds
             geom_cache, area_cache = {}, {}
@@ -159,7 +168,10 @@ class resample_geometry(Operation):
         # Query RTree, then cull and simplify polygons
         new_geoms, gdict = [], {}
         for g in tree.query(bounds):
-            g = tree.geometries[g] if SHAPELY_GE_2_0_0 else g
+            if SHAPELY_GE_2_0_0:
+                gidx, g = g, tree.geometries[g]
+            else:
+                gidx = None
             garea = area_cache.get(id(g))
             if garea is None:
                 is_poly = 'Polygon' in g.geom_type
@@ -179,8 +191,12 @@ class resample_geometry(Operation):
                 geom_dict = geom_cache[cache_id]
             else:
                 if element.vdims:
-                    gidx = find_geom(tree._geoms, g)
-                    gdict = geom_dicts[gidx]
+                    if gidx is None:
+                        gidx = find_geom(tree._geoms, g)
+                    if isinstance(geom_dicts, dict):
+                        gdict = {k: v[gidx] for k, v in geom_dicts.items()}
+                    else:
+                        gdict = geom_dicts[gidx]
 
                 g = g.simplify(tol, self.p.preserve_topology)
                 if not g:
@@ -4,7 +4,7 @@ import numpy as np
 import param
 from bokeh.models import BBoxTileSource, QUADKEYTileSource, WMTSTileSource
 from cartopy.crs import GOOGLE_MERCATOR
-from holoviews import NdOverlay, Overlay, Store
+from holoviews import HoloMap, NdOverlay, Overlay, Store
 from holoviews.core import util
 from holoviews.core.options import Compositor, Options, SkipRendering
 from holoviews.plotting.bokeh.annotation import LabelsPlot, TextPlot
@@ -14,6 +14,8 @@ from holoviews.plotting.bokeh.graphs import GraphPlot, TriMeshPlot
 from holoviews.plotting.bokeh.hex_tiles import HexTilesPlot, hex_binning
 from holoviews.plotting.bokeh.path import ContourPlot, PathPlot, PolygonPlot
 from holoviews.plotting.bokeh.raster import QuadMeshPlot, RasterPlot, RGBPlot
+from holoviews.plotting.bokeh.styles import expand_batched_style
+from holoviews.streams import RangeXY
 
 from ...element import (
     RGB,
@@ -59,7 +61,13 @@ from ...tile_sources import (
     EsriNatGeo,
     EsriWorldHillshade,
 )
-from ...util import line_types, poly_types
+from ...util import (
+    feature_geometries,
+    feature_index,
+    line_types,
+    poly_types,
+    zoom_level,
+)
 from . import callbacks  # noqa
 from .chart import WindBarbsPlot
 from .plot import GeoOverlayPlot, GeoPlot
@@ -266,12 +274,95 @@ class GeoShapePlot(GeoPolygonPlot):
         polys = el_type([element.data], crs=element.crs, **util.get_param_values(element))
         return super().get_data(polys, ranges, style)
 
+    def get_batched_data(self, element, ranges=None):
+        shapes = list(element.data.values())
+        if not shapes:
+            return super().get_batched_data(element, ranges)
+        vdims = shapes[0].vdims
+        if all(isinstance(s.data['geometry'], poly_types) for s in shapes):
+            el_type, style_opts = Polygons, self._batched_style_opts
+        elif all(isinstance(s.data['geometry'], line_types) for s in shapes):
+            el_type = Contours
+            style_opts = [opt for opt in self._batched_style_opts if not opt.startswith('fill')]
+        else:
+            el_type = None
+        if el_type is None or any(s.vdims != vdims or s.crs != shapes[0].crs for s in shapes):
+            return super().get_batched_data(element, ranges)
+
+        # Collapse the Shapes into a single element so they are
+        # projected in one call and drawn by a single glyph
+        records, styles = [], []
+        for shape, zorder in zip(shapes, self._updated_zorders(element)):
+            records.append(shape.data)
+            style = self.lookup_options(shape, 'style')
+            styles.append(style.max_cycles(len(self.ordering))[zorder])
+        geoms = el_type(records, vdims=vdims, crs=shapes[0].crs)
+
+        self.overlay_dims = {}
+        style = dict(styles[-1])
+        if el_type is Contours:
+            style['plot_method'] = 'multi_line'
+            style.pop('fill_color', None)
+            style.pop('fill_alpha', None)
+        data, mapping, style = super().get_data(geoms, ranges, style)
+        if len(data.get('xs', [])) != len(shapes):
+            # Invalid geometries were dropped, style rows would not line up
+            return super().get_batched_data(element, ranges)
+        if 'hover' in self.handles:
+            for i, kd in enumerate(element.kdims):
+                data[util.dimension_sanitizer(kd.name)] = [key[i] for key in element.data]
+        for el_style in styles:
+            sdata, smapping = expand_batched_style(el_style, style_opts, mapping, 1)
+            for k, v in sdata.items():
+                data.setdefault(k, []).extend(v)
+        mapping.update({k: v for k, v in smapping.items() if k not in mapping})
+        return data, mapping, style
+
 
 class FeaturePlot(GeoPolygonPlot):
 
     scale = param.Selector(default='110m',
-                                 objects=['10m', '50m', '110m'],
-                                 doc="The scale of the Feature in meters.")
+                                 objects=['10m', '50m', '110m', 'auto'],
+                                 doc="""
+        The scale of the Feature in meters. If set to 'auto' the scale
+        is chosen based on the zoom level of the current viewport and
+        only the geometries intersecting the viewport are rendered.""")
+
+    # Maximum zoom level each Natural Earth scale is rendered at
+    _auto_scales = [(2, '110m'), (4, '50m')]
+
+    def __init__(self, element, **params):
+        if params.get('scale') == 'auto':
+            source = element.last if isinstance(element, HoloMap) else element
+            self._viewport = RangeXY(source=source)
+        else:
+            self._viewport = None
+        super().__init__(element, **params)
+        if self._viewport is not None:
+            self._viewport.add_subscriber(self._update_viewport)
+
+    def _update_viewport(self, **kwargs):
+        """Rerenders the feature for the current viewport."""
+        element = self.current_frame
+        if element is None or 'glyph' not in self.handles:
+            return
+        self._update_glyphs(element, self.current_ranges, self.style[self.cyclic_index])
+        self.push()
+
+    def _viewport_bounds(self):
+        """Returns the current viewport in the coordinates of the feature."""
+        if self._viewport is None or None in (self._viewport.x_range, self._viewport.y_range):
+            return None
+        (x0, x1), (y0, y1) = self._viewport.x_range, self._viewport.y_range
+        return (x0, y0, x1, y1)
+
+    def _auto_scale(self):
+        bounds = self._viewport_bounds() or (-180, -90, 180, 90)
+        zoom = zoom_level(bounds, self.width or 300, self.height or 300)
+        for max_zoom, scale in self._auto_scales:
+            if zoom <= max_zoom:
+                return scale
+        return '10m'
 
     def get_extents(self, element, ranges, range_type='combined', **kwargs):
         proj = self.projection
@@ -285,21 +376,42 @@ class FeaturePlot(GeoPolygonPlot):
     def get_data(self, element, ranges, style):
         mapping = dict(self._mapping)
         if self.static_source: return {}, mapping, style
+        scale = self._auto_scale() if self.scale == 'auto' else self.scale
         if hasattr(element.data, 'with_scale'):
-            feature = element.data.with_scale(self.scale)
+            feature = element.data.with_scale(scale)
         else:
             feature = copy.copy(element.data)
-            feature.scale = self.scale
-        geoms = list(feature.geometries())
-        if isinstance(geoms[0], line_types):
+            feature.scale = scale
+        if self.scale == 'auto':
+            # Only render the geometries intersecting the viewport
+            bounds = self._viewport_bounds()
+            geoms = element.clone(feature).geoms(bounds=bounds, as_element=False)
+            projection = None
+        else:
+            # Geometries are cached already projected to the plot projection
+            projection = self.projection if self.geographic else None
+            geoms = feature_geometries(feature, projection)
+        if geoms:
+            sample = geoms[0]
+        else:
+            # Determine the geometry type without loading the feature
+            index = feature_index(feature)
+            if index is None:
+                sample = next(iter(feature.geometries()), None)
+            else:
+                sample = index[0].geometries[0] if len(index[0]) else None
+        if isinstance(sample, line_types):
             el_type = Contours
             style['plot_method'] = 'multi_line'
             style.pop('fill_color', None)
             style.pop('fill_alpha', None)
         else:
             el_type = Polygons
-        polys = el_type(geoms, crs=element.crs, **util.get_param_values(element))
-        return super().get_data(polys, ranges, style)
+        crs = element.crs if projection is None else projection
+        polys = el_type(geoms, crs=crs, **util.get_param_values(element))
+        if projection is None:
+            return super().get_data(polys, ranges, style)
+        return PolygonPlot.get_data(self, polys, ranges, style)
 
 
 
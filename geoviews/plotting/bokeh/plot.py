@@ -9,7 +9,7 @@ from holoviews.core.dimension import Dimension
 from holoviews.core.util import dimension_sanitizer, match_spec
 from holoviews.plotting.bokeh.element import ElementPlot, OverlayPlot as HvOverlayPlot
 
-from ...element import Shape, _Element, is_geographic
+from ...element import Shape, geo_metadata, is_geographic
 from ..plot import ProjectionPlot
 
 
@@ -52,6 +52,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
 
     def __init__(self, element, **params):
         super().__init__(element, **params)
+        self._init_precompute()
         self.geographic = is_geographic(self.hmap.last)
         if self.geographic and not isinstance(self.projection, (PlateCarree, Mercator)):
             self.xaxis = None
@@ -116,10 +117,17 @@ class GeoPlot(ProjectionPlot, ElementPlot):
             # other projections likely will not fall within this range
             self._unwrap_lons = -90 <= x0 <= 360 and 180 <= x1 <= 540
 
+    @property
+    def _style_element(self):
+        """The current element, or the last element of a batched NdOverlay."""
+        if self.batched and not isinstance(self, HvOverlayPlot):
+            return self.current_frame.last
+        return self.current_frame
+
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
         opts = {} if isinstance(self, HvOverlayPlot) else {'source': source}
         fig = super().initialize_plot(ranges, plot, plots, **opts)
-        style_element = self.current_frame.last if self.batched else self.current_frame
+        style_element = self._style_element
         el_ranges = match_spec(style_element, self.current_ranges) if self.current_ranges else {}
         if self.geographic and self.show_bounds and not self.overlaid:
             from . import GeoShapePlot
@@ -133,7 +141,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
 
     def update_frame(self, key, ranges=None, element=None):
         super().update_frame(key, ranges=ranges, element=element)
-        style_element = self.current_frame.last if self.batched else self.current_frame
+        style_element = self._style_element
         el_ranges = match_spec(style_element, self.current_ranges) if self.current_ranges else {}
         self._set_unwrap_lons(style_element, el_ranges)
 
@@ -161,7 +169,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
             isinstance(hover.tooltips, str) or self.projection is not GOOGLE_MERCATOR
             or hover.tooltips is None or 'hv_created' not in hover.tags):
             return
-        element = self.current_frame
+        element = self._style_element
         xdim, ydim = (dimension_sanitizer(kd.name) for kd in element.kdims)
         formatters, tooltips = dict(hover.formatters), []
         xhover = CustomJSHover(code=self._hover_code % 0)
@@ -199,7 +207,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
 
     def get_data(self, element, ranges, style):
         if self._project_operation and self.geographic:
-            element = self._project_operation(element, projection=self.projection)
+            element = self._project(element)
         return super().get_data(element, ranges, style)
 
 
@@ -216,6 +224,7 @@ class GeoOverlayPlot(GeoPlot, HvOverlayPlot):
 
     def __init__(self, element, **params):
         super().__init__(element, **params)
-        self.geographic = any(element.traverse(is_geographic, [_Element]))
+        self.geographic = geo_metadata(element)[0]
         if self.geographic:
             self.show_grid = False
+        self._propagate_precompute()
@@ -4,6 +4,7 @@ import matplotlib.ticker as mticker
 import numpy as np
 import param
 from cartopy import crs as ccrs
+from cartopy.feature import AdaptiveScaler, NaturalEarthFeature, ShapelyFeature
 from cartopy.io.img_tiles import GoogleTiles, QuadtreeTiles
 from cartopy.mpl.gridliner import LATITUDE_FORMATTER, LONGITUDE_FORMATTER
 
@@ -12,7 +13,7 @@ try:
 except ImportError:
     WebMapTileService = None
 
-from holoviews.core import Element, HoloMap, Layout, NdLayout, Overlay, Store, util
+from holoviews.core import HoloMap, Layout, NdLayout, Overlay, Store, util
 from holoviews.core.data import GridInterface
 from holoviews.core.options import Options, SkipRendering
 from holoviews.plotting.mpl import (
@@ -63,6 +64,7 @@ from ...element import (
     TriMesh,
     VectorField,
     WindBarbs,
+    geo_metadata,
     is_geographic,
 )
 from ...operation import (
@@ -74,7 +76,7 @@ from ...operation import (
     project_vectorfield,
     project_windbarbs,
 )
-from ...util import geo_mesh, poly_types
+from ...util import feature_geometries, geo_mesh, poly_types
 from ..plot import ProjectionPlot
 from .chart import WindBarbsPlot
 
@@ -104,10 +106,12 @@ class GeoOverlayPlot(ProjectionPlot, HvOverlayPlot):
 
     def __init__(self, element, **params):
         super().__init__(element, **params)
+        self._init_precompute()
         plot_opts = self.lookup_options(self.hmap.last, 'plot').options
-        self.geographic = any(self.hmap.traverse(is_geographic, [Element]))
+        self.geographic = geo_metadata(self.hmap)[0]
         if 'aspect' not in plot_opts and self.geographic:
             self.aspect = 'equal'
+        self._propagate_precompute()
 
     def _finalize_axis(self, *args, **kwargs):
         gridlabels = self.geographic and isinstance(self.projection, (ccrs.PlateCarree, ccrs.Mercator))
@@ -150,6 +154,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
             el = element.last if isinstance(element, HoloMap) else element
             params['projection'] = el.crs
         super().__init__(element, **params)
+        self._init_precompute()
         plot_opts = self.lookup_options(self.hmap.last, 'plot').options
         self.geographic = is_geographic(self.hmap.last)
         if 'aspect' not in plot_opts:
@@ -234,7 +239,7 @@ class GeoPlot(ProjectionPlot, ElementPlot):
 
     def get_data(self, element, ranges, style):
         if self._project_operation and self.geographic:
-            element = self._project_operation(element, projection=self.projection)
+            element = self._project(element)
         return super().get_data(element, ranges, style)
 
     def teardown_handles(self):
@@ -278,7 +283,7 @@ class GeoQuadMeshPlot(GeoPlot, QuadMeshPlot):
 
     def get_data(self, element, ranges, style):
         if self._project_operation and self.geographic:
-            element = self._project_operation(element, projection=self.projection)
+            element = self._project(element)
         return super(GeoPlot, self).get_data(element, ranges, style)
 
 
@@ -419,7 +424,14 @@ class GeoShapePlot(GeometryPlot, PolygonPlot):
 
     apply_ranges = param.Boolean(default=True)
 
+    _plot_methods = dict(single='add_geometries', batched='add_geometries')
+
+    # Style options which may vary between the Shapes of a batched plot
+    _batched_style_opts = ['facecolor', 'edgecolor', 'linewidth', 'linestyle', 'alpha']
+
     def get_data(self, element, ranges, style):
+        if self.batched:
+            return self.get_batched_data(element, ranges, style)
         if self.geographic:
             if not isinstance(element.data['geometry'], poly_types):
                 style['facecolor'] = 'none'
@@ -434,6 +446,38 @@ class GeoShapePlot(GeometryPlot, PolygonPlot):
             SkipRendering('Shape can only be plotted on geographic plot, '
                           'supply a coordinate reference system.')
 
+    def get_batched_data(self, element, ranges, style):
+        """Draws all Shapes in an NdOverlay with a single artist,
+        expanding the styles of each Shape into per-geometry lists.
+        """
+        shapes = list(element.data.values())
+        geoms, styles = [], {opt: [] for opt in self._batched_style_opts}
+        for shape, zorder in zip(shapes, self._updated_zorders(element)):
+            el_style = self.lookup_options(shape, 'style').max_cycles(len(self.ordering))[zorder]
+            geom = shape.data['geometry']
+            if not isinstance(geom, poly_types):
+                el_style['facecolor'] = 'none'
+            geoms.append(geom)
+            for opt, values in styles.items():
+                values.append(el_style.get(opt))
+        style = dict(style, **{opt: values for opt, values in styles.items()
+                               if None not in values})
+
+        vdim = shapes[0].vdims[0] if shapes and shapes[0].vdims else None
+        if vdim is not None:
+            values = np.array([shape.data.get(vdim.name, np.nan) for shape in shapes], dtype=float)
+            if np.isfinite(values).any():
+                # Ranges are matched to the last Shape, normalize over all Shapes
+                vrange = util.dimension_range(np.nanmin(values), np.nanmax(values),
+                                              vdim.range, vdim.soft_range)
+                ranges = dict(ranges, **{vdim.name: dict(ranges.get(vdim.name, {}), combined=vrange)})
+                self._norm_kwargs(element.last, ranges, style, vdim, values=values)
+                style['clim'] = style.pop('vmin'), style.pop('vmax')
+                style['array'] = values
+                style.pop('facecolor', None)
+        crs = shapes[0].crs if shapes else ccrs.PlateCarree()
+        return (geoms, crs), style, {}
+
 
 class GeoGraphPlot(GeoPlot, GraphPlot):
 
@@ -458,18 +502,27 @@ class FeaturePlot(GeoPlot):
     """Draws a feature from a Features Element."""
 
     scale = param.Selector(default='110m',
-                                 objects=['10m', '50m', '110m'],
-                                 doc="The scale of the Feature in meters.")
+                                 objects=['10m', '50m', '110m', 'auto'],
+                                 doc="""
+        The scale of the Feature in meters. If set to 'auto' the scale
+        is chosen based on the extent of the axes when drawn.""")
 
     style_opts = ['alpha', 'facecolor', 'edgecolor', 'linestyle', 'linewidth',
                   'visible']
 
     def get_data(self, element, ranges, style):
+        if self.scale == 'auto' and hasattr(element.data, 'with_scale'):
+            scaler = AdaptiveScaler('110m', (('50m', 50), ('10m', 15)))
+            return (element.data.with_scale(scaler),), style, {}
+        scale = '110m' if self.scale == 'auto' else self.scale
         if hasattr(element.data, 'with_scale'):
-            feature = element.data.with_scale(self.scale)
+            feature = element.data.with_scale(scale)
         else:
             feature = copy.copy(element.data)
-            feature.scale = self.scale
+            feature.scale = scale
+        if isinstance(feature, NaturalEarthFeature):
+            geoms = feature_geometries(feature)
+            feature = ShapelyFeature(geoms, feature.crs, **feature.kwargs)
         return (feature,), style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
@@ -1,9 +1,24 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import param
-from holoviews.core import CompositeOverlay, Element
+from holoviews.core import CompositeOverlay, DynamicMap, Element
+from holoviews.plotting.util import get_plot_frame
 
 from ..util import project_extents
 
+# Number of threads used to precompute projected frames
+PRECOMPUTE_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=1)
+def _get_frame_executor():
+    """Returns the thread pool shared by all plots precomputing frames."""
+    return ThreadPoolExecutor(PRECOMPUTE_WORKERS, thread_name_prefix='geoviews-precompute')
+
 
 def _get_projection(el):
     """Get coordinate reference system from non-auxiliary elements.
@@ -25,6 +40,15 @@ class ProjectionPlot(param.Parameterized):
     infer_projection = param.Boolean(default=True, doc="""
         Whether the projection should be inferred from the element crs.""")
 
+    precompute_frames = param.ClassSelector(default=False, class_=(bool, int), doc="""
+        Whether to project the frames of a HoloMap in a background
+        thread pool, so that moving the slider only swaps in prepared
+        data. If True all frames are precomputed, if an integer N only
+        the N frames on either side of the current frame.""")
+
+    frame_cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        Maximum number of precomputed frames to keep in memory.""")
+
     def _get_projection(self, obj):
         # Look up custom projection in options
         isoverlay = lambda x: isinstance(x, CompositeOverlay)
@@ -69,3 +93,95 @@ class ProjectionPlot(param.Parameterized):
         else:
             extents = project_extents(extents, element.crs, proj)
         return (np.nan,)*4 if not extents else extents
+
+    def _init_precompute(self):
+        """Validates the frame precomputation options and initializes
+        the cache of precomputed frames.
+        """
+        if self.precompute_frames is not True and self.precompute_frames < 0:
+            raise ValueError(
+                'precompute_frames must be a boolean or a non-negative '
+                f'integer, got {self.precompute_frames}.'
+            )
+        self._precomputed_frames = OrderedDict()
+
+    def _propagate_precompute(self):
+        """Passes the frame precomputation options of an overlay on
+        to the plots of its layers.
+        """
+        if not self.precompute_frames:
+            return
+        for subplot in self.subplots.values():
+            if isinstance(subplot, ProjectionPlot):
+                subplot.precompute_frames = self.precompute_frames
+                subplot.frame_cache_size = self.frame_cache_size
+                if getattr(subplot, 'subplots', None):
+                    subplot._propagate_precompute()
+
+    def _project(self, element):
+        """Projects the element, reusing the projection precomputed in
+        the background when precompute_frames is enabled.
+        """
+        if (not self.precompute_frames or isinstance(self.hmap, DynamicMap)
+            or self.current_key is None):
+            return self._project_operation(element, projection=self.projection)
+
+        key = self.current_key
+        self._precompute(key)
+        cache = self._precomputed_frames
+        if key in cache and cache[key][0] is element:
+            # Errors are raised by projecting again below
+            try:
+                return cache[key][1].result()
+            except Exception:
+                pass
+        projected = self._projector()(element)
+        future = Future()
+        future.set_result(projected)
+        cache[key] = (element, future)
+        cache.move_to_end(key)
+        self._evict_frames()
+        return projected
+
+    def _projector(self):
+        """Returns a new instance of the project operation, so frames
+        can be projected concurrently.
+        """
+        op = self._project_operation
+        if isinstance(op, param.parameterized.ParameterizedFunction):
+            params = dict(op.param.values(onlychanged=True), projection=self.projection)
+            params.pop('name', None)
+            return type(op).instance(**params)
+        return op.instance(projection=self.projection)
+
+    def _precompute(self, key):
+        """Submits the frames around the supplied key which have not
+        been projected yet to the background thread pool.
+        """
+        if key not in self.keys:
+            return
+        index = self.keys.index(key)
+        n = len(self.keys) if self.precompute_frames is True else self.precompute_frames
+        window = range(max(index-n, 0), min(index+n+1, len(self.keys)))
+        window = sorted(window, key=lambda i: abs(i-index))[:self.frame_cache_size]
+        cache, dims = self._precomputed_frames, [d.name for d in self.dimensions]
+        # Submit the nearest frames first and keep them most recent
+        for i in window[1:]:
+            frame_key = self.keys[i]
+            if frame_key in cache:
+                continue
+            frame = get_plot_frame(self.hmap, dict(zip(dims, frame_key)))
+            if frame is None:
+                continue
+            future = _get_frame_executor().submit(self._projector(), frame)
+            cache[frame_key] = (frame, future)
+        for i in window[::-1]:
+            if self.keys[i] in cache:
+                cache.move_to_end(self.keys[i])
+        self._evict_frames()
+
+    def _evict_frames(self):
+        cache = self._precomputed_frames
+        while len(cache) > self.frame_cache_size:
+            _, (_, future) = cache.popitem(last=False)
+            future.cancel()
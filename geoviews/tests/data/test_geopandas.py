@@ -212,3 +212,68 @@ class GeoPandasInterfaceTest(GeomInterfaceTest, GeomTests, RoundTripTests):
         )
         gdf = geopandas.GeoDataFrame(df, geometry=geopandas.points_from_xy(df.x, df.y))
         render(Points(gdf))
+
+    def test_array_list_constructor_matches_dict(self):
+        arrays = [np.array([(1+i, i, i), (2+i, i, i), (3+i, i, i)]) for i in range(2)]
+        path = Path(arrays, kdims=['x', 'y'], vdims=['z'], datatype=[self.datatype])
+        assert path.interface is self.interface
+        expected = Path([{'x': arr[:, 0], 'y': arr[:, 1], 'z': arr[0, 2]} for arr in arrays],
+                        kdims=['x', 'y'], vdims=['z'], datatype=[self.datatype])
+        assert_element_equal(path, expected)
+        assert list(path.data.z) == [0, 1]
+
+    def test_multi_point_iloc_rows(self):
+        gdf = geopandas.GeoDataFrame({
+            'v': [1, 2, 3],
+            'geometry': [sgeom.MultiPoint([(0, 0), (1, 1)]),
+                         sgeom.MultiPoint([(2, 2), (3, 3), (4, 4)]),
+                         sgeom.MultiPoint([(5, 5)])]
+        }, index=[5, 6, 7])
+        points = Points(gdf, ['x', 'y'], 'v')
+        assert list(points.iloc[3].data.geometry.to_wkt()) == ['POINT (3 3)']
+        sliced = points.iloc[1:4].data
+        assert list(sliced.geometry.to_wkt()) == ['MULTIPOINT ((1 1))', 'MULTIPOINT ((2 2), (3 3))']
+        assert list(sliced.v) == [1, 2]
+        selected = points.iloc[[4, 0, 1, 3]].data
+        assert list(selected.geometry.to_wkt()) == ['MULTIPOINT ((0 0), (1 1))', 'MULTIPOINT ((4 4), (3 3))']
+        assert list(selected.v) == [1, 2]
+
+    def test_has_holes(self):
+        poly = Polygons([{'x': [1, 2, 3], 'y': [2, 0, 7]}], datatype=[self.datatype])
+        assert not poly.interface.has_holes(poly)
+        holes = [[[(1.5, 2), (2, 3), (1.6, 1.6)]]]
+        poly = Polygons([{'x': [1, 2, 3], 'y': [2, 0, 7], 'holes': holes}], datatype=[self.datatype])
+        assert poly.interface.has_holes(poly)
+
+    def test_sample_intersecting_geometries(self):
+        gdf = geopandas.GeoDataFrame({
+            'z': [1, 2], 'geometry': [sgeom.box(0, 0, 1, 1), sgeom.box(5, 5, 6, 6)]
+        })
+        poly = Polygons(gdf, vdims=['z'])
+        sampled = poly.interface.sample(poly, [(0.5, 0.5), (5.5, 5.5), (9, 9)])
+        assert_data_equal(sampled['x'], np.array([0.5, 5.5]))
+        assert_data_equal(sampled['z'], np.array([1, 2]))
+
+    def test_aggregate_non_geometry_dimension(self):
+        gdf = geopandas.GeoDataFrame({
+            'z': [1, 1, 2], 'v': [1., 2., 3.],
+            'geometry': [sgeom.box(0, 0, 1, 1), sgeom.box(1, 0, 2, 1), sgeom.box(5, 5, 6, 6)]
+        })
+        ds = Dataset(gdf, kdims=['x', 'y', 'z'], vdims=['v'])
+        aggregated = ds.aggregate('z', np.sum)
+        assert_data_equal(aggregated.dimension_values('z'), np.array([1, 2]))
+        assert_data_equal(aggregated.dimension_values('v'), np.array([3., 3.]))
+
+    def test_dynamic_conversion_groupby(self):
+        from holoviews import DynamicMap
+
+        import geoviews as gv
+        gdf = geopandas.GeoDataFrame({
+            'z': [1, 1, 2], 'v': [1., 2., 3.],
+            'geometry': [sgeom.box(0, 0, 1, 1), sgeom.box(1, 0, 2, 1), sgeom.box(5, 5, 6, 6)]
+        })
+        dmap = gv.Dataset(gdf, kdims=['z'], vdims=['v']).to(gv.Polygons, groupby='z', dynamic=True)
+        assert isinstance(dmap, DynamicMap)
+        assert isinstance(dmap[2], gv.Polygons)
+        assert list(dmap[2].data.v) == [3.]
+        assert list(dmap[1].data.v) == [1., 2.]
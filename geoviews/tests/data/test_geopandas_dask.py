@@ -0,0 +1,93 @@
+"""
+Test for the DaskGeoPandasInterface
+"""
+import numpy as np
+import pytest
+from shapely import geometry as sgeom
+
+try:
+    import dask_geopandas
+    import geopandas
+except ImportError:
+    dask_geopandas = None
+
+import cartopy.crs as ccrs
+from holoviews.util.transform import dim as hv_dim
+
+from geoviews.data import DaskGeoPandasInterface
+from geoviews.element import Points, Polygons
+from geoviews.operation import project
+
+
+@pytest.mark.skipif(dask_geopandas is None, reason="dask-geopandas is not available")
+class TestDaskGeoPandasInterface:
+
+    def setup_method(self):
+        self.gdf = geopandas.GeoDataFrame({
+            'value': np.arange(8.),
+            'geometry': [sgeom.box(i, i, i+1, i+1) for i in range(8)],
+        })
+        self.ddf = dask_geopandas.from_geopandas(self.gdf, npartitions=4)
+
+    def test_polygons_interface(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        assert polys.interface is DaskGeoPandasInterface
+        assert len(polys) == 8
+
+    def test_points_interface(self):
+        gdf = geopandas.GeoDataFrame({'value': [1, 2, 3]}, geometry=[
+            sgeom.Point(0, 1), sgeom.Point(1, 2), sgeom.Point(2, 3)
+        ])
+        points = Points(dask_geopandas.from_geopandas(gdf, npartitions=2), vdims=['value'])
+        assert points.interface is DaskGeoPandasInterface
+        np.testing.assert_equal(points.dimension_values(1), [1, 2, 3])
+
+    def test_values_match_geopandas(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        expected = Polygons(self.gdf, vdims=['value'])
+        for dim in ['Longitude', 'Latitude', 'value']:
+            np.testing.assert_equal(polys.dimension_values(dim), expected.dimension_values(dim))
+        np.testing.assert_equal(polys.dimension_values('value', expanded=False), np.arange(8.))
+
+    def test_range(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        assert polys.range('Longitude') == (0, 8)
+        assert polys.range('value') == (0, 7)
+
+    def test_range_spatial_partitions(self):
+        self.ddf.calculate_spatial_partitions()
+        polys = Polygons(self.ddf, vdims=['value'])
+        assert polys.range('Latitude') == (0, 8)
+
+    def test_select_prunes_spatial_partitions(self):
+        self.ddf.calculate_spatial_partitions()
+        polys = Polygons(self.ddf, vdims=['value'])
+        selected = polys.interface.select(polys, Longitude=slice(2.5, 4.5), Latitude=slice(2.5, 4.5))
+        assert selected.npartitions == 2
+        np.testing.assert_equal(selected['value'].compute().values, [2., 3., 4.])
+
+    def test_select_value(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        selected = polys.select(value=(2, 5))
+        assert selected.interface is DaskGeoPandasInterface
+        np.testing.assert_equal(selected.dimension_values('value', expanded=False), [2., 3., 4.])
+
+    def test_select_mask_per_partition(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        mask = np.arange(8) % 3 == 0
+        selected = polys.interface.select(polys, selection_mask=mask)
+        assert selected.npartitions == 4
+        np.testing.assert_equal(selected['value'].compute().values, [0., 3., 6.])
+
+    def test_select_expr(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        selected = polys.select(selection_expr=hv_dim('value') > 5)
+        assert selected.interface is DaskGeoPandasInterface
+        np.testing.assert_equal(selected.dimension_values('value', expanded=False), [6., 7.])
+
+    def test_project_path_lazy(self):
+        polys = Polygons(self.ddf, vdims=['value'])
+        projected = project(polys, projection=ccrs.GOOGLE_MERCATOR)
+        expected = project(Polygons(self.gdf, vdims=['value']), projection=ccrs.GOOGLE_MERCATOR)
+        assert projected.interface is DaskGeoPandasInterface
+        np.testing.assert_allclose(projected.dimension_values(0), expected.dimension_values(0))
@@ -7,7 +7,7 @@ except ImportError:
     pytest.skip("Could not import iris, skipping IrisInterface tests.", allow_module_level=True)
 
 from holoviews.core.data import Dataset, concat
-from holoviews.core.spaces import HoloMap
+from holoviews.core.spaces import DynamicMap, HoloMap
 from holoviews.element import Image
 from holoviews.testing import assert_data_equal
 from holoviews.tests.core.data.test_gridinterface import BaseGridInterfaceTests
@@ -15,7 +15,7 @@ from holoviews.tests.core.data.test_imageinterface import BaseImageElementInterf
 from iris.exceptions import MergeError
 from iris.tests.stock import lat_lon_cube
 
-from geoviews.data.iris import coord_to_dimension
+from geoviews.data.iris import CubeInterface, coord_to_dimension
 
 
 class IrisInterfaceTests(BaseGridInterfaceTests):
@@ -67,33 +67,9 @@ class IrisInterfaceTests(BaseGridInterfaceTests):
     def test_dataset_sort_vdim_hm_alias(self):
         pytest.skip("Not supported")
 
-    def test_dataset_1D_reduce_hm(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_1D_reduce_hm_alias(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_2D_reduce_hm(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_2D_reduce_hm_alias(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_2D_aggregate_partial_hm(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_2D_aggregate_partial_hm_alias(self):
-        pytest.skip("Not supported")
-
     def test_aggregate_2d_with_spreadfn(self):
         pytest.skip("Not supported")
 
-    def test_dataset_sample_hm(self):
-        pytest.skip("Not supported")
-
-    def test_dataset_sample_hm_alias(self):
-        pytest.skip("Not supported")
-
     def test_dataset_groupby_drop_dims_with_vdim(self):
         pytest.skip("Not supported")
 
@@ -147,6 +123,49 @@ class IrisInterfaceTests(BaseGridInterfaceTests):
         cube = Dataset(self.cube, kdims=['longitude', 'latitude'])
         assert cube.range('unknown') == (0, 11)
 
+    def test_range_vdim_lazy(self):
+        cube = Dataset(self.cube.copy(data=self.cube.lazy_data()))
+        assert cube.range('unknown') == (0, 11)
+        assert cube.data.has_lazy_data()
+
+    def test_range_vdim_lazy_sampled(self, monkeypatch):
+        monkeypatch.setattr(CubeInterface, 'range_sample', 4)
+        cube = Dataset(self.cube.copy(data=self.cube.lazy_data()))
+        assert cube.range('unknown') == (0, 10)
+
+    def test_range_vdim_lazy_cached_per_cube(self):
+        from geoviews.data.iris import _range_cache
+
+        cube = self.cube.copy(data=self.cube.lazy_data())
+        assert Dataset(cube).range('unknown') == (0, 11)
+        assert cube in _range_cache
+        cube.data = cube.lazy_data() * 2
+        assert Dataset(cube).range('unknown') == (0, 22)
+
+    def test_reduce_lazy(self):
+        cube = Dataset(self.cube.copy(data=self.cube.lazy_data()), kdims=['longitude', 'latitude'])
+        reduced = cube.reduce(latitude=np.mean)
+        assert reduced.data.has_lazy_data()
+        assert_data_equal(reduced.dimension_values('unknown'),
+                         np.array([4., 5., 6., 7.]))
+
+    def test_aggregate_custom_reducer(self):
+        def spread(values):
+            return values.max() - values.min()
+
+        cube = Dataset(self.cube, kdims=['longitude', 'latitude'])
+        aggregated = cube.aggregate('longitude', spread)
+        assert aggregated.vdims == cube.vdims
+        assert_data_equal(aggregated.dimension_values('unknown'),
+                          np.array([8, 8, 8, 8], dtype=np.int32))
+
+    def test_sample_linear(self, monkeypatch):
+        monkeypatch.setattr(CubeInterface, 'sample_scheme', 'linear')
+        cube = Dataset(self.cube.copy(data=self.cube.data.astype('float')),
+                       kdims=['longitude', 'latitude'])
+        sampled = cube.interface.sample(cube, [(0.5, 0), (-1, 0.5)])
+        assert_data_equal(sampled['unknown'], np.array([5.5, 6.]))
+
     def test_select_index(self):
         cube = Dataset(self.cube)
         assert_data_equal(cube.select(longitude=0).data.data,
@@ -178,6 +197,31 @@ class IrisInterfaceTests(BaseGridInterfaceTests):
                                      latitude={0, 2}).data.data,
                          np.array([[5, 7]], dtype=np.int32))
 
+    def test_select_slice_lazy(self):
+        cube = self.cube.copy(data=self.cube.lazy_data())
+        selected = Dataset(cube).select(longitude=(0, 1.01))
+        assert selected.data.has_lazy_data()
+        assert_data_equal(selected.data.data,
+                         np.array([[1,  2], [5,  6], [9, 10]], dtype=np.int32))
+
+    def test_select_slice_descending_coord(self):
+        cube = Dataset(self.cube[::-1])
+        assert_data_equal(cube.select(latitude=(0, 10)).data.data,
+                         np.array([[8,  9, 10, 11], [4,  5,  6,  7]], dtype=np.int32))
+
+    def test_groupby_dynamic_container(self):
+        cube = Dataset(self.cube.copy(data=self.cube.lazy_data()))
+        dmap = cube.groupby('longitude', container_type=DynamicMap)
+        assert isinstance(dmap, DynamicMap)
+        assert dmap.kdims[0].values == [-1, 0, 1, 2]
+        group = dmap[1]
+        assert group.data.has_lazy_data()
+        assert_data_equal(group.dimension_values('unknown'),
+                         np.array([2, 6, 10], dtype=np.int32))
+        hmap = cube.groupby('longitude')
+        assert_data_equal(hmap[1].dimension_values('unknown'),
+                         group.dimension_values('unknown'))
+
     def test_getitem_index(self):
         cube = Dataset(self.cube)
         assert_data_equal(cube[0].data.data,
@@ -249,23 +293,5 @@ class ImageElement_IrisInterfaceTests(BaseImageElementInterfaceTests):
     def test_slice_datetime_yaxis(self):
         pytest.skip("Not supported")
 
-    def test_reduce_to_scalar(self):
-        pytest.skip("Not supported")
-
-    def test_reduce_x_dimension(self):
-        pytest.skip("Not supported")
-
-    def test_reduce_y_dimension(self):
-        pytest.skip("Not supported")
-
     def test_aggregate_with_spreadfn(self):
         pytest.skip("Not supported")
-
-    def test_sample_datetime_xaxis(self):
-        pytest.skip("Not supported")
-
-    def test_sample_datetime_yaxis(self):
-        pytest.skip("Not supported")
-
-    def test_sample_coords(self):
-        pytest.skip("Not supported")
@@ -125,6 +125,43 @@ class MultiGeomInterfaceTest(GeomInterfaceTest):
 
     __test__ = True
 
+    def test_geom_dict_sample(self):
+        geom = {'geometry': sgeom.LineString([(0, 0), (1, 1), (2, 0)]), 'z': 1}
+        ds = Dataset(geom, kdims=['x', 'y'], vdims=['z'], datatype=['geom_dictionary'])
+        sampled = ds.interface.sample(ds, [(0.5, 0.5), (1.5, 0.5), (3, 3)])
+        assert_data_equal(sampled['x'], np.array([0.5, 1.5]))
+        assert_data_equal(sampled['y'], np.array([0.5, 0.5]))
+        assert_data_equal(sampled['z'], np.array([1, 1]))
+
+    def test_geom_dict_aggregate(self):
+        geom = {'geometry': sgeom.LineString([(0, 0), (1, 1), (2, 0)]),
+                'z': np.array([1., 2., 3.])}
+        ds = Dataset(geom, kdims=['x', 'y'], vdims=['z'], datatype=['geom_dictionary'])
+        assert ds.aggregate([], np.mean) == 2
+        with pytest.raises(DataError):
+            ds.aggregate(['x'], np.mean)
+
+    def test_geom_dict_sample_nearest_vertex(self):
+        geom = {'geometry': sgeom.Polygon([(0, 0), (2, 2), (4, 0)]),
+                'z': np.array([1., 2., 3., 1.])}
+        ds = Dataset(geom, kdims=['x', 'y'], vdims=['z'], datatype=['geom_dictionary'])
+        sampled = ds.interface.sample(ds, [(0.5, 0.2), (3.5, 0.2), (5, 5)])
+        assert_data_equal(sampled['x'], np.array([0.5, 3.5]))
+        assert_data_equal(sampled['z'], np.array([1., 3.]))
+
+    def test_geom_dict_concat(self):
+        datasets = [
+            ((), Dataset({'geometry': sgeom.box(0, 0, 1, 1), 'z': 1}, kdims=['x', 'y'],
+                         vdims=['z'], datatype=['geom_dictionary'])),
+            ((), Dataset({'geometry': sgeom.box(2, 2, 3, 3), 'z': 1}, kdims=['x', 'y'],
+                         vdims=['z'], datatype=['geom_dictionary'])),
+        ]
+        concatenated = GeomDictInterface.concat(datasets, [], [])
+        assert concatenated['z'] == 1
+        assert concatenated['geometry'].equals(
+            sgeom.MultiPolygon([sgeom.box(0, 0, 1, 1), sgeom.box(2, 2, 3, 3)])
+        )
+
 
 class SpatialPandasGeomInterfaceTest(GeomInterfaceTest):
 
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+import cartopy.feature as cf
+import pytest
+from shapely import geometry as sgeom
+
+import geoviews as gv
+from geoviews import util as gv_util
+
+from .test_bokeh_plot import TestBokehPlot, bokeh_renderer
+
+
+class TestFeaturePlot(TestBokehPlot):
+
+    @pytest.fixture(autouse=True)
+    def _geometries(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(gv_util, 'FEATURE_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(gv_util, '_feature_cache', OrderedDict())
+        monkeypatch.setattr(gv_util, '_feature_index_cache', OrderedDict())
+        geoms = {
+            '110m': [sgeom.box(-170, -80, 170, 80)],
+            '50m': [sgeom.box(x, 0, x+10, 10) for x in range(-180, 180, 10)],
+            '10m': [sgeom.box(x, 0, x+1, 1) for x in range(-180, 180)],
+        }
+        monkeypatch.setattr(cf.NaturalEarthFeature, 'geometries',
+                            lambda self: iter(geoms[self.scale]))
+
+    def test_feature_auto_scale(self):
+        feature = gv.Feature(cf.NaturalEarthFeature('physical', 'land', '110m'))
+        plot = bokeh_renderer.get_plot(feature.opts(scale='auto', width=400, height=400))
+        assert len(plot.handles['source'].data['xs']) == 1
+
+        # Switches to 50m and culls boxes outside the viewport
+        plot._viewport.event(x_range=(0.5, 19.5), y_range=(0.5, 4.5))
+        assert len(plot.handles['source'].data['xs']) == 2
+
+        # Switches to 10m once zoomed in further
+        plot._viewport.event(x_range=(0.5, 4.5), y_range=(0.5, 4.5))
+        assert len(plot.handles['source'].data['xs']) == 5
+
+    def test_feature_auto_scale_empty_viewport(self):
+        feature = gv.Feature(cf.NaturalEarthFeature('physical', 'land', '110m'))
+        plot = bokeh_renderer.get_plot(feature.opts(scale='auto', width=400, height=400))
+        plot._viewport.event(x_range=(0.5, 4.5), y_range=(-40.5, -36.5))
+        assert len(plot.handles['source'].data['xs']) == 0
+
+    def test_feature_fixed_scale_not_culled(self):
+        feature = gv.Feature(cf.NaturalEarthFeature('physical', 'land', '110m'))
+        plot = bokeh_renderer.get_plot(feature.opts(scale='10m'))
+        assert plot._viewport is None
+        assert len(plot.handles['source'].data['xs']) == 360
@@ -0,0 +1,22 @@
+import cartopy.crs as ccrs
+import numpy as np
+
+import geoviews as gv
+
+from .test_bokeh_plot import TestBokehPlot, bokeh_renderer
+
+
+class TestTriMeshPlot(TestBokehPlot):
+
+    def test_projected_trimesh_edgepaths(self):
+        nodes = gv.Nodes([(0, 0, 0), (10, 10, 1), (20, 0, 2), (30, 10, 3)])
+        trimesh = gv.TriMesh(([(0, 1, 2), (1, 2, 3)], nodes))
+        plot = bokeh_renderer.get_plot(trimesh.opts(projection=ccrs.Robinson()))
+        data = plot.handles['multi_line_1_source'].data
+        assert len(data['xs']) == 2
+        # Each triangle is drawn as a closed path of the projected nodes
+        projected = ccrs.Robinson().transform_points(
+            ccrs.PlateCarree(), np.array([0., 10, 20, 0]), np.array([0., 10, 0, 0])
+        )
+        np.testing.assert_allclose(data['xs'][0], projected[:, 0])
+        np.testing.assert_allclose(data['ys'][0], projected[:, 1])
@@ -1,7 +1,13 @@
+from concurrent.futures import wait
+
+import numpy as np
+import pytest
 import pyviz_comms as comms
+from holoviews import HoloMap
 from holoviews.plotting.bokeh.element import ElementPlot
 from param import concrete_descendents
 
+import geoviews as gv
 from geoviews import Store
 
 bokeh_renderer = Store.renderers['bokeh']
@@ -24,3 +30,43 @@ class TestBokehPlot:
         bokeh_renderer.comm_manager = self.comm_manager
         for plot, padding in self._padding.items():
             plot.padding = padding
+
+
+class TestGeoPlotPrecompute(TestBokehPlot):
+
+    def _hmap(self):
+        return HoloMap({i: gv.Points([(i, 0), (i, 10)]) for i in range(10)})
+
+    def test_precompute_neighboring_frames(self):
+        plot = bokeh_renderer.get_plot(self._hmap().opts(precompute_frames=1))
+        plot.update((4,))
+        cache = plot._precomputed_frames
+        assert {(3,), (4,), (5,)} <= set(cache)
+        wait([future for _, future in cache.values()])
+        projected = cache[(5,)][1].result()
+        plot.update((5,))
+        assert cache[(5,)][1].result() is projected
+        np.testing.assert_equal(plot.handles['source'].data['Longitude'],
+                                projected.dimension_values(0))
+
+    def test_precompute_precomputed_frames_bounded(self):
+        plot = bokeh_renderer.get_plot(self._hmap().opts(precompute_frames=True, frame_cache_size=3))
+        assert len(plot._precomputed_frames) == 3
+        plot.update((0,))
+        assert sorted(key for key, in plot._precomputed_frames) == [0, 1, 2]
+
+    def test_precompute_propagated_to_overlay_layers(self):
+        overlay = (self._hmap() * gv.Points([(0, 0)])).opts(precompute_frames=2)
+        plot = bokeh_renderer.get_plot(overlay)
+        subplot = next(iter(plot.subplots.values()))
+        assert subplot.precompute_frames == 2
+        assert {(0,), (1,), (2,)} <= set(subplot._precomputed_frames)
+
+    def test_precompute_negative_frames_raises(self):
+        with pytest.raises(ValueError, match='non-negative integer'):
+            bokeh_renderer.get_plot(self._hmap().opts(precompute_frames=-1))
+
+    def test_precompute_disabled_by_default(self):
+        plot = bokeh_renderer.get_plot(self._hmap())
+        plot.update((4,))
+        assert len(plot._precomputed_frames) == 0
@@ -0,0 +1,30 @@
+from holoviews import NdOverlay
+from shapely.geometry import LineString, box
+
+import geoviews as gv
+
+from .test_bokeh_plot import TestBokehPlot, bokeh_renderer
+
+
+class TestShapePlot(TestBokehPlot):
+
+    def test_batched_shapes_single_glyph(self):
+        shapes = NdOverlay({
+            i: gv.Shape({'geometry': box(i, 0, i+1, 1), 'value': i}, vdims=['value'])
+            for i in range(30)
+        }, kdims=['id']).opts('Shape', color='value', tools=['hover'])
+        plot = bokeh_renderer.get_plot(shapes)
+        assert plot.batched
+        subplot = next(iter(plot.subplots.values()))
+        data = subplot.handles['source'].data
+        assert len(data['xs']) == 30
+        assert list(data['id']) == list(range(30))
+        assert list(data['value']) == list(range(30))
+        assert len(plot.state.renderers) == 1
+
+    def test_batched_line_shapes(self):
+        shapes = NdOverlay({i: gv.Shape(LineString([(i, 0), (i+1, 1)])) for i in range(30)})
+        plot = bokeh_renderer.get_plot(shapes)
+        subplot = next(iter(plot.subplots.values()))
+        assert type(subplot.handles['glyph']).__name__ == 'MultiLine'
+        assert len(subplot.handles['source'].data['xs']) == 30
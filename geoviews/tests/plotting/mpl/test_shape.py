@@ -0,0 +1,24 @@
+import numpy as np
+from holoviews import NdOverlay
+from shapely.geometry import box
+from test_plot import TestMPLPlot
+
+import geoviews as gv
+from geoviews import Store
+
+mpl_renderer = Store.renderers["matplotlib"]
+
+
+class TestShapePlot(TestMPLPlot):
+
+    def test_batched_shapes_single_artist(self):
+        shapes = NdOverlay({
+            i: gv.Shape({'geometry': box(i, 0, i+1, 1), 'value': i}, vdims=['value'])
+            for i in range(30)
+        })
+        plot = mpl_renderer.get_plot(shapes)
+        assert plot.batched
+        artist = next(iter(plot.subplots.values())).handles['artist']
+        assert len(list(artist._feature.geometries())) == 30
+        np.testing.assert_equal(artist.get_array(), np.arange(30))
+        assert artist.get_clim() == (0, 29)
@@ -5,7 +5,7 @@ try:
 except ImportError:
     raise unittest.SkipTest("iris not available") from None
 
-from holoviews.core import HoloMap
+from holoviews.core import DynamicMap, HoloMap
 from holoviews.element import Curve
 from holoviews.testing import assert_element_equal
 
@@ -28,3 +28,21 @@ class TestConversions:
         assert isinstance(converted, HoloMap)
         assert converted.kdims == ['latitude']
         assert isinstance(converted.last, Curve)
+
+    def test_dynamic_conversion(self):
+        dataset = Dataset(self.cube, kdims=['longitude', 'latitude'])
+        converted = dataset.to.curve(['longitude'], dynamic=True)
+        assert isinstance(converted, DynamicMap)
+        assert converted.kdims == ['latitude']
+        assert converted.kdims[0].values == [-1, 0, 1]
+        assert_element_equal(converted[0], dataset.to.curve(['longitude'])[0])
+
+    def test_dynamic_conversion_lru_cache(self):
+        dataset = Dataset(self.cube, kdims=['longitude', 'latitude'])
+        converted = dataset.to.curve(['longitude'], dynamic=True, cache_size=2)
+        first = converted[-1]
+        converted[0]
+        # Revisiting -1 makes 0 the least recently used group
+        assert converted[-1] is first
+        converted[1]
+        assert converted[-1] is first
@@ -1,7 +1,14 @@
 """
 Unit tests of Path types.
 """
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import cartopy.crs as ccrs
+import cartopy.feature as cf
 import numpy as np
+import pandas as pd
+import shapefile
 from shapely.geometry import (
     GeometryCollection,
     LinearRing,
@@ -11,9 +18,26 @@ from shapely.geometry import (
     MultiPolygon,
     Point,
     Polygon,
+    box,
 )
 
-from geoviews.element import Path, Points, Polygons, Rectangles, Segments
+from geoviews import util as gv_util
+from geoviews.element import (
+    EdgePaths,
+    Feature,
+    Graph,
+    Image,
+    Nodes,
+    Path,
+    Points,
+    Polygons,
+    Rectangles,
+    Segments,
+    Shape,
+    TriMesh,
+    geo_metadata,
+    is_geographic,
+)
 
 
 class TestRectangles:
@@ -135,6 +159,18 @@ class TestPath:
             ])
         )
 
+    def test_nan_separated_geom_conversion(self):
+        path = Path([np.array([(0, 0), (1, 1), (np.nan, np.nan), (2, 2),
+                               (np.nan, np.nan), (3, 3), (4, 4)])])
+        geom = path.geom()
+        assert isinstance(geom, MultiLineString)
+        assert [list(g.coords) for g in geom.geoms] == [[(0, 0), (1, 1)], [(3, 3), (4, 4)]]
+
+    def test_geom_projection(self):
+        path = Path([[(0, 0), (180, 0)]])
+        geom = path.geom(projection=ccrs.GOOGLE_MERCATOR)
+        np.testing.assert_allclose(np.array(geom.coords), [[0, 0], [20037508.34, 0]])
+
 
 class TestPolygons:
 
@@ -221,6 +257,20 @@ class TestPolygons:
         assert len(geom.geoms[1].interiors) == 0
 
 
+    def test_coverage_union(self):
+        polys = Polygons([box(0, 0, 1, 1), box(1, 0, 2, 1)])
+        geom = polys.geom(union=True, coverage=True)
+        assert geom.equals(box(0, 0, 2, 1))
+
+    def test_coverage_union_without_coverage_support(self, monkeypatch):
+        from geoviews.element import geo
+
+        monkeypatch.setattr(geo, 'SHAPELY_GE_2_0_0', False)
+        polys = Polygons([box(0, 0, 1, 1), box(1, 0, 2, 1)])
+        geom = polys.geom(union=True, coverage=True)
+        assert isinstance(geom, Polygon)
+        assert geom.equals(box(0, 0, 2, 1))
+
 
 class TestPoints:
 
@@ -280,3 +330,118 @@ class TestSegments:
                 [3, 1]
             ])
         )
+
+
+class TestGraph:
+
+    def setup_method(self):
+        self.nodes = Nodes([(0, 0, 0), (1, 1, 1), (2, 0, 2), (3, 1, 3)])
+
+    def test_edgepaths_nan_separated(self):
+        graph = Graph((([0, 1, 3], [1, 2, 5]), self.nodes), ['start', 'end'])
+        edgepaths = graph.edgepaths
+        assert isinstance(edgepaths, EdgePaths)
+        assert edgepaths.crs is graph.crs
+        # The edge referencing the missing node is dropped
+        np.testing.assert_equal(edgepaths.array(), [[0, 0], [1, 1], [np.nan, np.nan], [1, 1], [2, 0]])
+
+    def test_edgepaths_cached(self):
+        graph = Graph((([0, 1], [1, 2]), self.nodes), ['start', 'end'])
+        assert graph.edgepaths is graph.edgepaths
+        assert not graph._has_edgepaths
+
+    def test_explicit_edgepaths(self):
+        edgepaths = EdgePaths([[(0, 0), (0.5, 2), (1, 1)]])
+        graph = Graph((([0], [1]), self.nodes, edgepaths), ['start', 'end'])
+        assert graph.edgepaths is edgepaths
+        assert graph._has_edgepaths
+
+    def test_trimesh_edgepaths(self):
+        trimesh = TriMesh(([(0, 1, 2), (1, 2, 3)], self.nodes))
+        np.testing.assert_equal(trimesh.edgepaths.array(), [
+            [0, 0], [1, 1], [2, 0], [0, 0], [np.nan, np.nan],
+            [1, 1], [2, 0], [3, 1], [1, 1]
+        ])
+        assert not trimesh._has_edgepaths
+        assert not trimesh.clone()._has_edgepaths
+
+
+class TestShape:
+
+    def setup_method(self):
+        self.records = [
+            SimpleNamespace(attributes={'code': code}, geometry=Polygon([(i, 0), (i+1, 0), (i+1, 1)]))
+            for i, code in enumerate(['a', 'b', 'c'])
+        ]
+        self.df = pd.DataFrame({
+            'code': ['c', 'a', 'a', 'd'], 'year': [2000, 2001, 2002, 2003],
+            'value': [3., 1., 2., 4.]
+        })
+
+    def test_from_records_merge(self):
+        polys = Shape.from_records(iter(self.records), self.df, on='code',
+                                   value='value', index='year')
+        assert isinstance(polys, Polygons)
+        np.testing.assert_equal(polys.dimension_values('value', expanded=False), [1., np.nan, 3.])
+        assert list(polys.dimension_values('year', expanded=False)) == [2001, None, 2000]
+
+    def test_from_records_merge_drop_missing(self):
+        polys = Shape.from_records(self.records, self.df, on={'code': 'code'},
+                                   value='value', drop_missing=True)
+        np.testing.assert_equal(polys.dimension_values('value', expanded=False), [1., 3.])
+
+    def test_from_shapefile_filters(self, tmp_path):
+        path = str(tmp_path / 'shapes')
+        with shapefile.Writer(path, shapeType=shapefile.POLYGON) as writer:
+            writer.field('name', 'C')
+            writer.field('pop', 'N')
+            for i in range(10):
+                writer.poly([[[i, 0], [i, 1], [i+1, 1], [i+1, 0], [i, 0]]])
+                writer.record(f'n{i}', i*10)
+        polys = Shape.from_shapefile(path, index='name', bbox=(2.5, 0, 4.5, 1))
+        assert list(polys.dimension_values('name', expanded=False)) == ['n2', 'n3', 'n4']
+        polys = Shape.from_shapefile(path, index='name', columns=['name'],
+                                     where={'pop': [10, 30, 50]}, limit=2)
+        assert list(polys.dimension_values('name', expanded=False)) == ['n1', 'n3']
+        chunks = Shape.from_shapefile(path, chunksize=4)
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+class TestFeature:
+
+    def test_geoms_and_range_indexed(self, monkeypatch):
+        monkeypatch.setattr(gv_util, 'FEATURE_CACHE_DIR', None)
+        monkeypatch.setattr(gv_util, '_feature_cache', OrderedDict())
+        monkeypatch.setattr(gv_util, '_feature_index_cache', OrderedDict())
+        geoms = [box(i, 0, i+1, 1) for i in range(10)]
+        calls = []
+        def geometries(self):
+            calls.append(self.scale)
+            return iter(geoms)
+        monkeypatch.setattr(cf.NaturalEarthFeature, 'geometries', geometries)
+        feature = Feature(cf.NaturalEarthFeature('physical', 'land', '110m'))
+        assert feature.geoms(bounds=(2.5, 0, 4.5, 1), as_element=False) == geoms[2:5]
+        assert feature.range(0) == (0, 10)
+        assert feature.range(1) == (0, 1)
+        assert feature.geoms(bounds=(7.5, 0, 20, 1), as_element=False) == geoms[7:]
+        assert calls == ['110m']
+
+
+class TestGeoMetadata:
+
+    def test_geo_metadata_unique_crs(self):
+        overlay = Points([(0, 0)]) * Path([[(0, 0), (1, 1)]], crs=ccrs.PlateCarree()) * Image(np.zeros((2, 2)))
+        geographic, crss = geo_metadata(overlay)
+        assert geographic
+        assert crss == [ccrs.PlateCarree()]
+        assert is_geographic(overlay)
+
+    def test_geo_metadata_multiple_crs(self):
+        overlay = Points([(0, 0)]) * Points([(0, 0)], crs=ccrs.GOOGLE_MERCATOR)
+        assert len(geo_metadata(overlay)[1]) == 2
+
+    def test_geo_metadata_cache_tracks_crs(self):
+        points = Points([(0, 0)])
+        assert geo_metadata(points)[1] == [ccrs.PlateCarree()]
+        points.crs = ccrs.GOOGLE_MERCATOR
+        assert geo_metadata(points)[1] == [ccrs.GOOGLE_MERCATOR]
@@ -4,9 +4,17 @@ import pytest
 from holoviews.testing import assert_data_equal
 
 import geoviews.feature as gf
-from geoviews.element import Image, VectorField, WindBarbs
+from geoviews.element import (
+    Graph,
+    Image,
+    Path,
+    Segments,
+    TriMesh,
+    VectorField,
+    WindBarbs,
+)
 from geoviews.operation import project, project_image
-from geoviews.operation.projection import project_path
+from geoviews.operation.projection import project_geom, project_path
 
 
 class TestProjection:
@@ -284,6 +292,57 @@ class TestProjection:
         # since both should contain the same valid values
         assert np.allclose(unmasked_data, converted_data, equal_nan=True), "Extrapolated and converted data should be similar"
 
+    def test_project_path_geodesic(self):
+        path = Path([[(-74, 40.7), (139.7, 35.7)]])
+        projected = project_path(path, geodesic=True, projection=ccrs.PlateCarree())
+        xs, ys = projected.array().T
+        assert len(xs) > 100
+        # The great circle from New York to Tokyo passes close to the pole
+        assert np.nanmax(ys) > 65
+        assert projected.crs == ccrs.PlateCarree()
+
+    def test_project_path_geodesic_splits_antimeridian(self):
+        path = Path([[(170, 0), (-170, 0)]])
+        projected = project_path(path, geodesic=True, geodesic_spacing=500e3)
+        geom = projected.geom()
+        assert geom.geom_type == 'MultiLineString'
+        assert len(geom.geoms) == 2
+        minx, _, maxx, _ = geom.bounds
+        assert minx < -1.8e7
+        assert maxx > 1.8e7
+
+    def test_project_path_geodesic_requires_shapely_2(self, monkeypatch):
+        from geoviews.operation import projection
+
+        monkeypatch.setattr(projection, 'SHAPELY_GE_2_0_0', False)
+        path = Path([[(-74, 40.7), (139.7, 35.7)]])
+        with pytest.raises(ImportError, match='requires shapely'):
+            project_path(path, geodesic=True)
+
+    def test_project_segments_geodesic(self):
+        segments = Segments([(170, 0, -170, 0, 1), (0, 0, 0, 10, 2)], vdims='v')
+        projected = project_geom(segments, geodesic=True, geodesic_spacing=500e3)
+        # The first segment is split at the antimeridian
+        assert len(projected) == 5 + 3 - 1
+        np.testing.assert_equal(projected.dimension_values('v'), [1] * 4 + [2] * 3)
+        x0, x1 = projected.dimension_values(0), projected.dimension_values(2)
+        assert np.abs(x1 - x0).max() < 1e6
+
+    def test_project_geodesic_graph_edgepaths(self):
+        graph = Graph(([(0, 1)], [(-74, 40.7, 0), (139.7, 35.7, 1)]), ['start', 'end'])
+        projected = project(graph, geodesic=True)
+        edgepath = project(graph).edgepaths.array()
+        geodesic_edgepath = projected.edgepaths.array()
+        assert len(edgepath) == 2
+        assert len(geodesic_edgepath) > 100
+
+    def test_project_trimesh_edgepaths_from_nodes(self):
+        trimesh = TriMesh(([(0, 1, 2)], [(0, 0, 0), (10, 10, 1), (20, 0, 2)]))
+        assert len(trimesh.edgepaths.array()) == 4
+        projected = project(trimesh)
+        nodes = projected.nodes.array([0, 1])
+        np.testing.assert_allclose(projected.edgepaths.array(), nodes[[0, 1, 2, 0]])
+
     @pytest.mark.filterwarnings("ignore:Downloading:cartopy.io.DownloadWarning")
     def test_gf_borders(self):
         # Get borders at 110m scale using geoviews.feature, number of items can depend on cartopy version
@@ -1,8 +1,28 @@
+from collections import OrderedDict
+
 import cartopy.crs as ccrs
+import numpy as np
 import pytest
+import shapely.geometry as sgeom
 
 import geoviews as gv
-from geoviews.util import from_xarray, process_crs
+import geoviews.util as gv_util
+from geoviews.util import (
+    expand_geoms,
+    feature_geometries,
+    from_parquet,
+    from_xarray,
+    geodesic_densify,
+    geom_length,
+    geom_to_array,
+    geoms_length,
+    geoms_to_array,
+    geoms_to_holes,
+    process_crs,
+    spatialpandas_to_shapely,
+    unpack_geom_columns,
+    unpack_geoms,
+)
 
 try:
     import rioxarray as rxr
@@ -26,6 +46,20 @@ def test_process_crs(raw_crs) -> None:
     assert isinstance(crs, ccrs.CRS)
 
 
+def test_process_crs_cached() -> None:
+    crs = process_crs("EPSG:32633")
+    assert process_crs(32633) is crs
+    assert process_crs(" EPSG:32633") is crs
+
+
+def test_process_crs_cached_threaded() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(4) as executor:
+        crss = list(executor.map(process_crs, ["EPSG:32634"] * 16))
+    assert all(crs is crss[0] for crs in crss)
+
+
 # To avoid '+init=<authority>:<code>' syntax is deprecated.
 @pytest.mark.filterwarnings("ignore::FutureWarning")
 def test_process_crs_raises_error():
@@ -45,3 +79,244 @@ def test_from_xarray():
     assert isinstance(output, gv.RGB)
     assert sorted(map(str, output.kdims)) == ["x", "y"]
     assert isinstance(output.crs, ccrs.CRS)
+
+
+@pytest.fixture
+def cog_file(tmp_path):
+    rasterio = pytest.importorskip("rasterio")
+    from rasterio.enums import Resampling
+    from rasterio.transform import from_origin
+
+    path = str(tmp_path / "cog.tif")
+    arr = (np.arange(512 * 512, dtype="uint16") % 1000).reshape(512, 512)
+    arr[0, 0] = 65535
+    with rasterio.open(
+        path, "w", driver="GTiff", height=512, width=512, count=1, dtype="uint16",
+        crs="EPSG:4326", transform=from_origin(0, 512, 1, 1), nodata=65535,
+        tiled=True, blockxsize=256, blockysize=256,
+    ) as dst:
+        dst.write(arr, 1)
+        dst.build_overviews([2, 4, 8], Resampling.average)
+    return path
+
+
+@pytest.mark.skipif(rxr is None, reason="Needs rioxarray to be installed")
+def test_from_xarray_nan_nodata_lazy(cog_file):
+    da = rxr.open_rasterio(cog_file, chunks={"band": 1, "x": 256, "y": 256})
+    output = from_xarray(da, nan_nodata=True)
+    values = output.data[output.vdims[0].name]
+    assert values.dtype == np.float32
+    assert values.chunks is not None
+    assert np.isnan(output.dimension_values(2)).sum() == 1
+
+
+@pytest.mark.skipif(rxr is None, reason="Needs rioxarray to be installed")
+def test_from_xarray_dynamic_overview(cog_file):
+    da = rxr.open_rasterio(cog_file)
+    dmap = from_xarray(da, dynamic=True)
+    load_window = dmap.callback.callable
+    assert dict(load_window(None, None, None, None).data.sizes) == {"x": 512, "y": 512}
+    window = load_window((0, 256), (256, 512), 100, 100)
+    assert dict(window.data.sizes) == {"x": 128, "y": 128}
+    assert window.range("x") == (0, 256)
+
+
+@pytest.mark.skipif(rxr is None, reason="Needs rioxarray to be installed")
+def test_from_xarray_dynamic_overview_opened_once(cog_file, monkeypatch):
+    da = rxr.open_rasterio(cog_file)
+    load_window = from_xarray(da, dynamic=True).callback.callable
+    opened = []
+    open_rasterio = rxr.open_rasterio
+    monkeypatch.setattr(
+        rxr, "open_rasterio", lambda *a, **kw: opened.append(kw) or open_rasterio(*a, **kw)
+    )
+    load_window((0, 256), (256, 512), 100, 100)
+    load_window((0, 128), (384, 512), 50, 50)
+    assert len(opened) == 1
+
+
+def test_geodesic_densify():
+    import pyproj
+
+    geod = pyproj.Geod(ellps="WGS84")
+    lons, lats, index = geodesic_densify(
+        [170, -170, np.nan, 0, 0], [0, 0, np.nan, 0, 10], 500e3, geod
+    )
+    # The path crossing the antimeridian is unwrapped
+    np.testing.assert_allclose(lons[:6], [170, 174, 178, 182, 186, 190])
+    np.testing.assert_allclose(lats[:6], 0, atol=1e-9)
+    assert np.isnan(lons[6])
+    # The segment along the meridian is split into three pieces
+    np.testing.assert_allclose(lons[7:], 0, atol=1e-9)
+    assert lats[7] == 0
+    assert lats[-1] == 10
+    assert len(lats) == 11
+    np.testing.assert_equal(index, 0)
+
+
+def test_geodesic_densify_matches_geod_npts():
+    import pyproj
+
+    geod = pyproj.Geod(ellps="WGS84")
+    lons, lats, _ = geodesic_densify([-74, 139.7], [40.7, 35.7], 100e3, geod)
+    expected = np.array(geod.npts(-74, 40.7, 139.7, 35.7, len(lons) - 2))
+    np.testing.assert_allclose((lons[1:-1] + 180) % 360 - 180, expected[:, 0], atol=0.5)
+    np.testing.assert_allclose(lats[1:-1], expected[:, 1], atol=0.5)
+
+
+def test_expand_geoms():
+    boxes = [sgeom.box(0, 0, 1, 1), sgeom.box(2, 2, 3, 3)]
+    point = sgeom.Point(0, 0)
+    assert expand_geoms([sgeom.MultiPolygon(boxes), point]) == boxes + [point]
+
+
+def test_geoms_to_array_matches_geom_to_array():
+    geoms = [
+        sgeom.Point(0, 1),
+        sgeom.MultiPoint([(0, 1), (2, 3)]),
+        sgeom.LineString([(0, 0), (1, 1), (2, 0)]),
+        sgeom.MultiLineString([[(0, 0), (1, 1)], [(2, 2), (3, 3), (4, 2)]]),
+        sgeom.box(0, 0, 1, 1),
+        sgeom.MultiPolygon([sgeom.box(0, 0, 1, 1), sgeom.box(2, 2, 3, 3)]),
+    ]
+    coords, offsets = geoms_to_array(geoms)
+    assert len(offsets) == len(geoms) + 1
+    for i, geom in enumerate(geoms):
+        np.testing.assert_equal(coords[offsets[i]:offsets[i+1]], geom_to_array(geom))
+        assert offsets[i+1] - offsets[i] == geom_length(geom)
+    np.testing.assert_equal(geoms_length(geoms), np.diff(offsets))
+
+
+def test_geoms_to_holes():
+    hole = [(0.2, 0.2), (0.4, 0.2), (0.4, 0.4), (0.2, 0.2)]
+    poly = sgeom.Polygon(sgeom.box(0, 0, 1, 1).exterior, [hole])
+    multi = sgeom.MultiPolygon([sgeom.box(2, 2, 3, 3), poly])
+    holes = geoms_to_holes([poly, sgeom.LineString([(0, 0), (1, 1)]), multi])
+    assert len(holes) == 3
+    assert len(holes[0]) == 1
+    np.testing.assert_equal(holes[0][0][0], np.array(hole))
+    assert holes[1] == [[]]
+    assert holes[2][0] == []
+    np.testing.assert_equal(holes[2][1][0], np.array(hole))
+
+
+def test_from_parquet_bbox_and_columns(tmp_path):
+    gpd = pytest.importorskip("geopandas")
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "polys.parquet"
+    gpd.GeoDataFrame({
+        'name': ['a', 'b', 'c'],
+        'value': [1, 2, 3],
+        'geometry': [sgeom.box(i, i, i + 1, i + 1) for i in (0, 10, 20)],
+    }, crs="EPSG:4326").to_parquet(path, write_covering_bbox=True)
+    polys = from_parquet(path, bbox=(9, 9, 21.5, 21.5), columns=['value'])
+    assert isinstance(polys, gv.Polygons)
+    assert polys.interface.datatype == 'geodataframe'
+    assert [vd.name for vd in polys.vdims] == ['value']
+    np.testing.assert_equal(polys.dimension_values('value', expanded=False), [2, 3])
+
+
+def test_from_parquet_points_element(tmp_path):
+    gpd = pytest.importorskip("geopandas")
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "points.parquet"
+    gpd.GeoDataFrame({
+        'value': [1, 2],
+        'geometry': [sgeom.Point(0, 1), sgeom.Point(2, 3)],
+    }, crs="EPSG:4326").to_parquet(path)
+    points = gv.Points.from_parquet(path)
+    assert isinstance(points, gv.Points)
+    assert isinstance(points.crs, ccrs.PlateCarree)
+    np.testing.assert_equal(points.dimension_values(0), [0, 2])
+
+
+def test_from_parquet_non_epsg_crs(tmp_path):
+    gpd = pytest.importorskip("geopandas")
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "lcc.parquet"
+    lcc = (
+        "+proj=lcc +lat_0=40 +lon_0=-96 +lat_1=33 +lat_2=45 "
+        "+x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs"
+    )
+    gpd.GeoDataFrame({
+        'value': [1, 2],
+        'geometry': [sgeom.Point(0, 0), sgeom.Point(1000, 1000)],
+    }, crs=lcc).to_parquet(path)
+    points = from_parquet(path)
+    assert isinstance(points.crs, ccrs.LambertConformal)
+    params = points.crs.proj4_params
+    assert params['lon_0'] == -96
+    assert params['lat_0'] == 40
+    assert (params['lat_1'], params['lat_2']) == (33, 45)
+
+
+def test_from_parquet_undecodable_crs_warns(tmp_path):
+    gpd = pytest.importorskip("geopandas")
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "sinu.parquet"
+    gpd.GeoDataFrame(
+        {'geometry': [sgeom.Point(0, 0)]}, crs="+proj=sinu +lon_0=10 +datum=WGS84 +units=m"
+    ).to_parquet(path)
+    with pytest.warns(UserWarning, match='Could not decode projection'):
+        from_parquet(path)
+
+
+def test_feature_geometries_cache(tmp_path, monkeypatch):
+    import cartopy.feature as cf
+
+    monkeypatch.setattr(gv_util, 'FEATURE_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(gv_util, '_feature_cache', OrderedDict())
+    geoms = [sgeom.box(0, 0, 1, 1), sgeom.box(2, 2, 3, 3)]
+    monkeypatch.setattr(cf.NaturalEarthFeature, 'geometries', lambda self: iter(geoms))
+    feature = cf.NaturalEarthFeature('physical', 'land', '110m')
+    assert feature_geometries(feature) == geoms
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Loaded from disk once the in-memory cache is cleared
+    gv_util._feature_cache.clear()
+    monkeypatch.setattr(cf.NaturalEarthFeature, 'geometries', lambda self: iter([]))
+    assert feature_geometries(feature) == geoms
+
+    projected = feature_geometries(feature, ccrs.GOOGLE_MERCATOR)
+    assert projected[0].bounds[2] == pytest.approx(111319.49, rel=1e-6)
+    assert feature_geometries(feature, ccrs.GOOGLE_MERCATOR) is projected
+
+
+def test_feature_geometries_cache_bounded(monkeypatch):
+    import cartopy.feature as cf
+
+    monkeypatch.setattr(gv_util, 'FEATURE_CACHE_DIR', None)
+    monkeypatch.setattr(gv_util, 'FEATURE_CACHE_SIZE', 2)
+    monkeypatch.setattr(gv_util, '_feature_cache', OrderedDict())
+    monkeypatch.setattr(cf.NaturalEarthFeature, 'geometries', lambda self: iter([]))
+    land, ocean, lakes = (
+        cf.NaturalEarthFeature('physical', name, '110m') for name in ('land', 'ocean', 'lakes')
+    )
+    land_geoms = feature_geometries(land)
+    feature_geometries(ocean)
+    assert feature_geometries(land) is land_geoms
+    feature_geometries(lakes)
+    assert [key[2] for key in gv_util._feature_cache] == ['land', 'lakes']
+
+
+def test_unpack_geom_columns_geopandas():
+    gpd = pytest.importorskip("geopandas")
+    gdf = gpd.GeoDataFrame({
+        'value': [1, 2],
+        'geometry': [sgeom.box(0, 0, 1, 1), sgeom.box(2, 2, 3, 3)],
+    })
+    polys = gv.Polygons(gdf, vdims=['value'])
+    geoms, columns = unpack_geom_columns(polys)
+    assert list(geoms) == list(gdf.geometry)
+    np.testing.assert_equal(columns['value'], np.array([1, 2]))
+    assert unpack_geoms(polys) == [
+        {'value': 1, 'geometry': gdf.geometry[0]},
+        {'value': 2, 'geometry': gdf.geometry[1]},
+    ]
+
+
+def test_spatialpandas_to_shapely():
+    spg = pytest.importorskip("spatialpandas.geometry")
+    lines = spg.MultiLineArray([[[0, 0, 1, 1], [5, 5, 6, 6]], [[2, 2, 3, 3, 4, 4]]])
+    geoms = spatialpandas_to_shapely(lines[::-1])
+    assert [g.wkt for g in geoms] == [g.to_shapely().wkt for g in lines[::-1]]
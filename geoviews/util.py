@@ -1,4 +1,11 @@
+import hashlib
+import os
+import threading
+import warnings
+from collections import OrderedDict
 from contextlib import suppress
+from functools import lru_cache
+from itertools import pairwise
 
 import cartopy
 import numpy as np
@@ -33,6 +40,23 @@ SHAPELY_VERSION = Version(shapely.__version__).release
 SHAPELY_GE_2_0_0 = SHAPELY_VERSION >= (2, 0, 0)
 CARTOPY_VERSION = Version(cartopy.__version__).release
 
+# Directory the feature geometries are cached in, the on-disk cache
+# is disabled unless a directory is set
+FEATURE_CACHE_DIR = os.environ.get('GEOVIEWS_FEATURE_CACHE_DIR')
+
+# Maximum number of feature geometries and spatial indexes to keep
+FEATURE_CACHE_SIZE = 32
+
+_feature_cache = OrderedDict()
+
+_feature_index_cache = OrderedDict()
+
+# Maximum number of parsed CRS definitions to keep
+CRS_CACHE_SIZE = 128
+
+_crs_cache = OrderedDict()
+_crs_cache_lock = threading.Lock()
+
 
 def wrap_lons(lons, base, period):
     """Wrap longitude values into the range between base and base+period.
@@ -52,13 +76,108 @@ def wrap_cylindrical_projection_lons(src_proj, x1, x2, base=-180.0, period=360.0
     return x1, x2
 
 
+def unwrap_path_lons(lons, index):
+    """Unwraps longitudes along each path, delimited by changes in the
+    index or by NaN separators, so that no two consecutive vertices are
+    more than 180 degrees apart.
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    if len(lons) < 2:
+        return lons
+    starts = np.ones(len(lons), dtype=bool)
+    starts[1:] = (index[1:] != index[:-1]) | ~np.isfinite(lons[:-1])
+    offsets = np.zeros(len(lons))
+    offsets[1:] = -360 * np.round(np.diff(lons) / 360)
+    offsets[starts | ~np.isfinite(offsets)] = 0
+    offsets = np.cumsum(offsets)
+    first = np.maximum.accumulate(np.where(starts, np.arange(len(lons)), 0))
+    return lons + offsets - offsets[first]
+
+
+def geodesic_densify(lons, lats, spacing, geod, index=None):
+    """Densifies paths by interpolating points along the great circle
+    between each pair of consecutive vertices, so that no two points
+    are further than the spacing apart. The number of points inserted
+    into each segment adapts to its geodesic length, and all segments
+    are interpolated at once.
+
+    Parameters
+    ----------
+    lons, lats : np.ndarray
+        Longitudes and latitudes of the path vertices
+    spacing : float
+        Maximum distance (in meters) between interpolated points
+    geod : pyproj.Geod
+        Ellipsoid the segment lengths are computed on
+    index : np.ndarray, optional
+        Path index of each vertex, paths may also be NaN separated
+
+    Returns
+    -------
+    lons, lats, index : np.ndarray
+        Densified (unwrapped) longitudes, latitudes and path index
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    index = np.zeros(len(lons), dtype=int) if index is None else np.asarray(index)
+    if len(lons) < 2:
+        return lons, lats, index
+    x0, y0, x1, y1 = lons[:-1], lats[:-1], lons[1:], lats[1:]
+    valid = ((index[:-1] == index[1:]) & np.isfinite(x0) & np.isfinite(y0)
+             & np.isfinite(x1) & np.isfinite(y1))
+    azimuths, distances = np.zeros(len(x0)), np.zeros(len(x0))
+    if valid.any():
+        az, _, dist = geod.inv(x0[valid], y0[valid], x1[valid], y1[valid])
+        azimuths[valid], distances[valid] = az, dist
+    nsegments = np.maximum(np.ceil(distances / spacing), 1).astype(int)
+
+    # Each vertex is followed by the points interpolated along its segment
+    counts = np.append(nsegments, 1)
+    source = np.repeat(np.arange(len(lons)), counts)
+    step = np.arange(len(source)) - np.repeat(np.cumsum(counts) - counts, counts)
+    out_lons, out_lats, out_index = lons[source], lats[source], index[source]
+    interior = np.flatnonzero(step > 0)
+    if len(interior):
+        segment = source[interior]
+        fraction = step[interior] / nsegments[segment]
+        # Interpolate along great circles, which is much cheaper than
+        # solving the geodesic problem for every point
+        start, end = _lonlat_to_xyz(x0, y0), _lonlat_to_xyz(x1, y1)
+        with np.errstate(invalid='ignore'):
+            omega = np.arccos(np.clip((start * end).sum(axis=1), -1, 1))
+        sin_omega = np.sin(omega)
+        omega, sin_omega = omega[segment, None], sin_omega[segment, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xyz = (np.sin((1 - fraction[:, None]) * omega) * start[segment] +
+                   np.sin(fraction[:, None] * omega) * end[segment]) / sin_omega
+        out_lons[interior] = np.degrees(np.arctan2(xyz[:, 1], xyz[:, 0]))
+        out_lats[interior] = np.degrees(np.arcsin(np.clip(xyz[:, 2], -1, 1)))
+
+        # Great circles between (nearly) antipodal points are undefined
+        antipodal = sin_omega[:, 0] < 1e-6
+        if antipodal.any():
+            segment, points = segment[antipodal], interior[antipodal]
+            ilons, ilats, _ = geod.fwd(
+                x0[segment], y0[segment], azimuths[segment],
+                distances[segment] * fraction[antipodal]
+            )
+            out_lons[points], out_lats[points] = ilons, ilats
+    return unwrap_path_lons(out_lons, out_index), out_lats, out_index
+
+
+def _lonlat_to_xyz(lons, lats):
+    lons, lats = np.radians(lons), np.radians(lats)
+    return np.column_stack([np.cos(lats) * np.cos(lons),
+                            np.cos(lats) * np.sin(lons), np.sin(lats)])
+
+
 def expand_geoms(geoms):
     """Expands multi-part geometries in a list of geometries.
     """
     expanded = []
     for geom in geoms:
         if isinstance(geom, BaseMultipartGeometry):
-            expanded.extend(list(geom))
+            expanded.extend(geom.geoms)
         else:
             expanded.append(geom)
     return expanded
@@ -154,30 +273,98 @@ def geom_dict_to_array_dict(geom_dict, coord_names=None):
     of x- and y-coordinate arrays and if present a list-of-lists of
     hole array.
     """
+    return geom_dicts_to_array_dicts([geom_dict], coord_names)[0]
+
+
+def geom_dicts_to_array_dicts(geom_dicts, coord_names=None):
+    """Converts a list of dictionaries containing a geometry key to a
+    list of dictionaries of x- and y-coordinate arrays and if present
+    a list-of-lists of hole arrays.
+
+    All geometries are converted in a single bulk call, see
+    ``geoms_to_array`` and ``geoms_to_holes``.
+    """
     if coord_names is None:
         coord_names = ["Longitude", "Latitude"]
     x, y = coord_names
-    geom = geom_dict['geometry']
-    new_dict = {k: v for k, v in geom_dict.items() if k != 'geometry'}
-    array = geom_to_array(geom)
-    new_dict[x] = array[:, 0]
-    new_dict[y] = array[:, 1]
-    if geom.geom_type == 'Polygon':
-        holes = []
-        for interior in geom.interiors:
-            holes.append(geom_to_array(interior))
-        if holes:
-            new_dict['holes'] = [holes]
-    elif geom.geom_type == 'MultiPolygon':
-        outer_holes = []
-        for g in geom.geoms:
-            holes = []
-            for interior in g.interiors:
-                holes.append(geom_to_array(interior))
-            outer_holes.append(holes)
-        if any(hs for hs in outer_holes):
-            new_dict['holes'] = outer_holes
-    return new_dict
+    geoms = [geom_dict['geometry'] for geom_dict in geom_dicts]
+    coords, offsets = geoms_to_array(geoms)
+    holes = geoms_to_holes(geoms)
+    array_dicts = []
+    for i, geom_dict in enumerate(geom_dicts):
+        new_dict = {k: v for k, v in geom_dict.items() if k != 'geometry'}
+        array = coords[offsets[i]:offsets[i+1]]
+        new_dict[x] = array[:, 0]
+        new_dict[y] = array[:, 1]
+        if any(hs for hs in holes[i]):
+            new_dict['holes'] = holes[i]
+        array_dicts.append(new_dict)
+    return array_dicts
+
+
+def spatialpandas_to_shapely(array):
+    """Converts a spatialpandas GeometryArray to an array of shapely
+    geometries, building all geometries from the underlying coordinate
+    buffers in a single call where possible.
+    """
+    from spatialpandas.geometry import (
+        LineArray,
+        MultiLineArray,
+        MultiPointArray,
+        MultiPolygonArray,
+        PointArray,
+        PolygonArray,
+    )
+    type_names = {
+        PointArray: 'POINT', MultiPointArray: 'MULTIPOINT',
+        LineArray: 'LINESTRING', MultiLineArray: 'MULTILINESTRING',
+        PolygonArray: 'POLYGON', MultiPolygonArray: 'MULTIPOLYGON'
+    }
+    type_name = type_names.get(type(array))
+    if not SHAPELY_GE_2_0_0 or type_name is None or array.isna().any():
+        return _as_geom_array([None if g is None else g.to_shapely() for g in array])
+    if isinstance(array, PointArray):
+        coords = np.asarray(array.flat_values, dtype='float64').reshape(-1, 2)
+        return shapely.points(coords)
+    coords = np.asarray(array.buffer_values, dtype='float64').reshape(-1, 2)
+    # spatialpandas offsets are ordered from the outermost level and the
+    # innermost offsets index into the interleaved x/y values
+    offsets = [np.asarray(o, dtype=np.int64) for o in array.buffer_offsets[::-1]]
+    offsets[0] = offsets[0] // 2
+    geom_type = getattr(shapely.GeometryType, type_name)
+    return shapely.from_ragged_array(geom_type, coords, tuple(offsets))
+
+
+def _unpack_geom_frame(geom_el):
+    """Splits the data of a geometry element backed by a GeoDataFrame
+    into an array of shapely geometries and a DataFrame of the
+    remaining columns.
+    """
+    interface = geom_el.interface
+    geom_col = interface.geo_column(geom_el.data)
+    if interface.datatype == 'spatialpandas':
+        geoms = spatialpandas_to_shapely(geom_el.data[geom_col].array)
+    else:
+        geoms = _as_geom_array(geom_el.data[geom_col].array)
+    return geoms, geom_el.data.drop(columns=[geom_col])
+
+
+def unpack_geom_columns(geom_el):
+    """Unpacks the data in a geometry element backed by a GeoDataFrame
+    into columnar form, without creating any per-row objects.
+
+    Returns
+    -------
+    geoms : np.ndarray or None
+        Object array of shapely geometries, None if the element is not
+        backed by a geopandas or spatialpandas GeoDataFrame.
+    columns : dict
+        Dictionary of the remaining column names and their array values
+    """
+    if geom_el.interface.datatype not in ('geodataframe', 'spatialpandas'):
+        return None, {}
+    geoms, frame = _unpack_geom_frame(geom_el)
+    return geoms, {c: frame[c].values for c in frame.columns}
 
 
 def unpack_geoms(geom_el):
@@ -186,16 +373,11 @@ def unpack_geoms(geom_el):
     """
     interface = geom_el.interface
     if interface.datatype in  ('geodataframe', 'spatialpandas'):
-        geom_col = interface.geo_column(geom_el.data)
-        geoms = []
-        for _, row in geom_el.data.iterrows():
-            row = row.to_dict()
-            if interface.datatype  == 'spatialpandas':
-                row['geometry'] = row[geom_col].to_shapely()
-            else:
-                row['geometry'] = row[geom_col]
-            geoms.append(row)
-        return geoms
+        geoms, frame = _unpack_geom_frame(geom_el)
+        records = frame.to_dict('records') if len(frame.columns) else [{} for _ in geoms]
+        for record, geom in zip(records, geoms):
+            record['geometry'] = geom
+        return records
     elif interface.datatype == 'geom_dictionary':
         return [geom_el.data]
     elif (interface.datatype == 'multitabular' and
@@ -320,6 +502,53 @@ def path_to_geom_dicts(fullpath, skip_invalid=True):
     return geoms
 
 
+def _coords_to_parts(coords, min_coords):
+    """Splits a NaN separated coordinate array into parts, dropping
+    parts with fewer than min_coords coordinates, and returns the
+    remaining coordinates along with the index of the part each
+    coordinate belongs to.
+    """
+    nans = np.isnan(coords).any(axis=1)
+    part = np.cumsum(nans)[~nans]
+    coords = coords[~nans]
+    _, index, counts = np.unique(part, return_inverse=True, return_counts=True)
+    valid = counts[index] >= min_coords
+    _, index = np.unique(index[valid], return_inverse=True)
+    return coords[valid], index
+
+
+def element_to_geoms(geom_el, polygons=False):
+    """Converts a Path or Polygons element into an array of single-part
+    shapely geometries, equivalent to expanding the geometries returned
+    by ``path_to_geom_dicts`` or ``polygons_to_geom_dicts``.
+
+    Parameters
+    ----------
+    geom_el : Path or Polygons
+        Element to convert
+    polygons : boolean, default=False
+        Whether to construct Polygons instead of LineStrings
+
+    Returns
+    -------
+    geoms : np.ndarray
+        Object array of shapely geometries
+    """
+    to_dicts = polygons_to_geom_dicts if polygons else path_to_geom_dicts
+    if not SHAPELY_GE_2_0_0:
+        return _as_geom_array(expand_geoms([g['geometry'] for g in to_dicts(geom_el)]))
+    geoms, _ = unpack_geom_columns(geom_el)
+    if geoms is not None:
+        return shapely.get_parts(geoms)
+    elif unpack_geoms(geom_el) is not None or (polygons and geom_el.has_holes):
+        return shapely.get_parts([g['geometry'] for g in to_dicts(geom_el)])
+    coords = np.column_stack([geom_el.dimension_values(i) for i in range(2)])
+    coords, index = _coords_to_parts(coords.astype('float64'), 3 if polygons else 2)
+    if polygons:
+        return shapely.polygons(shapely.linearrings(coords, indices=index))
+    return shapely.linestrings(coords, indices=index)
+
+
 def to_ccw(geom):
     """Reorients polygon to be wound counter-clockwise.
     """
@@ -349,7 +578,7 @@ def geom_to_arr(geom):
             return np.array(data['data']).reshape(data['shape'])[:, :2]
         arr = geom.array_interface_base['data']
     else:
-        arr = np.asarray(geom.exterior.coords)
+        return np.asarray(geom.exterior.coords)[:, :2]
 
     if (len(arr) % 2) != 0:
         arr = arr[:-1]
@@ -412,6 +641,158 @@ def geom_to_array(geom):
     return np.column_stack([xs, ys])
 
 
+def _as_geom_array(geoms):
+    """Converts an iterable of shapely geometries to a 1D object array.
+    """
+    if isinstance(geoms, np.ndarray) and geoms.dtype == object:
+        return geoms.ravel()
+    arr = np.empty(len(geoms), dtype=object)
+    arr[:] = list(geoms)
+    return arr
+
+
+def _geoms_to_parts(geoms):
+    """Splits an array of geometries into the parts making up the
+    geom_to_array layout, returning the parts, the index of the
+    geometry each part belongs to, the number of coordinates in each
+    part and whether a NaN separator row precedes each part.
+    """
+    parts, index = shapely.get_parts(geoms, return_index=True)
+    polys = shapely.get_type_id(parts) == 3
+    parts[polys] = shapely.get_exterior_ring(parts[polys])
+    counts = shapely.get_num_coordinates(parts)
+    # MultiPoint parts are concatenated, all other parts NaN separated
+    points = np.isin(shapely.get_type_id(geoms), (0, 4))
+    separator = np.zeros(len(parts), dtype=bool)
+    separator[1:] = index[1:] == index[:-1]
+    separator &= ~points[index]
+    return parts, index, counts, separator
+
+
+def _lengths_to_offsets(lengths):
+    offsets = np.zeros(len(lengths)+1, dtype=np.intp)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def geoms_length(geoms):
+    """Calculates the length of the coordinates of each geometry in an
+    array of shapely geometries, see ``geom_length``.
+    """
+    geoms = _as_geom_array(geoms)
+    if not SHAPELY_GE_2_0_0:
+        return np.array([geom_length(g) for g in geoms], dtype=np.intp)
+    _, index, counts, separator = _geoms_to_parts(geoms)
+    return np.bincount(index, weights=counts+separator,
+                       minlength=len(geoms)).astype(np.intp)
+
+
+def geoms_to_array(geoms):
+    """Converts an array of shapely geometries to a single flattened
+    coordinate array along with the offsets of each geometry.
+
+    The coordinates of each geometry follow the same layout as
+    ``geom_to_array``, i.e. Polygons are represented by their
+    exterior and the parts of multi-geometries (except MultiPoints)
+    are separated by NaN rows.
+
+    Parameters
+    ----------
+    geoms : array-like
+        Array or list of shapely geometries
+
+    Returns
+    -------
+    coords : np.ndarray
+        Array of shape (N, 2) containing the coordinates of all geometries
+    offsets : np.ndarray
+        Integer array of length len(geoms)+1, where
+        coords[offsets[i]:offsets[i+1]] are the coordinates of geometry i
+    """
+    geoms = _as_geom_array(geoms)
+    if not SHAPELY_GE_2_0_0:
+        arrays = [geom_to_array(g).reshape(-1, 2) for g in geoms]
+        offsets = _lengths_to_offsets([len(a) for a in arrays])
+        coords = np.concatenate(arrays) if arrays else np.empty((0, 2))
+        return coords.astype('float64'), offsets
+
+    parts, index, counts, separator = _geoms_to_parts(geoms)
+    coords = shapely.get_coordinates(parts)
+    part_lengths = counts + separator
+    part_offsets = _lengths_to_offsets(part_lengths)
+    coord_offsets = _lengths_to_offsets(counts)
+    positions = (np.arange(len(coords)) +
+                 np.repeat(part_offsets[:-1] + separator - coord_offsets[:-1], counts))
+    array = np.full((part_offsets[-1], 2), np.nan)
+    array[positions] = coords
+    lengths = np.bincount(index, weights=part_lengths, minlength=len(geoms))
+    return array, _lengths_to_offsets(lengths.astype(np.intp))
+
+
+def geoms_to_holes(geoms):
+    """Extracts the holes of an array of shapely geometries.
+
+    Returns a list containing, for each geometry, a list of the holes
+    of each Polygon part, where each hole is an array of coordinates.
+    Geometries without Polygon parts are represented as ``[[]]``.
+    """
+    geoms = _as_geom_array(geoms)
+    holes = [[] for _ in range(len(geoms))]
+    if not SHAPELY_GE_2_0_0:
+        for geom, hs in zip(geoms, holes):
+            if geom is None:
+                continue
+            for g in (geom.geoms if geom.geom_type == 'MultiPolygon' else [geom]):
+                if g.geom_type == 'Polygon':
+                    hs.append([geom_to_array(h) for h in g.interiors])
+        return [hs if hs else [[]] for hs in holes]
+
+    parts, index = shapely.get_parts(geoms, return_index=True)
+    polys = shapely.get_type_id(parts) == 3
+    parts, index = parts[polys], index[polys]
+    rings, ring_index = shapely.get_rings(parts, return_index=True)
+    interior = np.ones(len(rings), dtype=bool)
+    if len(rings):
+        interior[0] = False
+        interior[1:] = ring_index[1:] == ring_index[:-1]
+    rings, ring_index = rings[interior], ring_index[interior]
+    coords, coord_index = shapely.get_coordinates(rings, return_index=True)
+    splits = np.cumsum(np.bincount(coord_index, minlength=len(rings)))[:-1]
+    part_holes = [[] for _ in range(len(parts))]
+    for i, arr in zip(ring_index, np.split(coords, splits) if len(rings) else []):
+        part_holes[i].append(arr)
+    for i, hs in zip(index, part_holes):
+        holes[i].append(hs)
+    return [hs if hs else [[]] for hs in holes]
+
+
+def sample_geoms(geoms, xs, ys):
+    """Finds the geometries intersecting each of the supplied sample
+    coordinates.
+
+    Returns a tuple of integer arrays indexing the samples and the
+    geometries for each intersecting pair, ordered by sample.
+    """
+    geoms = _as_geom_array(geoms)
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    if not SHAPELY_GE_2_0_0:
+        pairs = [(i, j) for i, (x, y) in enumerate(zip(xs, ys))
+                 for j, geom in enumerate(geoms)
+                 if geom is not None and geom.intersects(Point(x, y))]
+        if not pairs:
+            return np.array([], dtype=int), np.array([], dtype=int)
+        sample_idx, geom_idx = np.array(pairs, dtype=int).T
+        return sample_idx, geom_idx
+    points = shapely.points(xs, ys)
+    if len(geoms) == 1:
+        sample_idx = np.flatnonzero(shapely.intersects(geoms[0], points))
+        return sample_idx, np.zeros(len(sample_idx), dtype=int)
+    tree = shapely.STRtree(geoms)
+    sample_idx, geom_idx = tree.query(points, predicate='intersects')
+    order = np.lexsort((geom_idx, sample_idx))
+    return sample_idx[order], geom_idx[order]
+
+
 def geo_mesh(element):
     """Get mesh data from a 2D Element ensuring that if the data is
     on a cylindrical coordinate system and wraps globally that data
@@ -472,6 +853,41 @@ def check_crs(crs):
     return out
 
 
+def _crs_key(crs):
+    """Returns a hashable key normalizing a CRS definition or None if
+    the definition cannot be cached.
+    """
+    if isinstance(crs, int) and not isinstance(crs, bool):
+        return ('epsg', crs)
+    elif isinstance(crs, str):
+        return ('str', crs.strip())
+    elif is_pyproj(crs):
+        return ('proj', crs.srs)
+
+
+def _cached_crs(key, factory):
+    """Looks up a parsed CRS in the LRU cache, calling the factory to
+    create it on a miss. Concurrent misses for the same key resolve to
+    the first stored instance, so equal definitions share one object.
+    """
+    with _crs_cache_lock:
+        if key in _crs_cache:
+            _crs_cache.move_to_end(key)
+            return _crs_cache[key]
+    crs = factory()
+    with _crs_cache_lock:
+        crs = _crs_cache.setdefault(key, crs)
+        _crs_cache.move_to_end(key)
+        while len(_crs_cache) > CRS_CACHE_SIZE:
+            _crs_cache.popitem(last=False)
+    return crs
+
+
+def _epsg(code):
+    code = int(code)
+    return _cached_crs(('epsg', code), lambda: ccrs.epsg(code))
+
+
 def proj_to_cartopy(proj):
     """Converts a pyproj.Proj to a cartopy.crs.Projection
 
@@ -486,6 +902,13 @@ def proj_to_cartopy(proj):
     -------
     a cartopy.crs.Projection object
     """
+    key = _crs_key(proj)
+    if key is None:
+        return _proj_to_cartopy(proj)
+    return _cached_crs(('proj_to_cartopy',)+key, lambda: _proj_to_cartopy(proj))
+
+
+def _proj_to_cartopy(proj):
     import cartopy.crs as ccrs
     try:
         from osgeo import osr
@@ -579,7 +1002,7 @@ def process_crs(crs):
     """
     try:
         import cartopy.crs as ccrs
-        import pyproj
+        import pyproj  # noqa: F401
     except ImportError:
         raise ImportError('Geographic projection support requires pyproj and cartopy.') from None
 
@@ -588,15 +1011,24 @@ def process_crs(crs):
     elif isinstance(crs, ccrs.CRS):
         return crs
 
+    key = _crs_key(crs)
+    if key is None:
+        return _process_crs(crs)
+    return _cached_crs(('process_crs',)+key, lambda: _process_crs(crs))
+
+
+def _process_crs(crs):
+    import pyproj
+
     errors = []
     if isinstance(crs, str):
         try:
-            return ccrs.epsg("".join([c for c in crs if c.isdigit()]))
+            return _epsg("".join([c for c in crs if c.isdigit()]))
         except Exception as e:
             errors.append(e)
     if isinstance(crs, int):
         try:
-            return ccrs.epsg(crs)
+            return _epsg(crs)
         except Exception as e:
             crs = str(crs)
             errors.append(e)
@@ -609,7 +1041,7 @@ def process_crs(crs):
     raise ValueError("Projection must be defined as a EPSG code, proj4 string, cartopy CRS or pyproj.Proj.") from Exception(*errors)
 
 
-def from_xarray(da, crs=None, apply_transform=False, nan_nodata=False, **kwargs):
+def from_xarray(da, crs=None, apply_transform=False, nan_nodata=False, dynamic=False, **kwargs):
     """Returns an RGB or Image element given an xarray DataArray
     loaded using xr.open_rasterio.
 
@@ -627,14 +1059,22 @@ def from_xarray(da, crs=None, apply_transform=False, nan_nodata=False, **kwargs)
       Whether to apply affine transform if defined on the data
     nan_nodata : boolean
       If data contains nodata values convert them to NaNs
+    dynamic : boolean
+      Whether to return a DynamicMap which, as the plot is zoomed and
+      panned, reads only the window intersecting the viewport at the
+      (COG) overview level matching the plot resolution. Requires the
+      DataArray to be loaded from a file with rioxarray and the
+      viewport ranges to be in the coordinate system of the data.
     **kwargs :
       Keyword arguments passed to the HoloViews/GeoViews element
 
     Returns
     -------
     element
-        Image/RGB/QuadMesh element
+        Image/RGB/QuadMesh element or DynamicMap if dynamic=True
     """
+    if dynamic:
+        return _dynamic_raster(da, crs, apply_transform, nan_nodata, **kwargs)
     if crs:
         kwargs['crs'] = crs
     elif hasattr(da, 'crs'):
@@ -684,13 +1124,12 @@ def from_xarray(da, crs=None, apply_transform=False, nan_nodata=False, **kwargs)
         ys = da.coords[y][::-1] if yres < 0 else da.coords[y]
 
     data = (xs, ys)
+    nodata = _raster_nodata(da) if nan_nodata else []
     for b in range(bands):
-        values = da[b].values
-        if nan_nodata and da.attrs.get('nodatavals', []):
-
-            values = values.astype(float)
-            for d in da.attrs['nodatavals']:
-                values[values==d] = np.nan
+        # Use the underlying (possibly dask) array to avoid loading the data
+        values = da.data if len(coords) == 2 else da[b].data
+        if nodata:
+            values = _mask_nodata(values, nodata)
         data += (values,)
 
     if 'datatype' not in kwargs:
@@ -716,6 +1155,333 @@ def from_xarray(da, crs=None, apply_transform=False, nan_nodata=False, **kwargs)
     return el
 
 
+def _raster_nodata(da):
+    """Returns the nodata values declared on a raster DataArray."""
+    nodata = [v for v in da.attrs.get('nodatavals', []) if v is not None]
+    if not nodata and hasattr(da, 'rio') and da.rio.nodata is not None:
+        nodata = [da.rio.nodata]
+    return [v for v in nodata if not np.isnan(v)]
+
+
+def _mask_nodata(values, nodata):
+    """Replaces nodata values with NaNs, keeping dask arrays lazy and
+    only promoting integer data to the smallest float type which can
+    represent it.
+    """
+    dtype = values.dtype if values.dtype.kind == 'f' else np.result_type(values.dtype, np.float32)
+    mask = values == nodata[0]
+    for d in nodata[1:]:
+        mask |= values == d
+    if hasattr(values, 'dask'):
+        import dask.array as da
+        return da.where(mask, np.nan, values.astype(dtype))
+    values = values.astype(dtype)
+    values[mask] = np.nan
+    return values
+
+
+def _overview_factors(da):
+    """Returns the overview decimation factors of the file a rioxarray
+    DataArray was loaded from.
+    """
+    source = da.encoding.get('source')
+    if not source:
+        return []
+    import rasterio
+    with rasterio.open(source) as src:
+        return src.overviews(1)
+
+
+def select_overview(factors, resolution, extent, width):
+    """Selects the coarsest overview level which still provides at
+    least one pixel per screen pixel.
+
+    Parameters
+    ----------
+    factors : list of int
+      Decimation factors of the available overviews
+    resolution : float
+      Resolution of the full resolution raster
+    extent : float
+      Extent of the current viewport along the same axis
+    width : int
+      Width of the plot in screen pixels
+
+    Returns
+    -------
+    The index of the overview level or None for the full resolution
+    """
+    if not width or not extent:
+        return None
+    level = None
+    for i, factor in enumerate(factors):
+        if abs(extent / (resolution * factor)) >= width:
+            level = i
+    return level
+
+
+def _dynamic_raster(da, crs=None, apply_transform=False, nan_nodata=False, **kwargs):
+    """Returns a DynamicMap which loads the window of the raster
+    intersecting the viewport at the overview level matching the
+    plot resolution.
+    """
+    import rioxarray
+    from holoviews import DynamicMap
+    from holoviews.streams import PlotSize, RangeXY
+
+    factors = _overview_factors(da)
+    source = da.encoding.get('source')
+    xres = abs(da.rio.resolution()[0])
+    x, y = da.rio.x_dim, da.rio.y_dim
+    chunks = {d: c[0] for d, c in da.chunksizes.items()} or None
+    overviews = {}
+
+    def load_window(x_range, y_range, width, height, scale=1):
+        extent = None if x_range is None else x_range[1] - x_range[0]
+        level = select_overview(factors, xres, extent or (da.sizes[x] * xres), width)
+        if level is None or not source:
+            arr = da
+        else:
+            if level not in overviews:
+                overviews[level] = rioxarray.open_rasterio(
+                    source, overview_level=level, chunks=chunks
+                )
+            arr = overviews[level]
+        if x_range is not None and y_range is not None:
+            xs, ys = arr.coords[x].values, arr.coords[y].values
+            x0, x1 = x_range if xs[0] <= xs[-1] else x_range[::-1]
+            y0, y1 = y_range if ys[0] <= ys[-1] else y_range[::-1]
+            arr = arr.sel({x: slice(x0, x1), y: slice(y0, y1)})
+        return from_xarray(arr, crs, apply_transform, nan_nodata, **kwargs)
+
+    return DynamicMap(load_window, streams=[RangeXY(), PlotSize()])
+
+
+def _geoparquet_primary_column(path):
+    """Returns the name of the primary geometry column declared in the
+    GeoParquet metadata of the file, defaulting to 'geometry'.
+    """
+    import json
+
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(path).metadata or {}
+    if b'geo' not in metadata:
+        return 'geometry'
+    return json.loads(metadata[b'geo']).get('primary_column', 'geometry')
+
+
+def from_parquet(path, element=None, bbox=None, columns=None, filters=None,
+                 crs=None, **kwargs):
+    """Returns a Points, Path or Polygons element given the path to a
+    GeoParquet file.
+
+    The bounding box and column selections are pushed down to the
+    parquet reader, skipping row groups which do not intersect the
+    bounding box and columns which were not requested. The geometries
+    are decoded in bulk into a GeoDataFrame which is wrapped using the
+    columnar geopandas interface without constructing per-row
+    geometry dictionaries.
+
+    Parameters
+    ----------
+    path : str or path-like
+      Path to the GeoParquet file or dataset
+    element : Element type, optional
+      Element to return, inferred from the geometry type if not given
+    bbox : tuple, optional
+      Bounding box (x0, y0, x1, y1) to filter the geometries by,
+      expressed in the coordinate system of the file
+    columns : list, optional
+      Subset of non-geometry columns to load (loaded as vdims)
+    filters : list or pyarrow expression, optional
+      Row filters pushed down to the parquet reader
+    crs : Cartopy CRS or EPSG string, optional
+      Overrides CRS inferred from the file
+    **kwargs :
+      Keyword arguments passed to the GeoViews element
+
+    Returns
+    -------
+    element
+        Points, Path or Polygons element
+    """
+    import geopandas as gpd
+
+    geometry = _geoparquet_primary_column(path)
+    if columns is not None:
+        columns = [c for c in columns if c != geometry] + [geometry]
+    read_kwargs = {} if filters is None else {'filters': filters}
+    gdf = gpd.read_parquet(path, columns=columns, bbox=bbox, **read_kwargs)
+
+    if crs is None and gdf.crs is not None:
+        with suppress(Exception):
+            # to_epsg returns None for CRSs without an EPSG code
+            epsg = gdf.crs.to_epsg()
+            if epsg is None:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', r'You will likely lose important projection')
+                    crs = proj_to_cartopy(gdf.crs.to_proj4())
+            else:
+                crs = process_crs(epsg)
+        if crs is None:
+            warn(f'Could not decode projection from crs {gdf.crs.name}, '
+                  'defaulting to PlateCarree.')
+    if crs is not None:
+        kwargs['crs'] = crs
+
+    if element is None:
+        from .element.geo import Path, Points, Polygons
+        geom_types = set(gdf.geom_type.dropna().unique())
+        if geom_types and geom_types <= {'Point', 'MultiPoint'}:
+            element = Points
+        elif geom_types and geom_types <= {'LineString', 'MultiLineString', 'LinearRing'}:
+            element = Path
+        else:
+            element = Polygons
+    if 'vdims' not in kwargs:
+        kwargs['vdims'] = [c for c in gdf.columns if c != gdf.geometry.name]
+    return element(gdf, **kwargs)
+
+
+def _feature_key(feature):
+    """Returns a key uniquely identifying the geometries of a cartopy
+    Feature or None if the feature cannot be cached.
+    """
+    from cartopy.feature import GSHHSFeature, NaturalEarthFeature
+    if isinstance(feature, NaturalEarthFeature):
+        return ('naturalearth', feature.category, feature.name, feature.scale)
+    elif isinstance(feature, GSHHSFeature) and feature._scale[0] != 'a':
+        return ('gshhs', feature._scale[0], tuple(sorted(feature._levels)))
+
+
+def _feature_cache_path(key):
+    if FEATURE_CACHE_DIR is None or not SHAPELY_GE_2_0_0:
+        return None
+    token = hashlib.sha1(repr((cartopy.__version__,)+key).encode('utf-8')).hexdigest()
+    return os.path.join(FEATURE_CACHE_DIR, f'{key[0]}_{token}.npz')
+
+
+def _load_geometries(path):
+    """Loads geometries saved as concatenated WKB with offsets."""
+    with suppress(Exception), np.load(path, allow_pickle=False) as cached:
+        wkb, offsets = cached['wkb'].tobytes(), cached['offsets']
+        return list(shapely.from_wkb([wkb[s:e] for s, e in pairwise(offsets)]))
+
+
+def _save_geometries(path, geoms):
+    """Saves geometries as concatenated WKB with offsets, writing to
+    a temporary file first so concurrent readers never see partial
+    files.
+    """
+    wkb = shapely.to_wkb(np.asarray(geoms, dtype=object))
+    offsets = np.zeros(len(wkb)+1, dtype='int64')
+    np.cumsum([len(b) for b in wkb], out=offsets[1:])
+    buffer = np.frombuffer(b''.join(wkb), dtype='uint8')
+    with suppress(OSError):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, wkb=buffer, offsets=offsets)
+        os.replace(tmp_path, path)
+
+
+def feature_geometries(feature, projection=None):
+    """Returns the geometries of a cartopy Feature, optionally projected
+    to the supplied projection.
+
+    Geometries of Natural Earth and GSHHS features are cached in
+    memory and, if a FEATURE_CACHE_DIR is set, as WKB on disk, keyed
+    by the feature, its scale and the projection, so they only have to
+    be read from the shapefile and projected once.
+
+    Parameters
+    ----------
+    feature : cartopy.feature.Feature
+      Feature to return the geometries of
+    projection : cartopy.crs.Projection, optional
+      Projection to project the geometries to
+
+    Returns
+    -------
+    geoms : list
+      List of shapely geometries
+    """
+    key = _feature_key(feature)
+    if key is not None and projection is not None:
+        key += (projection.proj4_init,)
+    if key in _feature_cache:
+        _feature_cache.move_to_end(key)
+        return _feature_cache[key]
+
+    path = None if key is None else _feature_cache_path(key)
+    geoms = None if path is None or not os.path.isfile(path) else _load_geometries(path)
+    if geoms is None:
+        if projection is None:
+            geoms = [g for g in feature.geometries() if g is not None]
+        else:
+            geoms = _project_feature_geometries(feature, projection)
+        if path is not None:
+            _save_geometries(path, geoms)
+    if key is not None:
+        _cache_feature(_feature_cache, key, geoms)
+    return geoms
+
+
+def _cache_feature(cache, key, value):
+    """Stores a value in a feature cache evicting the least recently
+    used entries beyond the FEATURE_CACHE_SIZE.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > FEATURE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _project_feature_geometries(feature, projection):
+    from .element import Path, Polygons
+    from .operation import project_path
+
+    geoms = feature_geometries(feature)
+    if not geoms:
+        return geoms
+    el_type = Path if isinstance(geoms[0], line_types) else Polygons
+    element = el_type([{'geometry': g} for g in geoms], crs=feature.crs)
+    projected = project_path(element, projection=projection)
+    return [g['geometry'] for g in unpack_geoms(projected)]
+
+
+def feature_index(feature):
+    """Returns a spatial index over the geometries of a cartopy Feature.
+
+    The STRtree and the total bounds of the geometries are cached per
+    feature and scale, so bounded queries and range lookups do not
+    have to iterate over every geometry.
+
+    Parameters
+    ----------
+    feature : cartopy.feature.Feature
+      Feature to return the spatial index of
+
+    Returns
+    -------
+    index : tuple or None
+      Tuple of the STRtree and the total bounds (x0, y0, x1, y1) or
+      None if the feature geometries cannot be cached
+    """
+    key = _feature_key(feature)
+    if key is None or not SHAPELY_GE_2_0_0:
+        return None
+    if key in _feature_index_cache:
+        _feature_index_cache.move_to_end(key)
+        return _feature_index_cache[key]
+    geoms = _as_geom_array(feature_geometries(feature))
+    bounds = tuple(shapely.total_bounds(geoms)) if len(geoms) else (np.nan,)*4
+    index = (shapely.STRtree(geoms), bounds)
+    _cache_feature(_feature_index_cache, key, index)
+    return index
+
+
 def get_tile_rgb(tile_source, bbox, zoom_level, bbox_crs=None):
     """Returns an RGB element given a tile_source, bounding box and zoom level.
 
@@ -777,12 +1543,19 @@ def asarray(v):
         return np.asarray(v, dtype=object)
 
 
-def transform_shapely(geom, crs_from, crs_to):
+@lru_cache(maxsize=64)
+def _transformer(crs_from, crs_to):
     from pyproj import Transformer
 
+    return Transformer.from_crs(crs_from, crs_to)
+
+
+def transform_shapely(geom, crs_from, crs_to):
     if isinstance(crs_to, str):
         crs_to = ccrs.CRS(crs_to)
     if isinstance(crs_from, str):
         crs_from = ccrs.CRS(crs_from)
-    project = Transformer.from_crs(crs_from, crs_to).transform
-    return transform(project, geom)
+    project = _transformer(crs_from, crs_to).transform
+    if not SHAPELY_GE_2_0_0:
+        return transform(project, geom)
+    return shapely.transform(geom, lambda coords: np.column_stack(project(coords[:, 0], coords[:, 1])))
@@ -0,0 +1,31 @@
+"""Micro-benchmark for the construction of many small geo elements.
+
+Usage: python scripts/benchmark_elements.py [number of elements]
+"""
+import sys
+import time
+
+import cartopy.crs as ccrs
+import numpy as np
+from shapely.geometry import box
+
+import geoviews as gv
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+
+def bench(name, fn):
+    start = time.perf_counter()
+    for i in range(N):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed:8.2f}s {elapsed / N * 1e6:8.1f}us/element")
+
+
+coords = np.random.default_rng(0).random((5, 2))
+crs = ccrs.PlateCarree()
+
+bench("Points", lambda i: gv.Points(coords))
+bench("Points (explicit crs)", lambda i: gv.Points(coords, crs=crs))
+bench("Shape", lambda i: gv.Shape(box(i, 0, i+1, 1)))
+bench("Shape (explicit crs)", lambda i: gv.Shape(box(i, 0, i+1, 1), crs=crs))